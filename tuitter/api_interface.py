@@ -1,22 +1,117 @@
 from datetime import datetime, timedelta, timezone
+import base64
 import json
 import os
 import random
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Iterable
-from dataclasses import dataclass, fields as dataclass_fields
+from typing import List, Optional, Dict, Any, Iterable, Callable, Union
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields as dataclass_fields
+import functools
 import logging
 import sys
+import threading
+import time
 
 import keyring
 import requests
-from dotenv import load_dotenv
 from requests import Session
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 from .auth_storage import load_tokens, save_tokens_full, get_username
 from .auth import refresh_tokens
 
+# orjson is an optional speedup (bytes in/out, much faster on large list
+# responses). Fall back to a thin stdlib shim with the same surface.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional extra
+    class orjson:  # type: ignore[no-redef]
+        JSONDecodeError = json.JSONDecodeError
+
+        @staticmethod
+        def loads(data):
+            return json.loads(data)
+
+        @staticmethod
+        def dumps(obj) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared pool for fanning out independent reads (see RealAPI.fetch_many).
+# requests.Session is safe to share across these threads; the adapter pool
+# is sized well above max_workers.
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tuitter-api")
+
+# ciso8601 is a C RFC-3339 parser (~10x faster than fromisoformat) and
+# understands a trailing Z natively. Optional, like orjson.
+try:
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:  # pragma: no cover - depends on optional extra
+    _ciso_parse = None
+
+
+def _fromiso(raw: str) -> datetime:
+    """Parse an ISO-8601 string, returning an aware datetime when it has an offset."""
+    if _ciso_parse is not None:
+        return _ciso_parse(raw)
+    if raw[-1:] == "Z":
+        raw = raw[:-1] + "+00:00"
+    return datetime.fromisoformat(raw)
+
+
+_TRUTHY = frozenset(("true", "1", "yes"))
+
+# Statuses that trigger a session restore + single replay in RealAPI
+_AUTH_FAILURE_STATUSES = frozenset((400, 401, 403))
+
+# Backend aliases for the per-viewer post flags
+_LIKED_KEYS = ("liked_by_user", "liked")
+_REPOSTED_KEYS = ("reposted_by_user", "reposted")
+
+@functools.lru_cache(maxsize=4096)
+def _local_offset(utc_hour: datetime) -> timedelta:
+    """Local UTC offset in effect at a naive UTC hour.
+
+    Keyed per hour so rows on either side of a DST change each get their own
+    offset, while a page of posts from the same hours shares one astimezone().
+    """
+    return utc_hour.replace(tzinfo=timezone.utc).astimezone().utcoffset() or timedelta(0)
+
+
+def _parse_ts(raw: Any) -> datetime:
+    """Parse a backend ISO-8601 timestamp into a naive local datetime.
+
+    Strings without an explicit offset are assumed to be UTC. Anything that
+    can't be parsed falls back to now().
+    """
+    if isinstance(raw, datetime):
+        return raw
+    if not isinstance(raw, str) or not raw:
+        return datetime.now()
+    try:
+        dt = _fromiso(raw)
+        offset = dt.utcoffset()
+        if offset is not None:
+            dt = dt.replace(tzinfo=None) - offset
+        return dt + _local_offset(dt.replace(minute=0, second=0, microsecond=0))
+    except Exception:
+        return datetime.now()
+
+
+def _jwt_exp(token: Any) -> Optional[float]:
+    """Return the exp claim of a JWT, or None for opaque/undecodable tokens."""
+    try:
+        parts = token.split('.')
+        if len(parts) != 3:
+            return None
+        pad = 4 - len(parts[1]) % 4
+        return json.loads(base64.urlsafe_b64decode(parts[1] + '=' * pad)).get('exp', None)
+    except Exception:
+        return None
+
+
 def _user_from_dict(data: dict) -> "User":
     """Construct a User, silently dropping any keys the dataclass doesn't know."""
     allowed = {f.name for f in dataclass_fields(User)}
@@ -27,31 +122,73 @@ from .data_models import Notification
 
 serviceKeyring = "tuitter"
 
-load_dotenv(override=True)
 
-# Make sure keyring service has default values. Prefer canonical store.
-try:
-    if not get_username():
-        try:
-            keyring.set_password(serviceKeyring, "username", "")
-        except Exception:
-            pass
-except Exception:
-    # Fallback: try direct keyring lookup if auth_storage import failed or errored
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once (override=True); later calls are free.
+
+    Set TUITTER_LOAD_DOTENV=0 to skip it entirely.
+    """
+    if os.getenv("TUITTER_LOAD_DOTENV", "1") != "1":
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv(override=True)
+
+
+_keyring_inited = False
+
+
+def _ensure_keyring_default() -> None:
+    """Make sure keyring service has default values. Prefer canonical store.
+
+    Keyring access can block (DBus/Keychain), so this runs at most once per
+    process, from the first RealAPI construction (for the module-level
+    ``api`` client, on its first use rather than at import).
+    """
+    global _keyring_inited
+    if _keyring_inited:
+        return
+    _keyring_inited = True
     try:
-        if not keyring.get_password(serviceKeyring, "username"):
+        if not get_username():
             try:
                 keyring.set_password(serviceKeyring, "username", "")
             except Exception:
                 pass
     except Exception:
-        pass
+        # Fallback: try direct keyring lookup if auth_storage import failed or errored
+        try:
+            if not keyring.get_password(serviceKeyring, "username"):
+                try:
+                    keyring.set_password(serviceKeyring, "username", "")
+                except Exception:
+                    pass
+        except Exception:
+            pass
+
+_log = logging.getLogger("tuitter.api")
 
 # File-based debug logger (Textual swallows stdout/stderr in some modes)
 _debug_logfile = Path.home() / ".tuitter_tokens_debug.log"
 _debug_logger = logging.getLogger("tuitter.api.debug")
-# Only enable the file-backed debug logger when TUITTER_DEBUG is explicitly set.
-if os.getenv("TUITTER_DEBUG"):
+# Quiet until _setup_debug_logger() runs: .exception() logs at ERROR, and a
+# logger with no handlers falls back to logging.lastResort (which prints to
+# stderr). Attach a NullHandler so the handler-count is non-zero (suppresses
+# lastResort) and stop propagation.
+_debug_logger.setLevel(logging.WARNING)
+_debug_logger.propagate = False
+if not any(isinstance(h, logging.NullHandler) for h in _debug_logger.handlers):
+    _debug_logger.addHandler(logging.NullHandler())
+
+
+def _setup_debug_logger() -> None:
+    """Enable the file-backed debug logger if TUITTER_DEBUG is set.
+
+    Called after _load_env() so a TUITTER_DEBUG from .env counts too.
+    """
+    if not os.getenv("TUITTER_DEBUG"):
+        return
     if not any(isinstance(h, logging.FileHandler) and getattr(h, "baseFilename", "") == str(_debug_logfile) for h in _debug_logger.handlers):
         try:
             fh = logging.FileHandler(_debug_logfile, encoding="utf-8")
@@ -60,19 +197,11 @@ if os.getenv("TUITTER_DEBUG"):
             _debug_logger.addHandler(fh)
         except Exception:
             # If file logging fails, fall back to normal logging handlers
-            logging.getLogger("tuitter.api").exception("Failed to create debug logfile %s", _debug_logfile)
+            _log.exception("Failed to create debug logfile %s", _debug_logfile)
     _debug_logger.setLevel(logging.DEBUG)
-else:
-    # Ensure debug logger does not emit when TUITTER_DEBUG is not set.
-    # .exception() logs at ERROR, and a logger with no handlers falls back to
-    # logging.lastResort (which prints to stderr). Attach a NullHandler so the
-    # handler-count is non-zero (suppresses lastResort) and stop propagation.
-    _debug_logger.setLevel(logging.WARNING)
-    _debug_logger.propagate = False
-    if not any(isinstance(h, logging.NullHandler) for h in _debug_logger.handlers):
-        _debug_logger.addHandler(logging.NullHandler())
-
-@dataclass
+    _debug_logger.propagate = True
+
+@dataclass(slots=True)
 class User:
     id: int
     handle: str
@@ -87,7 +216,7 @@ class User:
     is_following: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Post:
     id: str
     author: str
@@ -98,10 +227,10 @@ class Post:
     comments: int
     liked_by_user: bool = False
     reposted_by_user: bool = False
-    attachments: List[Dict[str, Any]] = None
+    attachments: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     id: int
     sender: str
@@ -111,7 +240,7 @@ class Message:
     is_read: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     id: int
     participant_handles: List[str]
@@ -120,18 +249,17 @@ class Conversation:
     unread: bool = False
 
 
+@dataclass(slots=True)
 class Comment:
-    def __init__(self, id: int, author: str, content: str, timestamp: datetime,
-                 likes: int = 0, liked_by_user: bool = False):
-        self.id = id
-        self.author = author
-        self.content = content
-        self.timestamp = timestamp
-        self.likes = likes
-        self.liked_by_user = liked_by_user
+    id: int
+    author: str
+    content: str
+    timestamp: datetime
+    likes: int = 0
+    liked_by_user: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSettings:
     # Match backend SettingsResponse schema
     username: Optional[str] = None
@@ -150,7 +278,7 @@ class UserSettings:
 class APIInterface:
     def get_current_user(self) -> User: ...
     def set_handle(self, handle: str) -> None: ...
-    def get_timeline(self, limit: int = 50) -> List[Post]: ...
+    def get_timeline(self, limit: int = 50, offset: int = 0) -> List[Post]: ...
     def get_discover_posts(self, limit: int = 50) -> List[Post]: ...
     def get_conversations(self) -> List[Conversation]: ...
     def get_conversation_messages(self, conversation_id: int) -> List[Message]: ...
@@ -162,7 +290,7 @@ class APIInterface:
     def update_user_settings(self, settings: UserSettings) -> bool: ...
     def get_user_posts(self, handle: str, limit: int = 50) -> List[Post]: ...
     def get_user_comments(self, handle: str, limit: int = 100) -> List[Dict[str, Any]]: ...
-    def create_post(self, content: str) -> bool: ...
+    def create_post(self, content: Union[str, Dict[str, Any]]) -> bool: ...
     def like_post(self, post_id: int) -> bool: ...
     def unlike_post(self, post_id: int) -> bool: ...
     def repost(self, post_id: int) -> bool: ...
@@ -180,6 +308,34 @@ class APIInterface:
     def get_followers(self, handle: str) -> List['User']: ...
     def get_following(self, handle: str) -> List['User']: ...
     def get_following_feed(self, limit: int = 50) -> List[Post]: ...
+    def fetch_many(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]: ...
+    def refresh_all(self) -> Dict[str, Any]: ...
+
+
+# Statuses on which a POST is replayed: the server did not process it.
+# Other 5xx may arrive after a committed write (post, comment, message),
+# and replaying those would duplicate it.
+_POST_RETRY_STATUSES = frozenset((429, 503))
+
+
+class _JitterRetry(Retry):
+    """Retry with exponential backoff plus random jitter.
+
+    Spreads out retries from several concurrent UI requests so they don't
+    hit a recovering backend in lockstep. 401s are not in the forcelist and
+    still go through try_restore_session() in _request.
+    """
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return 0
+        return backoff + random.uniform(0, self.backoff_factor)
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method and method.upper() == "POST" and status_code not in _POST_RETRY_STATUSES:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
 
 
 class RealAPI(APIInterface):
@@ -189,32 +345,81 @@ class RealAPI(APIInterface):
     token-based auth via BACKEND_TOKEN env var.
     """
     def __init__(self, base_url: str, token: str | None = None, timeout: float = 10.0, handle: str = "yourname"):
+        _ensure_keyring_default()
         self.base_url = base_url.rstrip("/")
+        self._url_prefix = self.base_url + "/"
         self.timeout = timeout
         self.handle = handle
         self.session: Session = requests.Session()
+        # Bound session methods keyed by (upper-case) verb for _request dispatch
+        self._verb_map = {
+            "GET": self.session.get,
+            "POST": self.session.post,
+            "PATCH": self.session.patch,
+            "DELETE": self.session.delete,
+        }
         # Mount a retrying HTTP adapter to handle transient network errors / timeouts
         try:
-            retries = Retry(
+            retries = _JitterRetry(
                 total=3,
-                backoff_factor=0.5,
-                status_forcelist=[429, 502, 503, 504],
-                allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "PUT", "DELETE"],
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(
+                    ["HEAD", "GET", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"]
+                ),
+                respect_retry_after_header=True,
+                # Hand the last 5xx back so _request's raise_for_status()
+                # raises HTTPError (callers fall back on it) not RetryError
+                raise_on_status=False,
+            )
+            # Larger pool so bursts of UI requests (timeline, notifications,
+            # conversations) reuse kept-alive connections instead of re-doing TLS.
+            adapter = HTTPAdapter(
+                max_retries=retries,
+                pool_connections=32,
+                pool_maxsize=32,
+                pool_block=False,
             )
-            adapter = HTTPAdapter(max_retries=retries)
             self.session.mount("https://", adapter)
             self.session.mount("http://", adapter)
         except Exception:
             # If urllib3 isn't available for some reason, continue with a plain session
             pass
+        self.session.headers.update({
+            "Connection": "keep-alive",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/json",
+        })
+        # Single-flight state for try_restore_session()
+        self._refresh_lock = threading.RLock()
+        self._refresh_gen = 0  # Completed try_restore_session() attempts
+        self._last_refresh_result = False
         # Track the currently-set bearer token (explicitly initialize)
+        self._auth_header_key = "Authorization"
         self.token: str | None = None
+        self._token_kind = ""
+        self._token_preview = ""
+        self._token_exp: Optional[float] = None
         if token:
             try:
                 self.set_token(token)
             except Exception:
                 pass
 
+    @property
+    def handle(self) -> str:
+        return self._handle
+
+    @handle.setter
+    def handle(self, value: str) -> None:
+        # The UI assigns api.handle directly in several places; keep the
+        # shared default query params in sync so _request needn't rebuild them.
+        self._handle = value
+        self._base_params = {"handle": value}
+
+    def set_handle(self, handle: str) -> None:
+        self.handle = handle
+
     # --- version check ---
     def check_client_version(self) -> tuple[bool, str]:
         """Check if this client version meets the server's minimum requirement.
@@ -242,7 +447,7 @@ class RealAPI(APIInterface):
         try:
             resp = self.session.get(f"{self.base_url}/version", timeout=5)
             if resp.ok:
-                data = resp.json()
+                data = orjson.loads(resp.content)
                 min_ver = data.get("min_client_version", "")
                 if min_ver:
                     def parse_ver(v: str):
@@ -259,135 +464,159 @@ class RealAPI(APIInterface):
     # --- helpers ---
     def set_token(self, token: str) -> None:
         # Record token and update session header. Log a short preview (not the full token).
-        logger = logging.getLogger("tuitter.api")
         self.token = token
-        self.session.headers.update({"Authorization": f"Bearer {self.token}"})
+        self.session.headers[self._auth_header_key] = f"Bearer {token}"
+        # Decode the expiry once here rather than on every request
+        self._token_exp = _jwt_exp(token)
         try:
-            kind = "jwt" if isinstance(token, str) and token.count('.') == 2 else "opaque"
-            preview = (token[:10] + "...") if isinstance(token, str) and len(token) > 10 else token
-            logger.info("Set API token type=%s preview=%s", kind, preview)
+            self._token_kind = "jwt" if isinstance(token, str) and token.count('.') == 2 else "opaque"
+            self._token_preview = (token[:10] + "...") if isinstance(token, str) and len(token) > 10 else token
+            _log.info("Set API token type=%s preview=%s", self._token_kind, self._token_preview)
         except Exception:
-            logger.debug("Set API token (unable to preview)")
-
-    def _get(self, path: str, params: Dict[str, Any] | None = None) -> Any:
-        return self._request("GET", path, params=params)
-
-    def _post(self, path: str, json_payload: Dict[str, Any] | None = None, params: Dict[str, Any] | None = None) -> Any:
-        return self._request("POST", path, params=params, json_payload=json_payload)
+            _log.debug("Set API token (unable to preview)")
+
+    # Verb-specific fast paths. These inline the common 2xx case; auth
+    # failures fall through to _recover_auth and exotic verbs use _request.
+    def _get_json(self, path: str, params: Dict[str, Any] | None = None) -> Any:
+        url = self._url_prefix + path.lstrip("/")
+        p = self._base_params if params is None else {**self._base_params, **params}
+        self._refresh_if_expired("GET", path)
+        resp = self.session.get(url, params=p, timeout=self.timeout)
+        if resp.status_code in _AUTH_FAILURE_STATUSES:
+            return self._recover_auth(resp, "GET", path, params, None)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    def _post_json(self, path: str, json_payload: Dict[str, Any] | None = None, params: Dict[str, Any] | None = None) -> Any:
+        url = self._url_prefix + path.lstrip("/")
+        p = self._base_params if params is None else {**self._base_params, **params}
+        self._refresh_if_expired("POST", path)
+        if json_payload is None:
+            resp = self.session.post(url, params=p, timeout=self.timeout)
+        else:
+            resp = self.session.post(url, params=p, data=orjson.dumps(json_payload), headers=_JSON_HEADERS, timeout=self.timeout)
+        if resp.status_code in _AUTH_FAILURE_STATUSES:
+            return self._recover_auth(resp, "POST", path, params, json_payload)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    def _patch_json(self, path: str, json_payload: Dict[str, Any] | None = None, params: Dict[str, Any] | None = None) -> Any:
+        url = self._url_prefix + path.lstrip("/")
+        p = self._base_params if params is None else {**self._base_params, **params}
+        self._refresh_if_expired("PATCH", path)
+        if json_payload is None:
+            resp = self.session.patch(url, params=p, timeout=self.timeout)
+        else:
+            resp = self.session.patch(url, params=p, data=orjson.dumps(json_payload), headers=_JSON_HEADERS, timeout=self.timeout)
+        if resp.status_code in _AUTH_FAILURE_STATUSES:
+            return self._recover_auth(resp, "PATCH", path, params, json_payload)
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
-    def _patch(self, path: str, json_payload: Dict[str, Any] | None = None, params: Dict[str, Any] | None = None) -> Any:
-        return self._request("PATCH", path, params=params, json_payload=json_payload)
+    _get = _get_json
+    _post = _post_json
+    _patch = _patch_json
 
     def _delete(self, path: str, params: Dict[str, Any] | None = None) -> Any:
         return self._request("DELETE", path, params=params)
 
-    def _request(self, method: str, path: str, params: Dict[str, Any] | None = None, json_payload: Dict[str, Any] | None = None, retry: bool = True) -> Any:
-        """Internal request helper that will attempt a single refresh+retry on 401.
+    def _refresh_if_expired(self, method: str, path: str) -> None:
+        """Proactively refresh if the stored JWT is already expired locally.
 
-        - method: "GET" or "POST"
-        - retry: if True the helper will attempt refresh and one retry on 401
+        This avoids burning a full Lambda cold-start round-trip just to get a 401 back.
         """
-        logger = logging.getLogger("tuitter.api")
-        if params is None:
-            params = {}
-        params.setdefault("handle", self.handle)
-        url = f"{self.base_url}/{path.lstrip('/')}"
-
-        # Proactively refresh if the stored JWT is already expired locally.
-        # This avoids burning a full Lambda cold-start round-trip just to get a 401 back.
-        if retry and self.token:
+        exp = self._token_exp
+        if exp is not None and time.time() > exp:
+            _log.info("_request: token expired locally, refreshing before sending %s %s", method, path)
             try:
-                import base64 as _b64, json as _j, time as _t
-                _parts = self.token.split('.')
-                if len(_parts) == 3:
-                    _pad = 4 - len(_parts[1]) % 4
-                    _exp = _j.loads(_b64.urlsafe_b64decode(_parts[1] + '=' * _pad)).get('exp', None)
-                    if _exp is not None and _t.time() > _exp:
-                        logger.info("_request: token expired locally, refreshing before sending %s %s", method, path)
-                        if hasattr(self, 'try_restore_session'):
-                            self.try_restore_session()
+                self.try_restore_session()
             except Exception:
                 pass
 
+    def _recover_auth(self, resp, method: str, path: str, params: Dict[str, Any] | None, json_payload: Dict[str, Any] | None) -> Any:
+        """Handle a 400/401/403: try centralized restore once and replay the request."""
+        _log.info(
+            "API auth-failure %s received for %s %s - attempting try_restore_session()",
+            resp.status_code,
+            method,
+            path,
+        )
+        restored = False
         try:
-            m = method.upper()
-            if m == "GET":
-                resp = self.session.get(url, params=params, timeout=self.timeout)
-            elif m == "POST":
-                resp = self.session.post(url, params=params, json=json_payload, timeout=self.timeout)
-            elif m == "PATCH":
-                resp = self.session.patch(url, params=params, json=json_payload, timeout=self.timeout)
-            else:
-                # Fallback to requests.request for other verbs
-                resp = self.session.request(m, url, params=params, json=json_payload, timeout=self.timeout)
-
-            # If we received an auth-related response (400/401/403), try centralized restore once
-            if resp.status_code in (400, 401, 403) and retry:
-                logger.info(
-                    "API auth-failure %s received for %s %s - attempting try_restore_session()",
-                    resp.status_code,
-                    method,
-                    path,
-                )
-                try:
-                    restored = False
-                    if hasattr(self, "try_restore_session"):
-                        restored = self.try_restore_session()
-                    if restored:
-                        logger.info("try_restore_session succeeded; retrying original request")
-                        if m == "GET":
-                            resp = self.session.get(url, params=params, timeout=self.timeout)
-                        elif m == "POST":
-                            resp = self.session.post(url, params=params, json=json_payload, timeout=self.timeout)
-                        elif m == "PATCH":
-                            resp = self.session.patch(url, params=params, json=json_payload, timeout=self.timeout)
-                        else:
-                            resp = self.session.request(m, url, params=params, json=json_payload, timeout=self.timeout)
-                    else:
-                        logger.debug("try_restore_session returned False; not retrying")
-                except Exception:
-                    logger.exception("Refresh attempt failed (non-fatal) while handling initial auth failure")
+            restored = self.try_restore_session()
+        except Exception:
+            _log.exception("Refresh attempt failed (non-fatal) while handling auth failure")
+        if restored:
+            _log.info("try_restore_session succeeded; retrying original request")
+            return self._request(method, path, params=params, json_payload=json_payload, retry=False)
+        _log.debug("try_restore_session returned False; not retrying")
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
 
-            resp.raise_for_status()
-            return resp.json()
+    def _request(self, method: str, path: str, params: Dict[str, Any] | None = None, json_payload: Dict[str, Any] | None = None, retry: bool = True) -> Any:
+        """Generic request helper that will attempt a single refresh+retry on 401.
 
-        except requests.HTTPError as e:
-            status = None
-            try:
-                status = e.response.status_code if e.response is not None else None
-            except Exception:
-                pass
+        Used for DELETE/other verbs and for the no-retry replay after an auth
+        restore; GET/POST/PATCH normally go through the _*_json fast paths.
 
-            # If we got an auth-related HTTP error (400/401/403) and haven't retried yet, try centralized restore and retry once
-            if status in (400, 401, 403) and retry:
-                logger.info(
-                    "HTTPError %s; attempting try_restore_session() and retry for %s %s",
-                    status,
-                    method,
-                    path,
-                )
-                try:
-                    if hasattr(self, "try_restore_session") and self.try_restore_session():
-                        logger.info("try_restore_session succeeded from exception path; retrying (no further retry allowed)")
-                        return self._request(method, path, params=params, json_payload=json_payload, retry=False)
-                    logger.debug("try_restore_session did not restore session from exception path")
-                except Exception:
-                    logger.exception("Refresh attempt failed (non-fatal) while handling auth error (exception path)")
+        - method: upper-case HTTP verb ("GET", "POST", "PATCH", "DELETE")
+        - retry: if True the helper will attempt refresh and one retry on 401
+        """
+        url = self._url_prefix + path.lstrip("/")
+        merged = self._base_params if params is None else {**self._base_params, **params}
+        if retry:
+            self._refresh_if_expired(method, path)
+
+        # Serialize the body once with orjson
+        body = orjson.dumps(json_payload) if json_payload is not None else None
+        headers = _JSON_HEADERS if body is not None else None
+        send = self._verb_map.get(method)
+        if send is None:
+            # Fallback to requests.request for other verbs
+            resp = self.session.request(method, url, params=merged, data=body, headers=headers, timeout=self.timeout)
+        else:
+            resp = send(url, params=merged, data=body, headers=headers, timeout=self.timeout)
+
+        if retry and resp.status_code in _AUTH_FAILURE_STATUSES:
+            return self._recover_auth(resp, method, path, params, json_payload)
+
+        resp.raise_for_status()
+        return orjson.loads(resp.content)
+
+    def fetch_many(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """Run independent API calls concurrently and return results by key.
 
-            # Re-raise original HTTP error if refresh didn't succeed or cannot be performed
-            raise
+        Each value in ``calls`` is a zero-arg callable (e.g. ``self.get_timeline``).
+        The first exception raised by any call is re-raised here.
+        """
+        futures = {key: _executor.submit(fn) for key, fn in calls.items()}
+        return {key: fut.result() for key, fut in futures.items()}
+
+    def refresh_all(self) -> Dict[str, Any]:
+        """Fetch timeline, notifications, conversations and the current user in parallel."""
+        return self.fetch_many({
+            "timeline": self.get_timeline,
+            "notifications": self.get_notifications,
+            "conversations": self.get_conversations,
+            "current_user": self.get_current_user,
+        })
 
     def get_current_user(self) -> User:
         data = self._get("/me")
         return _user_from_dict(data)
 
-    def get_timeline(self, limit: int = 50) -> List[Post]:
-        data = self._get("/timeline", params={"limit": limit})
-        return [Post(**self._convert_post(p)) for p in data]
+    def get_timeline(self, limit: int = 50, offset: int = 0) -> List[Post]:
+        params = {"limit": limit}
+        if offset:
+            params["offset"] = offset
+        data = self._get("/timeline", params=params)
+        mk = self._make_post
+        return [mk(p) for p in data]
 
     def get_discover_posts(self, limit: int = 50) -> List[Post]:
         data = self._get("/discover", params={"limit": limit})
-        return [Post(**self._convert_post(p)) for p in data]
+        mk = self._make_post
+        return [mk(p) for p in data]
 
     def get_conversations(self) -> List[Conversation]:
         data = self._get("/conversations")
@@ -395,7 +624,8 @@ class RealAPI(APIInterface):
 
     def get_conversation_messages(self, conversation_id: int) -> List[Message]:
         data = self._get(f"/conversations/{conversation_id}/messages")
-        return [self._convert_message(m) for m in data]
+        mk = self._make_message
+        return [mk(m) for m in data]
 
     def send_message(self, conversation_id: int, content: str) -> Message:
         # Backend expects sender_handle in the request body
@@ -403,7 +633,7 @@ class RealAPI(APIInterface):
             f"/conversations/{conversation_id}/messages",
             json_payload={"content": content, "sender_handle": self.handle},
         )
-        return self._convert_message(data)
+        return self._make_message(data)
 
     def get_or_create_dm(self, other_user_handle: str) -> Conversation:
         """Get or create a direct message conversation with another user"""
@@ -421,25 +651,29 @@ class RealAPI(APIInterface):
         params = {"unread": "true"} if unread_only else {}
         data = self._get("/notifications", params=params)
         result = []
+        append = result.append
         for n in data:
             try:
-                raw_ts = n.get("created_at") or n.get("timestamp")
+                get = n.get
+                raw_ts = get("created_at") or get("timestamp")
                 if isinstance(raw_ts, str):
-                    raw_ts = raw_ts.replace("Z", "+00:00")
-                    ts = datetime.fromisoformat(raw_ts)
+                    ts = _fromiso(raw_ts)
                 elif isinstance(raw_ts, datetime):
                     ts = raw_ts
                 else:
                     ts = datetime.min
-                result.append(Notification(
-                    id=n.get("id"),
-                    type=n.get("type", ""),
-                    actor=n.get("actor", ""),
-                    username=n.get("username", n.get("actor", "")),
-                    content=n.get("content", ""),
-                    timestamp=ts,
-                    read=n.get("read", False),
-                    related_post=n.get("post_id") or n.get("related_post"),
+                actor = get("actor", "")
+                # Positional in Notification field order: id, type, actor,
+                # username, content, timestamp, read, related_post
+                append(Notification(
+                    get("id"),
+                    get("type", ""),
+                    actor,
+                    get("username", actor),
+                    get("content", ""),
+                    ts,
+                    get("read", False),
+                    get("post_id") or get("related_post"),
                 ))
             except Exception:
                 pass
@@ -469,17 +703,20 @@ class RealAPI(APIInterface):
 
     def update_user_settings(self, settings: UserSettings) -> bool:
         # Use PATCH for partial updates. Only send fields that are not None
-        try:
-            payload = {k: v for k, v in settings.__dict__.items() if v is not None}
-        except Exception:
-            payload = settings.__dict__
+        # Slotted dataclass: read fields explicitly (there is no __dict__)
+        payload = {}
+        for f in dataclass_fields(settings):
+            v = getattr(settings, f.name)
+            if v is not None:
+                payload[f.name] = v
         self._patch("/settings", json_payload=payload)
         return True
 
     def get_user_posts(self, handle: str, limit: int = 50) -> List[Post]:
         data = self._get("/posts", params={"handle": handle, "limit": limit})
         # Expect list of post dicts
-        return [Post(**self._convert_post(p)) for p in data]
+        mk = self._make_post
+        return [mk(p) for p in data]
 
     def get_user_comments(self, handle: str, limit: int = 100) -> List[Dict[str, Any]]:
         data = self._get("/comments", params={"handle": handle, "limit": limit})
@@ -528,17 +765,24 @@ class RealAPI(APIInterface):
     def get_following_feed(self, limit: int = 50) -> List[Post]:
         """Get posts from followed users."""
         data = self._get("/timeline/following", params={"handle": self.handle, "limit": limit})
-        return [Post(**self._convert_post(p)) for p in data]
-
-    def create_post(self, content: str) -> Post:
-        # Check if content is JSON string containing attachments
-        try:
-            post_data = json.loads(content)
-            data = self._post("/posts", json_payload=post_data)
-        except json.JSONDecodeError:
+        mk = self._make_post
+        return [mk(p) for p in data]
+
+    def create_post(self, content: Union[str, Dict[str, Any]]) -> Post:
+        # Callers with attachments pass the payload dict directly; a JSON
+        # string is still accepted. Only try to parse when it looks like JSON
+        # so plain text posts skip the exception path.
+        post_data = content if isinstance(content, dict) else None
+        if post_data is None and content.lstrip()[:1] in ("{", "["):
+            try:
+                post_data = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                post_data = None
+        if post_data is None:
             # If not JSON, treat as simple text post
-            data = self._post("/posts", json_payload={"content": content})
-        return Post(**self._convert_post(data))
+            post_data = {"content": content}
+        data = self._post("/posts", json_payload=post_data)
+        return self._make_post(data)
 
     def upload_image(self, file_path: str) -> str:
         """Upload an image file to R2 via the backend and return the public URL."""
@@ -554,7 +798,7 @@ class RealAPI(APIInterface):
                 timeout=60,
             )
         resp.raise_for_status()
-        return resp.json()["url"]
+        return orjson.loads(resp.content)["url"]
 
     def like_post(self, post_id: int) -> bool:
         self._post(f"/posts/{post_id}/like")
@@ -613,126 +857,61 @@ class RealAPI(APIInterface):
         return True
 
     # --- conversion helpers ---
-    def _convert_post(self, p: Dict[str, Any]) -> Dict[str, Any]:
-        # Ensure fields match Post dataclass naming
-        # Normalize timestamp into a datetime object (local naive)
+    def _make_post(self, p: Dict[str, Any]) -> Post:
+        """Build a Post straight from a backend post dict."""
         ts_raw = p.get("timestamp")
-        timestamp = None
-        try:
-            if isinstance(ts_raw, datetime):
-                timestamp = ts_raw
-            elif isinstance(ts_raw, str):
-                # If the string contains an explicit timezone (Z or ±HH:MM), parse
-                # it as an aware datetime. If it lacks timezone info, assume the
-                # server returned UTC (common for ISO timestamps without a suffix)
-                # and convert to local time.
-                try:
-                    s = ts_raw
-                    has_tz = s.endswith("Z") or ("+" in s[10:] or "-" in s[10:])
-                    if has_tz:
-                        # Normalize trailing Z to +00:00 then parse as aware
-                        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-                    else:
-                        # No timezone info: treat as UTC
-                        dt = datetime.fromisoformat(s)
-                        dt = dt.replace(tzinfo=timezone.utc)
-
-                    # Convert to local timezone and return naive local datetime
-                    timestamp = dt.astimezone().replace(tzinfo=None)
-                except Exception:
-                    # Last-resort parse: use now
-                    timestamp = datetime.now()
-            else:
-                timestamp = datetime.now()
-        except Exception:
-            timestamp = datetime.now()
+        timestamp = _parse_ts(ts_raw)
 
-        try:
-            logging.getLogger("tuitter.api").debug(
-                "_convert_post: raw timestamp=%r parsed=%r for post id=%s",
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "_make_post: raw timestamp=%r parsed=%r for post id=%s",
                 ts_raw,
                 timestamp,
                 p.get("id"),
             )
-        except Exception:
-            pass
 
-        out = dict(
-            id=str(p.get("id")),
-            author=p.get("author") or p.get("username") or p.get("user"),
-            content=p.get("content") or p.get("text") or "",
-            timestamp=timestamp,
-            likes=int(p.get("likes") or 0),
-            reposts=int(p.get("reposts") or 0),
-            comments=int(p.get("comments") or 0),
-            liked_by_user=bool(p.get("liked_by_user") or p.get("liked") or False),
-            reposted_by_user=bool(
-                p.get("reposted_by_user") or p.get("reposted") or False
-            ),
-            attachments=p.get("attachments", [])  # Add attachments to the post object
+        get = p.get
+        _int = int
+        return Post(
+            str(get("id")),
+            get("author") or get("username") or get("user"),
+            get("content") or get("text") or "",
+            timestamp,
+            _int(get("likes") or 0),
+            _int(get("reposts") or 0),
+            _int(get("comments") or 0),
+            # any(map(...)) walks the alias keys in C and yields a bool directly
+            any(map(get, _LIKED_KEYS)),
+            any(map(get, _REPOSTED_KEYS)),
+            get("attachments", []),
         )
-        return out
 
     def _convert_conversation(self, c: Dict[str, Any]) -> Conversation:
         """Convert backend conversation response to Conversation dataclass"""
         # Backend uses 'created_at' but we need 'last_message_at'
-        last_message_at_value = c.get("last_message_at") or c.get("created_at")
+        get = c.get
+        last_at = get("last_message_at") or get("created_at")
+        unread = get("unread")
 
         return Conversation(
-            id=int(c.get("id", 0)),
-            participant_handles=c.get("participant_handles") or [],
-            last_message_preview=c.get("last_message_preview") or "",
-            last_message_at=last_message_at_value
-            if isinstance(last_message_at_value, datetime)
-            else datetime.fromisoformat(last_message_at_value)
-            if last_message_at_value
-            else datetime.now(),
+            id=int(get("id", 0)),
+            participant_handles=get("participant_handles") or [],
+            last_message_preview=get("last_message_preview") or "",
+            last_message_at=_parse_ts(last_at) if last_at else datetime.now(),
             # Normalize 'unread' which may be boolean, numeric or string
-            unread=(
-                (c.get("unread") is True)
-                if isinstance(c.get("unread"), bool)
-                else (str(c.get("unread")).lower() in ("true", "1", "yes"))
-            ),
+            unread=unread if isinstance(unread, bool) else (str(unread).lower() in _TRUTHY),
         )
 
-    def _convert_message(self, m: Dict[str, Any]) -> Message:
-        """Convert backend message response to Message dataclass"""
-        # Normalize timestamp into a local naive datetime using same rules as posts
-        ts_raw = m.get("timestamp") or m.get("created_at")
-
-        created_at = None
-        try:
-            if isinstance(ts_raw, datetime):
-                created_at = ts_raw
-            elif isinstance(ts_raw, str):
-                try:
-                    s = ts_raw
-                    # If the string contains an explicit timezone (Z or ±HH:MM), parse
-                    # it as an aware datetime. If it lacks timezone info, assume the
-                    # server returned UTC and convert to local time.
-                    has_tz = s.endswith("Z") or ("+" in s[10:] or "-" in s[10:])
-                    if has_tz:
-                        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-                    else:
-                        dt = datetime.fromisoformat(s)
-                        dt = dt.replace(tzinfo=timezone.utc)
-
-                    # Convert to local timezone and return naive local datetime
-                    created_at = dt.astimezone().replace(tzinfo=None)
-                except Exception:
-                    created_at = datetime.now()
-            else:
-                created_at = datetime.now()
-        except Exception:
-            created_at = datetime.now()
-
+    def _make_message(self, m: Dict[str, Any]) -> Message:
+        """Build a Message straight from a backend message dict."""
+        get = m.get
         return Message(
-            id=int(m.get("id", 0)),
-            sender=m.get("sender") or m.get("sender_handle") or self.handle,
-            sender_handle=m.get("sender_handle") or m.get("sender") or self.handle,
-            content=m.get("content") or "",
-            created_at=created_at,
-            is_read=bool(m.get("is_read") or False),
+            int(get("id", 0)),
+            get("sender") or get("sender_handle") or self.handle,
+            get("sender_handle") or get("sender") or self.handle,
+            get("content") or "",
+            _parse_ts(get("timestamp") or get("created_at")),
+            bool(get("is_read") or False),
         )
 
     def try_restore_session(self) -> bool:
@@ -742,8 +921,23 @@ class RealAPI(APIInterface):
         will attempt a refresh if only a refresh token is present. On success
         the API token and handle are set and True is returned. Otherwise
         False is returned.
+
+        Concurrent callers (e.g. several requests hitting 401 at once after
+        expiry) are serialized. Callers that were waiting on the lock while an
+        attempt ran share its result, so a burst triggers a single refresh
+        round-trip; a later call always makes a fresh attempt.
         """
-        logger = logging.getLogger("tuitter.api")
+        gen = self._refresh_gen
+        with self._refresh_lock:
+            if self._refresh_gen != gen:
+                _debug_logger.debug("try_restore_session: reusing concurrent result=%s", self._last_refresh_result)
+                return self._last_refresh_result
+            result = self._try_restore_session()
+            self._last_refresh_result = result
+            self._refresh_gen += 1
+            return result
+
+    def _try_restore_session(self) -> bool:
         _debug_logger.debug("try_restore_session: called")
         try:
             # Use auth_storage directly so we can see both full tokens and a
@@ -773,7 +967,8 @@ class RealAPI(APIInterface):
                 access = tokens.get('access_token')
                 refresh = tokens.get('refresh_token') or found.get('refresh_token')
 
-                _debug_logger.debug("try_restore_session: found tokens keys=%s username=%s", list(tokens.keys()), username)
+                if _debug_logger.isEnabledFor(logging.DEBUG):
+                    _debug_logger.debug("try_restore_session: found tokens keys=%s username=%s", list(tokens.keys()), username)
 
                 if access:
                     try:
@@ -787,20 +982,13 @@ class RealAPI(APIInterface):
                     # Check JWT exp claim locally — if already expired, skip the /me
                     # round-trip (which would just burn 1-2s on a cold Lambda) and go
                     # straight to refresh_tokens().
-                    _token_already_expired = False
-                    try:
-                        import base64 as _b64, json as _j, time as _t
-                        _parts = access.split('.')
-                        if len(_parts) == 3:
-                            _pad = 4 - len(_parts[1]) % 4
-                            _claims = _j.loads(_b64.urlsafe_b64decode(_parts[1] + '=' * _pad))
-                            _token_already_expired = _t.time() > _claims.get('exp', 0)
-                            _debug_logger.debug(
-                                "try_restore_session: token exp=%s now=%s expired=%s",
-                                _claims.get('exp'), int(_t.time()), _token_already_expired,
-                            )
-                    except Exception:
-                        pass
+                    # set_token() above already decoded the exp claim
+                    exp = self._token_exp
+                    _token_already_expired = exp is not None and time.time() > exp
+                    _debug_logger.debug(
+                        "try_restore_session: token exp=%s now=%s expired=%s",
+                        exp, int(time.time()), _token_already_expired,
+                    )
 
                     if _token_already_expired and refresh:
                         _debug_logger.debug("try_restore_session: token locally expired, skipping /me, refreshing immediately")
@@ -899,7 +1087,7 @@ class RealAPI(APIInterface):
             return False
         except Exception as e:
             _debug_logger.exception("try_restore_session failed: %s", e)
-            logging.getLogger("tuitter.api").exception("try_restore_session failed: %s", e)
+            _log.exception("try_restore_session failed: %s", e)
             return False
 
 # Global api selection: prefer BACKEND_URL env, then API_BASE_URL env or package default
@@ -908,18 +1096,52 @@ try:
 except Exception:
     _DEFAULT_API_BASE_URL = None
 
-# Allow overriding backend URL via environment for local development
-_BACKEND_URL = os.getenv("BACKEND_URL") or os.getenv("API_BASE_URL") or _DEFAULT_API_BASE_URL or "https://74o42xhqpk.execute-api.us-east-2.amazonaws.com"
+_api_instance: Optional[RealAPI] = None
+_api_lock = threading.Lock()
 
-# Initialize global `api` client. Prefer the saved username from auth_storage
-# (keyring) when available so requests that rely on `api.handle` use the
-# correct account rather than the literal default "yourname".
-if _BACKEND_URL:
+
+def _build_api() -> RealAPI:
+    """Load .env, then construct the global client from the environment."""
+    _load_env()
+    _setup_debug_logger()
+    # Allow overriding backend URL via environment for local development
+    backend_url = os.getenv("BACKEND_URL") or os.getenv("API_BASE_URL") or _DEFAULT_API_BASE_URL or "https://74o42xhqpk.execute-api.us-east-2.amazonaws.com"
+
+    # Prefer the saved username from auth_storage (keyring) when available so
+    # requests that rely on `api.handle` use the correct account rather than
+    # the literal default "yourname".
+    initial_handle = "None"
     try:
-        # get_username was imported earlier from auth_storage when available
-        initial_handle = "None"
         initial_handle = get_username()
     except Exception:
         pass
+    return RealAPI(base_url=backend_url, handle=initial_handle)
+
+
+def get_api() -> RealAPI:
+    """Return the global client, building it on first call."""
+    global _api_instance
+    if _api_instance is None:
+        with _api_lock:
+            if _api_instance is None:
+                _api_instance = _build_api()
+    return _api_instance
+
+
+class _LazyAPI:
+    """Module-level ``api``: forwards to get_api() on first attribute access.
+
+    Importing this module therefore doesn't read .env or touch the keyring;
+    that happens the first time the UI actually uses the client.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(get_api(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(get_api(), name, value)
+
 
-    api = RealAPI(base_url=_BACKEND_URL, handle=initial_handle)
+api = _LazyAPI()
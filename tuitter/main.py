@@ -12,12 +12,11 @@ from textual.widgets import Static, Input, Button, TextArea, Label, RichLog
 from textual.reactive import reactive
 from textual.screen import ModalScreen, Screen
 from textual.message import Message
-from datetime import datetime
-from .api_interface import api
+from datetime import datetime, timedelta
+from .api_interface import api, orjson, _load_env
 import sys
 import subprocess
 from pathlib import Path
-from PIL import Image
 
 # Tk is optional; used only for native file picker. If unavailable (e.g. Homebrew Python
 # without tk), the app still runs and we show a message when the user tries to pick a file.
@@ -28,18 +27,37 @@ def _get_tk():
         return _tk, _fd
     except Exception:
         return None, None
-from .ascii_video_widget import ASCIIVideoPlayer
-import json
+
+
+_tk_root = None
+
+
+def _get_tk_root(_tk):
+    """Hidden Tk root shared by every file picker.
+
+    Starting a Tk interpreter costs far more than the dialog itself, so the
+    root is created on first use and kept (withdrawn) for the session.
+    """
+    global _tk_root
+    if _tk_root is None:
+        _tk_root = _tk.Tk()
+        _tk_root.withdraw()
+    return _tk_root
 import io
-from typing import List, Dict
+from typing import List, Dict, Optional
 from rich.text import Text
 import asyncio
+import bisect
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
+import re
+import tempfile
+import threading
 import time
+import types
 import webbrowser
-import keyring
-import dotenv
 
 # Cache: maps (url, cols) -> rendered braille art string
 # Avoids re-downloading + re-rendering the same image on every timeline refresh.
@@ -48,10 +66,29 @@ _image_url_cache: Dict[tuple, str] = {}
 from textual import work
 from .ws_client import run_messaging_ws, _default_ws_url
 
-dotenv.load_dotenv()
 
 serviceKeyring = "tuitter"
 
+
+@functools.lru_cache(maxsize=1)
+def _debug_enabled() -> bool:
+    """Auth-flow tracing is only worth formatting when TUITTER_DEBUG is set.
+
+    Read on first use, after .env is loaded, so a TUITTER_DEBUG set there counts.
+    """
+    _load_env()
+    return bool(os.getenv("TUITTER_DEBUG"))
+
+
+def _noop_log(*args, **kwargs) -> None:
+    return None
+
+
+# One long-lived worker for the OAuth flow; retries reuse the same thread
+# and a second sign-in attempt queues behind the first.
+_auth_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tuitter-auth")
+
+
 # Prefer canonical username lookup from auth_storage which handles
 # chunked tokens and centralized storage (falls back to legacy keyring).
 try:
@@ -66,6 +103,10 @@ except Exception:
         except Exception:
             return None
 
+# The username only changes on sign-in/sign-out, but it is read on almost every
+# compose. Cache the keyring lookup; auth transitions call cache_clear().
+get_username = functools.lru_cache(maxsize=1)(get_username)
+
 # Service name for keyring storage
 
 
@@ -144,156 +185,296 @@ class NewMessageReceived(Message):
         self.message = message
 
 
-# Drafts file path
-DRAFTS_FILE = Path.home() / ".tuitter_drafts.json"
+# Drafts file path. Drafts are stored as an append-only NDJSON log: adding a
+# draft appends one record, and the file is compacted (rewritten with just
+# the live drafts) on delete/update or once it grows past _DRAFTS_COMPACT_AT.
+DRAFTS_FILE = Path.home() / ".tuitter_drafts.ndjson"
+# Pre-NDJSON location; read once for migration if the log doesn't exist yet.
+LEGACY_DRAFTS_FILE = Path.home() / ".tuitter_drafts.json"
+MAX_DRAFTS = 2
+_DRAFTS_COMPACT_AT = 16
+
+# In-memory copy of the drafts file, keyed on its mtime so edits made by
+# another process are still picked up.
+_drafts_cache: Optional[List[Dict]] = None
+_drafts_mtime: Optional[int] = None
+_drafts_log_lines = 0
+# Guards the cache globals and the file: drafts are saved from a compose
+# worker while the UI thread reads them. Re-entrant because add/update/delete
+# go through load_drafts()/save_drafts().
+_drafts_lock = threading.RLock()
+
+
+def _drafts_file_mtime() -> Optional[int]:
+    try:
+        return DRAFTS_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _draft_to_record(draft: Dict) -> bytes:
+    record = draft.copy()
+    record["timestamp"] = draft["timestamp"].isoformat()
+    return orjson.dumps(record) + b"\n"
+
+
+def _read_drafts_file() -> tuple:
+    """Return (drafts, record_count) from the NDJSON log (or the legacy file)."""
+    drafts = []
+    count = 0
+    if DRAFTS_FILE.exists():
+        with open(DRAFTS_FILE, "rb", buffering=65536) as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                count += 1
+                try:
+                    draft = orjson.loads(line)
+                    draft["timestamp"] = datetime.fromisoformat(draft["timestamp"])
+                    drafts.append(draft)
+                except Exception:
+                    continue
+    elif LEGACY_DRAFTS_FILE.exists():
+        drafts = orjson.loads(LEGACY_DRAFTS_FILE.read_bytes())
+        for draft in drafts:
+            draft["timestamp"] = datetime.fromisoformat(draft["timestamp"])
+    # Sort by timestamp (oldest first) and keep only the most recent drafts
+    drafts.sort(key=lambda x: x["timestamp"])
+    return drafts[-MAX_DRAFTS:], count
 
 
 def load_drafts() -> List[Dict]:
     """Load drafts from local storage."""
-    if not DRAFTS_FILE.exists():
-        return []
-    try:
-        with open(DRAFTS_FILE, "r") as f:
-            drafts = json.load(f)
-            # Convert timestamp strings back to datetime objects
-            for draft in drafts:
-                draft["timestamp"] = datetime.fromisoformat(draft["timestamp"])
-            return drafts
-    except Exception:
-        return []
+    global _drafts_cache, _drafts_mtime, _drafts_log_lines
+    with _drafts_lock:
+        mtime = _drafts_file_mtime()
+        if _drafts_cache is None or mtime != _drafts_mtime:
+            try:
+                drafts, count = _read_drafts_file()
+            except Exception:
+                drafts, count = [], 0
+            _drafts_cache = drafts
+            _drafts_mtime = mtime
+            _drafts_log_lines = count
+        # Hand out copies so callers (and reactive stores) never alias the cache
+        return [dict(d) for d in _drafts_cache]
 
 
 def save_drafts(drafts: List[Dict]) -> None:
-    """Save drafts to local storage."""
-    try:
-        # Convert datetime objects to ISO format strings
-        drafts_to_save = []
-        for draft in drafts:
-            draft_copy = draft.copy()
-            draft_copy["timestamp"] = draft["timestamp"].isoformat()
-            drafts_to_save.append(draft_copy)
+    """Save drafts to local storage (compacts the log).
 
-        with open(DRAFTS_FILE, "w") as f:
-            json.dump(drafts_to_save, f, indent=2)
-    except Exception as e:
-        print(f"Error saving drafts: {e}")
+    Raises OSError if the file can't be written; the cache is left untouched.
+    """
+    global _drafts_cache, _drafts_mtime, _drafts_log_lines
+    with _drafts_lock:
+        data = b"".join(_draft_to_record(d) for d in drafts)
+        # Write to a temp file and swap it in so a crash never leaves a torn log
+        fd, tmp_path = tempfile.mkstemp(prefix=".tuitter_drafts.", dir=str(DRAFTS_FILE.parent))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, DRAFTS_FILE)
+        except Exception:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        _drafts_cache = [dict(d) for d in drafts]
+        _drafts_mtime = _drafts_file_mtime()
+        _drafts_log_lines = len(drafts)
 
 
 def add_draft(content: str, attachments: List = None) -> None:
-    """Add a new draft and maintain max 2 drafts."""
-    drafts = load_drafts()
-
-    # Create new draft
-    new_draft = {
-        "content": content,
-        "attachments": attachments or [],
-        "timestamp": datetime.now(),
-    }
-
-    # Add new draft
-    drafts.append(new_draft)
+    """Add a new draft and maintain max 2 drafts. Raises OSError on write failure."""
+    global _drafts_cache, _drafts_mtime, _drafts_log_lines
+    with _drafts_lock:
+        drafts = load_drafts()
+
+        # Create new draft
+        new_draft = {
+            "content": content,
+            "attachments": attachments or [],
+            "timestamp": datetime.now(),
+        }
 
-    # Sort by timestamp (oldest first)
-    drafts.sort(key=lambda x: x["timestamp"])
+        # Add new draft, keeping only the most recent ones (oldest first)
+        drafts.append(new_draft)
+        drafts.sort(key=lambda x: x["timestamp"])
+        drafts = drafts[-MAX_DRAFTS:]
 
-    # Keep only the 2 most recent drafts
-    if len(drafts) > 2:
-        drafts = drafts[-2:]
+        # Migrating from the legacy file, or the log has grown: rewrite it
+        if not DRAFTS_FILE.exists() or _drafts_log_lines + 1 > _DRAFTS_COMPACT_AT:
+            save_drafts(drafts)
+            return
 
-    save_drafts(drafts)
+        with open(DRAFTS_FILE, "ab") as f:
+            f.write(_draft_to_record(new_draft))
+        _drafts_cache = [dict(d) for d in drafts]
+        _drafts_mtime = _drafts_file_mtime()
+        _drafts_log_lines += 1
 
 
 def delete_draft(index: int) -> None:
-    """Delete a specific draft by index."""
-    drafts = load_drafts()
-    if 0 <= index < len(drafts):
-        drafts.pop(index)
-        save_drafts(drafts)
+    """Delete a specific draft by index. Raises OSError on write failure."""
+    with _drafts_lock:
+        drafts = load_drafts()
+        if 0 <= index < len(drafts):
+            drafts.pop(index)
+            save_drafts(drafts)
 
 
 def update_draft(index: int, content: str, attachments: List = None) -> None:
     """Update an existing draft by index (overwrite content/attachments)."""
-    drafts = load_drafts()
-    if not drafts:
-        return
-    if index < 0 or index >= len(drafts):
-        raise IndexError("draft index out of range")
+    with _drafts_lock:
+        drafts = load_drafts()
+        if not drafts:
+            return
+        if index < 0 or index >= len(drafts):
+            raise IndexError("draft index out of range")
 
-    drafts[index]["content"] = content
-    drafts[index]["attachments"] = attachments or []
-    drafts[index]["timestamp"] = datetime.now()
-    save_drafts(drafts)
+        drafts[index]["content"] = content
+        drafts[index]["attachments"] = attachments or []
+        drafts[index]["timestamp"] = datetime.now()
+        save_drafts(drafts)
 
 
-def format_time_ago(dt: datetime) -> str:
-    """Format datetime as 'time ago' string."""
-    # Normalize 'now' to the same tz-awareness as dt to avoid incorrect deltas
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+
+
+@functools.lru_cache(maxsize=4096)
+def _epoch_seconds(dt: datetime) -> float:
+    # Naive datetimes go through mktime/localtime on every .timestamp() call;
+    # post/comment/notification timestamps never change, so remember them.
+    return dt.timestamp()
+
+
+def format_time_ago(dt: datetime, now: Optional[datetime] = None) -> str:
+    """Format datetime as 'time ago' string.
+
+    Pass ``now`` when formatting many timestamps in one render pass so the
+    clock is read once. Comparing epoch seconds works for naive (local) and
+    aware datetimes alike.
+    """
     if dt is None:
         return "just now"
     try:
-        now = datetime.now(dt.tzinfo) if dt.tzinfo else datetime.now()
-    except Exception:
-        now = datetime.now()
+        now_ts = now.timestamp() if now is not None else time.time()
+        total_seconds = int(now_ts - _epoch_seconds(dt))
+    except (OverflowError, ValueError, OSError, TypeError):
+        # e.g. datetime.min placeholders that can't be expressed as epoch seconds
+        total_seconds = int((datetime.now() - dt.replace(tzinfo=None)).total_seconds())
 
-    delta = now - dt
-    total_seconds = int(delta.total_seconds())
     if total_seconds < 10:
         return "just now"
-    if total_seconds < 60:
+    if total_seconds < _MINUTE:
         return f"{total_seconds}s ago"
-    minutes = total_seconds // 60
-    if minutes < 60:
-        return f"{minutes}m ago"
-    hours = minutes // 60
-    if hours < 24:
-        return f"{hours}h ago"
-    days = hours // 24
-    return f"{days}d ago"
+    if total_seconds < _HOUR:
+        return f"{total_seconds // _MINUTE}m ago"
+    if total_seconds < _DAY:
+        return f"{total_seconds // _HOUR}h ago"
+    return f"{total_seconds // _DAY}d ago"
+
+
+# Cheap shape check so obviously-bad timestamps skip fromisoformat's
+# exception path entirely.
+_ISO_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _parse_iso_fast(raw) -> Optional[datetime]:
+    """Parse an ISO-8601 string, returning None instead of raising on bad input."""
+    if isinstance(raw, datetime):
+        return raw
+    if not isinstance(raw, str) or not _ISO_RE.match(raw):
+        return None
+    if raw[-1] == "Z":
+        # fromisoformat only accepts a trailing Z from Python 3.11
+        raw = raw[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        return None
+
+
+def _comment_dt(c: dict) -> Optional[datetime]:
+    """Parsed timestamp for a comment dict, memoized on the dict itself."""
+    try:
+        return c["_parsed_ts"]
+    except KeyError:
+        dt = c["_parsed_ts"] = _parse_iso_fast(c.get("timestamp") or c.get("created_at"))
+        return dt
+
+
+def _render_comment(c: dict, now: Optional[datetime] = None) -> tuple:
+    """Return the (meta line, body text) pair a CommentItem displays."""
+    dt = _comment_dt(c)
+    c_time = format_time_ago(dt, now) if dt is not None else "just now"
+    return f"@{c.get('user', 'unknown')} • {c_time}", c.get("text", "")
+
+
+def _comment_sort_key(c: dict) -> float:
+    # Epoch seconds so naive and offset-aware timestamps sort together
+    dt = _comment_dt(c)
+    if dt is None:
+        return float("-inf")
+    try:
+        return dt.timestamp()
+    except (OverflowError, ValueError, OSError):
+        return float("-inf")
 
 
 # ───────── Main UI Screen (not auth) ─────────
+_APP_FOOTER = "[1-6] Screens [p] Profile [d] Drafts [j/k] Navigate [:n] New Post [:q] Quit"
+
+
+# starting_view -> screen class name. Names rather than classes because the
+# screens are defined further down this module; compose resolves them.
+_SCREENS = {
+    "timeline": "TimelineScreen",
+    "discover": "DiscoverScreen",
+    "notifications": "NotificationsScreen",
+    "messages": "MessagesScreen",
+    "settings": "SettingsScreen",
+    "following": "FollowingScreen",
+    "drafts": "DraftsScreen",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _header_text(view: str, username: str) -> str:
+    return f"tuitter [{view}] @{username}"
+
+
 class MainUIScreen(Screen):
     """The main authenticated app screen with timeline/discover/etc."""
 
     def __init__(self, starting_view: str = "timeline"):
         super().__init__()
         self.starting_view = starting_view
+        self._username = get_username() or "yourname"
 
     def compose(self) -> ComposeResult:
-        username = get_username() or "yourname"
-        yield Static(
-            f"tuitter [{self.starting_view}] @{username}", id="app-header", markup=False
-        )
+        username = self._username
+        yield Static(_header_text(self.starting_view, username), id="app-header", markup=False)
         yield TopNav(id="top-navbar", current=self.starting_view)
 
         # Show the appropriate content based on starting_view
-        if self.starting_view == "timeline":
-            yield TimelineScreen(id="screen-container")
-        elif self.starting_view == "discover":
-            yield DiscoverScreen(id="screen-container")
-        elif self.starting_view == "notifications":
-            yield NotificationsScreen(id="screen-container")
-        elif self.starting_view == "messages":
-            yield MessagesScreen(id="screen-container")
-        elif self.starting_view == "settings":
-            yield SettingsScreen(id="screen-container")
-        elif self.starting_view == "following":
-            yield FollowingScreen(id="screen-container")
-        elif self.starting_view == "drafts":
-            yield DraftsScreen(id="screen-container")
-        else:
-            yield TimelineScreen(id="screen-container")
+        screen_cls = globals()[_SCREENS.get(self.starting_view, "TimelineScreen")]
+        yield screen_cls(id="screen-container")
 
-        yield Static(
-            "[1-6] Screens [p] Profile [d] Drafts [j/k] Navigate [:n] New Post [:q] Quit",
-            id="app-footer",
-            markup=False,
-        )
+        yield Static(_APP_FOOTER, id="app-footer", markup=False)
         yield Static("", id="command-bar")
 
         # Auth Debug Log - only show if TUITTER_DEBUG environment variable is set
-        if os.getenv("TUITTER_DEBUG"):
-            auth_log = RichLog(id="auth-log", highlight=True, markup=True)
+        if _debug_enabled():
+            # Plain-text trace: bounded history, no highlighter/markup/wrap work
+            # on each append.
+            auth_log = RichLog(
+                id="auth-log", max_lines=500, highlight=False, markup=False, wrap=False
+            )
             auth_log.styles.height = "10"
             auth_log.styles.border = ("solid", "yellow")
             auth_log.border_title = "Auth Debug Log"
@@ -341,103 +522,70 @@ class AuthScreen(Screen):
 
     def on_mount(self) -> None:
         """Called when the AuthScreen is mounted."""
-        import sys
-
-        try:
-            # Use App-level logging so it respects TUITTER_DEBUG and in-TUI RichLog
-            self.app.log_auth_event("AuthScreen.on_mount CALLED")
-        except Exception:
-            pass
+        # App-level logging respects TUITTER_DEBUG and the in-TUI RichLog
+        log = self.app.log_auth_event if _debug_enabled() else _noop_log
+        log("AuthScreen.on_mount CALLED")
         try:
             button = self.query_one("#oauth-signin", Button)
-            try:
-                self.app.log_auth_event(f"Found button: {button.id}")
-            except Exception:
-                pass
+            log(f"Found button: {button.id}")
         except Exception as e:
-            try:
-                self.app.log_auth_event(f"Failed to find button: {e}")
-            except Exception:
-                pass
+            log(f"Failed to find button: {e}")
 
-        try:
-            self.app.log_auth_event("AuthScreen.on_mount: Screen mounted")
-        except Exception:
-            pass
+        log("AuthScreen.on_mount: Screen mounted")
 
         # Attempt a silent restore here so if tokens are present (written by
         # another session) we immediately switch to the main UI without
         # requiring the user to quit/reopen. This mirrors App.on_mount but
-        # runs when the AuthScreen becomes active.
-        try:
-            # Prefer the API's proactive restore which validates the token and
-            # attempts refresh if needed. This avoids switching to the main UI
-            # with an expired token which would crash during compose.
-            try:
-                restored = api.try_restore_session()
-            except Exception:
-                restored = False
+        # runs when the AuthScreen becomes active. The keyring read and any
+        # token refresh happen off the UI thread so the sign-in UI is usable
+        # straight away.
+        self._silent_restore()
 
-            try:
-                self.app.log_auth_event(
-                    f"AuthScreen.on_mount: silent-restore restored={restored}"
-                )
-            except Exception:
-                pass
+    @work(thread=True, exclusive=True, group="auth-restore")
+    def _silent_restore(self) -> None:
+        """Try api.try_restore_session() in a worker and report back on the UI thread."""
+        # Prefer the API's proactive restore which validates the token and
+        # attempts refresh if needed. This avoids switching to the main UI
+        # with an expired token which would crash during compose.
+        try:
+            restored = api.try_restore_session()
+        except Exception:
+            restored = False
+        try:
+            self.app.call_from_thread(self._on_silent_restore, restored)
+        except Exception:
+            pass
 
-            if restored:
-                try:
-                    # Let the App mount the main UI; tokens are already set on api
-                    self.app.show_main_app()
-                    return
-                except Exception:
-                    try:
-                        self.app.log_auth_event(
-                            "AuthScreen.on_mount: silent restore failed during show_main_app"
-                        )
-                    except Exception:
-                        pass
+    def _on_silent_restore(self, restored: bool) -> None:
+        log = self.app.log_auth_event if _debug_enabled() else _noop_log
+        log(f"AuthScreen.on_mount: silent-restore restored={restored}")
+        if not restored:
+            return
+        try:
+            # Let the App mount the main UI; tokens are already set on api
+            self.app.show_main_app()
         except Exception:
             # Don't let silent-restore errors prevent the auth screen from working
-            pass
+            log("AuthScreen.on_mount: silent restore failed during show_main_app")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle sign-in button press."""
-        import sys
-
-        try:
-            self.app.log_auth_event(f"BUTTON PRESSED: {event.button.id}")
-        except Exception:
-            pass
+        log = self.app.log_auth_event if _debug_enabled() else _noop_log
+        log(f"BUTTON PRESSED: {event.button.id}")
 
         if event.button.id == "oauth-signin":
-            try:
-                self.app.log_auth_event("Sign-in button confirmed")
-            except Exception:
-                pass
+            log("Sign-in button confirmed")
             # Update status immediately
             try:
                 self.query_one("#auth-status", Static).update("Opening browser...")
-                try:
-                    self.app.log_auth_event("Updated status text")
-                except Exception:
-                    pass
+                log("Updated status text")
             except Exception as e:
-                try:
-                    self.app.log_auth_event(f"Failed to update status: {e}")
-                except Exception:
-                    pass
+                log(f"Failed to update status: {e}")
 
             # Schedule the OAuth flow
-            try:
-                self.app.log_auth_event("About to call call_after_refresh")
-            except Exception:
-                pass
+            log("About to call call_after_refresh")
             self.call_after_refresh(self._start_auth_flow)
-            try:
-                self.app.log_auth_event("call_after_refresh returned")
-            except Exception:
-                pass
+            log("call_after_refresh returned")
 
     def key_q(self) -> None:
         """Quit the app from the login screen."""
@@ -467,29 +615,14 @@ class AuthScreen(Screen):
 
     def _start_auth_flow(self) -> None:
         """Start the OAuth flow using simplified auth module."""
-        # Run authenticate() in a background thread so the Textual event loop
+        # Run authenticate() on the auth executor so the Textual event loop
         # stays responsive. Marshal UI updates back to the main thread using
         # call_from_thread / app.call_from_thread.
         from .auth import authenticate, AuthError
-        import threading
-        import sys
 
-        # Log immediately that this method was called
-        if os.getenv("TUITTER_DEBUG"):
-            # Keep a very early guard to avoid spamming when debug not set
-            try:
-                self.app.log_auth_event("_start_auth_flow CALLED")
-            except Exception:
-                pass
-        try:
-            self.app.log_auth_event(
-                "_start_auth_flow: Method called, about to start worker thread"
-            )
-        except Exception:
-            try:
-                self.app.log_auth_event("Failed to log start_auth_flow")
-            except Exception:
-                pass
+        log = self.app.log_auth_event if _debug_enabled() else _noop_log
+        log("_start_auth_flow CALLED")
+        log("_start_auth_flow: Method called, about to start worker thread")
 
         def _ui_call(fn):
             # Try to schedule a callable on the UI thread. Prefer Screen.call_from_thread
@@ -561,10 +694,8 @@ class AuthScreen(Screen):
                 except Exception:
                     pass
 
-                # Post a message and try to directly trigger the UI transition on the
-                # application's main thread. We do multiple attempts to be robust
-                # across Textual versions / environments where call_from_thread or
-                # message routing may behave differently.
+                # Fallback used when App.call_from_thread is unavailable: update the
+                # status text and mount the main UI directly via _ui_call.
                 def on_success():
                     try:
                         # Update status text if widget present
@@ -583,57 +714,28 @@ class AuthScreen(Screen):
                     except Exception:
                         pass
 
-                try:
-                    # 1) Post AuthenticationCompleted message
+                # Post the completion message, flip the reactive flag and
+                # schedule the transition in one UI-thread hop. show_main_app
+                # goes through call_later so current event processing finishes
+                # first; credentials are passed directly to avoid file I/O races.
+                def on_success_all():
                     try:
-                        self.app.call_from_thread(
-                            lambda: self.post_message(
-                                AuthenticationCompleted(username=username)
-                            )
-                        )
+                        self.post_message(AuthenticationCompleted(username=username))
                     except Exception:
-                        try:
-                            # Some Textual versions route messages differently; try posting on screen
-                            self.post_message(
-                                AuthenticationCompleted(username=username)
-                            )
-                        except Exception:
-                            pass
-
-                    # 2) Set reactive flag on App
+                        pass
                     try:
-                        self.app.call_from_thread(
-                            lambda: setattr(self.app, "authenticated", True)
-                        )
+                        self.app.authenticated = True
                     except Exception:
-                        try:
-                            setattr(self.app, "authenticated", True)
-                        except Exception:
-                            pass
-
-                    # 3) Directly ask the App to show main UI (best-effort)
-                    # Pass credentials directly to avoid file I/O race conditions
-
-                    def transition_to_main():
-                        try:
-                            # Schedule show_main_app on the next event loop iteration
-                            # This ensures all current event processing is complete first
-                            self.app.call_later(
-                                lambda: self.app.show_main_app(credentials=result)
-                            )
-                        except Exception:
-                            pass
-
+                        pass
                     try:
-                        # Use call_from_thread to schedule the transition on the main thread
-                        self.app.call_from_thread(transition_to_main)
+                        self.app.call_later(
+                            lambda: self.app.show_main_app(credentials=result)
+                        )
                     except Exception:
-                        # Fallback: try direct call (might work if already on main thread)
-                        try:
-                            self.app.show_main_app(credentials=result)
-                        except Exception:
-                            pass
+                        pass
 
+                try:
+                    self.app.call_from_thread(on_success_all)
                 except Exception:
                     # Last-resort: schedule on-success closure via _ui_call
                     _ui_call(on_success)
@@ -681,29 +783,15 @@ class AuthScreen(Screen):
 
                     _ui_call(on_exc)
 
-        try:
-            self.app.log_auth_event("Creating worker thread")
-        except Exception:
-            pass
-        t = threading.Thread(target=worker, daemon=True)
-        try:
-            self.app.log_auth_event("Starting worker thread")
-        except Exception:
-            pass
-        t.start()
-        try:
-            self.app.log_auth_event("Worker thread started")
-        except Exception:
-            pass
-        try:
-            self.app.log_auth_event(
-                "_start_auth_flow: Worker thread created and started"
-            )
-        except Exception:
-            try:
-                self.app.log_auth_event("Failed to log thread start")
-            except Exception:
-                pass
+        def _on_done(fut):
+            # worker() reports its own failures to the UI; anything that still
+            # escapes it only needs to be recorded.
+            exc = fut.exception()
+            if exc is not None:
+                logging.getLogger("tuitter.auth").error("auth worker crashed: %r", exc)
+
+        _auth_executor.submit(worker).add_done_callback(_on_done)
+        log("_start_auth_flow: Worker submitted to auth executor")
 
     # Message handlers for authentication results
     def on_authentication_completed(self, message: AuthenticationCompleted) -> None:
@@ -745,18 +833,19 @@ class CommentItem(Widget):
     liked_by_user = reactive(False)
     likes = reactive(0)
 
-    def __init__(self, comment_data: dict, **kwargs):
+    def __init__(
+        self,
+        comment_data: dict,
+        now: Optional[datetime] = None,
+        rendered: Optional[tuple] = None,
+        **kwargs,
+    ):
         super().__init__(**kwargs)
         self.comment_id = comment_data.get("id")
         self.author = comment_data.get("user", "unknown")
         # Expose a generic entity interface for the generic :del command hook
-        self.comment = type("CommentEntity", (), {"id": self.comment_id, "author": self.author})()
-        self.comment_text = comment_data.get("text", "")
-        ts = comment_data.get("timestamp") or comment_data.get("created_at") or datetime.now().isoformat()
-        try:
-            self._c_time = format_time_ago(datetime.fromisoformat(ts))
-        except Exception:
-            self._c_time = "just now"
+        self.comment = types.SimpleNamespace(id=self.comment_id, author=self.author)
+        self._meta, self.comment_text = rendered or _render_comment(comment_data, now)
         # Set likes first (plain assignment, no watcher side-effect on 'likes' itself).
         # Then set liked_by_user — its watcher increments likes, but we immediately
         # overwrite with the real server value so the final number is always correct.
@@ -765,19 +854,38 @@ class CommentItem(Widget):
         self.liked_by_user = _liked
         self.likes = _likes  # overwrite whatever the watcher did
 
+    def update_from(
+        self,
+        comment_data: dict,
+        now: Optional[datetime] = None,
+        rendered: Optional[tuple] = None,
+    ) -> None:
+        """Refresh this item in place from a newer copy of its comment dict."""
+        meta, text = rendered or _render_comment(comment_data, now)
+        changed = meta != self._meta or text != self.comment_text
+        self._meta, self.comment_text = meta, text
+        # Same ordering trick as __init__: the liked watcher nudges likes,
+        # then the server value overwrites it.
+        self.liked_by_user = bool(comment_data.get("liked_by_user", False))
+        self.likes = int(comment_data.get("likes", 0) or 0)
+        if changed:
+            try:
+                self.query_one(".comment-meta", Static).update(self._meta)
+                self.query_one(".comment-body", Static).update(self.comment_text)
+            except Exception:
+                pass
+        self._render_content()
+
     def _like_str(self) -> str:
         heart = "❤️" if self.liked_by_user else "🤍"
         return f"{heart} {self.likes}"
 
     def compose(self):
         with Horizontal(classes="comment-header"):
-            yield Static(f"@{self.author} • {self._c_time}", classes="comment-meta", markup=False)
+            yield Static(self._meta, classes="comment-meta", markup=False)
             yield Static(self._like_str(), classes="comment-like-badge", markup=False)
         yield Static(self.comment_text, classes="comment-body", markup=False)
 
-    def on_mount(self) -> None:
-        self.styles.background = "#282A36"
-
     def _render_content(self) -> None:
         try:
             self.query_one(".comment-like-badge", Static).update(self._like_str())
@@ -818,16 +926,37 @@ class CommentItem(Widget):
                 pass
 
 
+# Navigation keys CommentFeed handles via key_* methods; on_key only stops them bubbling
+_COMMENT_FEED_NAV_KEYS = frozenset(
+    ("j", "k", "h", "l", "w", "b", "G", "ctrl+d", "ctrl+u", "o", "enter")
+)
+
+
 class CommentFeed(VerticalScroll):
     """Comment feed modeled after DiscoverFeed"""
 
     cursor_position = reactive(0)  # 0 = post, 1 = input, 2+ = comments
+    _batch_size = 20  # Comments mounted per page, like the post feeds
 
     def __init__(self, post, origin=None, **kwargs):
         super().__init__(**kwargs)
         self.post = post
         self.origin = origin
         self.comments = []
+        # Only self.comments[:_displayed_count] have widgets; the rest are
+        # mounted a page at a time as the cursor or scroll reaches the end.
+        self._displayed_count = 0
+        # [post, input, *comments]; rebuilt lazily when _nav_version moves
+        self._nav_cache: Optional[list] = None
+        self._nav_version = 0
+        self._nav_cache_version = -1
+        # Cursor class changes are coalesced to one pass per refresh
+        self._cursor_dirty = False
+        self._last_cursor_widget: Optional[Widget] = None
+        # Time of the previous "g" press, for gg (0.0 = none pending)
+        self._last_g_time = 0.0
+        self._comment_input: Optional[Input] = None
+        self._key_handlers = {"g": self._handle_g, "d": self._handle_d}
 
     def compose(self):
         # Post at the top (use the same PostItem widget + CSS class as timeline/discover)
@@ -846,27 +975,84 @@ class CommentFeed(VerticalScroll):
             id="comment-input",
         )
 
-        # Comments
-        self.comments = api.get_comments(self.post.id)
+        # Comments are fetched off the UI thread in on_mount; show a
+        # placeholder until they arrive.
+        yield Static("Loading comments...", id="comments-loading", classes="muted", markup=False)
 
+    def on_mount(self) -> None:
+        self.watch(self, "cursor_position", self._schedule_cursor_update)
+        self._fetch_comments()
+
+    @work(thread=True, exclusive=True, group="comment-fetch")
+    def _fetch_comments(self) -> None:
+        """Fetch comments in a worker thread and hand them to the UI thread."""
+        try:
+            comments = api.get_comments(self.post.id)
+        except Exception:
+            comments = []
+        try:
+            self.app.call_from_thread(self._populate_comments, comments)
+        except Exception:
+            pass
+
+    def _populate_comments(self, comments) -> None:
+        """Mount the initial comment list (runs on the UI thread)."""
+        try:
+            self.query_one("#comments-loading").remove()
+        except Exception:
+            pass
         # Sort newest first
-        def _comment_ts(c):
-            raw = c.get("timestamp") or c.get("created_at") or ""
-            try:
-                return datetime.fromisoformat(raw)
-            except Exception:
-                return datetime.min
-        self.comments = sorted(self.comments, key=_comment_ts, reverse=True)
+        self.comments = sorted(comments or [], key=_comment_sort_key, reverse=True)
+        self._displayed_count = 0
+        self._mount_more_comments()
 
-        for i, c in enumerate(self.comments):
-            yield CommentItem(
+    def _mount_more_comments(self, upto: Optional[int] = None) -> bool:
+        """Mount the next page of comments (or everything up to ``upto``).
+
+        Returns True if any widgets were added.
+        """
+        old_count = self._displayed_count
+        target = old_count + self._batch_size if upto is None else upto
+        target = min(target, len(self.comments))
+        if target <= old_count:
+            return False
+        now = datetime.now()
+        items = [
+            CommentItem(
                 c,
+                rendered=_render_comment(c, now),
                 classes="comment-thread-item comment-item",
-                id=f"comment-{i}",
             )
+            for c in self.comments[old_count:target]
+        ]
+        try:
+            nav = self._get_navigable_items()
+            anchor = nav[-1] if nav else self.query_one("#comment-input", Input)
+            self.mount(*items, after=anchor)
+        except Exception:
+            return False
+        self._displayed_count = target
+        self._invalidate_nav()
+        return True
 
-    def on_mount(self) -> None:
-        self.watch(self, "cursor_position", self._update_cursor)
+    def _ensure_index_mounted(self, index: int) -> list:
+        """Page in comments until nav index ``index`` exists; return nav items."""
+        items = self._get_navigable_items()
+        if index >= len(items) - 1 and self._displayed_count < len(self.comments):
+            # Two leading nav slots are the post and the input
+            self._mount_more_comments(upto=max(index - 1, self._displayed_count + self._batch_size))
+            items = self._get_navigable_items()
+        return items
+
+    def on_mouse_scroll_down(self, event) -> None:
+        """Page in more comments when wheel-scrolling near the bottom."""
+        if self._displayed_count >= len(self.comments):
+            return
+        try:
+            if self.scroll_offset.y + self.container_size.height >= self.virtual_size.height - 10:
+                self._mount_more_comments()
+        except Exception:
+            pass
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle comment submission"""
@@ -922,32 +1108,58 @@ class CommentFeed(VerticalScroll):
             self.app.notify("Comment posted!", timeout=2)
 
     async def _refresh_comments(self) -> None:
-        """Refresh the comment list"""
-        try:
-            # Remove existing comment items — MUST await so the DOM is
-            # fully cleared before we mount fresh widgets.
-            await self.query(".comment-item").remove()
-
-            # Fetch updated comments
-            self.comments = api.get_comments(self.post.id)
+        """Refresh the comment list.
 
-            # Sort newest first
-            def _comment_ts(c):
-                raw = c.get("timestamp") or c.get("created_at") or ""
-                try:
-                    return datetime.fromisoformat(raw)
-                except Exception:
-                    return datetime.min
-            self.comments = sorted(self.comments, key=_comment_ts, reverse=True)
-
-            # Add new comments
-            for i, c in enumerate(self.comments):
-                comment_widget = CommentItem(
-                    c,
-                    classes="comment-thread-item comment-item",
-                    id=f"comment-{i}",
-                )
-                self.mount(comment_widget)
+        Existing CommentItems are matched by comment id and updated in place;
+        only new comments are mounted and only vanished ones removed, so a
+        single new comment doesn't rebuild the whole thread.
+        """
+        try:
+            # Fetch updated comments, newest first
+            comments = api.get_comments(self.post.id)
+            self.comments = sorted(comments, key=_comment_sort_key, reverse=True)
+            # Keep the same number of pages mounted as before the refresh
+            window = self.comments[: max(self._displayed_count, self._batch_size)]
+            self._displayed_count = len(window)
+
+            current = list(self.query(".comment-item"))
+            by_id = {}
+            for w in current:
+                by_id.setdefault(getattr(w, "comment_id", None), w)
+
+            now = datetime.now()
+            kept = set()
+            ordered = []
+            for c in window:
+                cid = c.get("id")
+                w = by_id.get(cid) if cid is not None else None
+                rendered = _render_comment(c, now)
+                if w is not None and id(w) not in kept:
+                    kept.add(id(w))
+                    w.update_from(c, rendered=rendered)
+                    ordered.append(w)
+                else:
+                    ordered.append(CommentItem(
+                        c,
+                        rendered=rendered,
+                        classes="comment-thread-item comment-item",
+                    ))
+
+            stale = [w for w in current if id(w) not in kept]
+            self._invalidate_nav()
+            if stale:
+                await self.remove_children(stale)
+
+            # Mount new items in sort order relative to the ones we kept
+            prev = None
+            for w in ordered:
+                if id(w) not in kept:
+                    if prev is None:
+                        await self.mount(w, after=self.query_one("#comment-input", Input))
+                    else:
+                        await self.mount(w, after=prev)
+                prev = w
+            self._invalidate_nav()
 
             # Reset cursor position
             self.cursor_position = 0
@@ -1004,32 +1216,52 @@ class CommentFeed(VerticalScroll):
         except Exception:
             pass
 
+    def _invalidate_nav(self) -> None:
+        """Call after mounting or removing comment widgets."""
+        self._nav_version += 1
+        self._nav_cache = None
+
     def _get_navigable_items(self) -> list:
         """Get all navigable items (post + input + comments)"""
+        if self._nav_cache is not None and self._nav_cache_version == self._nav_version:
+            return self._nav_cache
         try:
             post_item = self.query_one(PostItem)
             comment_input = self.query_one("#comment-input", Input)
             comment_items = list(self.query(".comment-item"))
-            return [post_item, comment_input] + comment_items
+            self._nav_cache = [post_item, comment_input] + comment_items
+            self._nav_cache_version = self._nav_version
+            return self._nav_cache
         except Exception:
             return []
 
+    def _schedule_cursor_update(self) -> None:
+        """Queue a cursor repaint; key autorepeat collapses into one update."""
+        if self._cursor_dirty:
+            return
+        self._cursor_dirty = True
+        self.call_after_refresh(self._flush_cursor_update)
+
+    def _flush_cursor_update(self) -> None:
+        if not self._cursor_dirty:
+            return
+        self._cursor_dirty = False
+        self._update_cursor()
+
     def _update_cursor(self) -> None:
         """Update the cursor position - includes post + input + comments"""
         try:
             items = self._get_navigable_items()
-            post_item = self.query_one(PostItem)
-            comment_items = list(self.query(".comment-item"))
-            comment_input = self.query_one("#comment-input", Input)
 
-            # Remove cursor from all items
-            post_item.remove_class("vim-cursor")
-            comment_input.remove_class("vim-cursor")
-            for item in comment_items:
-                item.remove_class("vim-cursor")
+            # Only the previously highlighted widget can carry the class
+            last = self._last_cursor_widget
+            if last is not None:
+                last.remove_class("vim-cursor")
+                self._last_cursor_widget = None
 
             if 0 <= self.cursor_position < len(items):
                 item = items[self.cursor_position]
+                self._last_cursor_widget = item
                 if isinstance(item, PostItem):
                     # Add cursor to post
                     item.add_class("vim-cursor")
@@ -1049,14 +1281,14 @@ class CommentFeed(VerticalScroll):
     def on_focus(self) -> None:
         """When the screen gets focus"""
         self.cursor_position = 0
-        self._update_cursor()
+        self._schedule_cursor_update()
 
 
     def key_j(self) -> None:
         """Move down with j key"""
         if self.app.command_mode:
             return
-        items = self._get_navigable_items()
+        items = self._ensure_index_mounted(self.cursor_position + 1)
         if self.cursor_position < len(items) - 1:
             self.cursor_position += 1
 
@@ -1077,6 +1309,7 @@ class CommentFeed(VerticalScroll):
         """Go to bottom with G"""
         if self.app.command_mode:
             return
+        self._mount_more_comments(upto=len(self.comments))
         items = self._get_navigable_items()
         self.cursor_position = len(items) - 1
 
@@ -1084,7 +1317,7 @@ class CommentFeed(VerticalScroll):
         """Half page down"""
         if self.app.command_mode:
             return
-        items = self._get_navigable_items()
+        items = self._ensure_index_mounted(self.cursor_position + 5)
         self.cursor_position = min(self.cursor_position + 5, len(items) - 1)
 
     def key_ctrl_u(self) -> None:
@@ -1097,7 +1330,7 @@ class CommentFeed(VerticalScroll):
         """Word forward - move down by 3"""
         if self.app.command_mode:
             return
-        items = self._get_navigable_items()
+        items = self._ensure_index_mounted(self.cursor_position + 3)
         self.cursor_position = min(self.cursor_position + 3, len(items) - 1)
 
     def key_b(self) -> None:
@@ -1106,6 +1339,15 @@ class CommentFeed(VerticalScroll):
             return
         self.cursor_position = max(self.cursor_position - 3, 0)
 
+    def _get_comment_input(self) -> Optional[Input]:
+        """The #comment-input widget, looked up once and then reused."""
+        if self._comment_input is None:
+            try:
+                self._comment_input = self.query_one("#comment-input", Input)
+            except Exception:
+                return None
+        return self._comment_input
+
     def on_key(self, event) -> None:
         """Handle g+g key combination for top and escape from input"""
         # Don't process keys if app is in command mode
@@ -1114,50 +1356,49 @@ class CommentFeed(VerticalScroll):
             return
 
         # Special handling for input: if input has focus, don't intercept keys
-        try:
-            comment_input = self.query_one("#comment-input", Input)
-            if comment_input.has_focus:
-                if event.key == "escape":
-                    comment_input.blur()
-                    self.focus()
-                    self.cursor_position = 0
-                    event.prevent_default()
-                    event.stop()
-                return
-        except Exception:
-            pass
+        comment_input = self._get_comment_input()
+        if comment_input is not None and comment_input.has_focus:
+            if event.key == "escape":
+                comment_input.blur()
+                self.focus()
+                self.cursor_position = 0
+                event.prevent_default()
+                event.stop()
+            return
 
-        if event.key in ("j", "k", "h", "l", "w", "b", "G", "ctrl+d", "ctrl+u", "o", "enter"):
+        if event.key in _COMMENT_FEED_NAV_KEYS:
             # Stop bubbling to prevent TuitterApp or other parents from double-handling.
             # CRITICAL: DO NOT call prevent_default() here as it blocks the key_* action dispatching.
             event.stop()
             return
 
-        if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
-                self.cursor_position = 0
-                event.prevent_default()
-                event.stop()
-                delattr(self, "last_g_time")
-            else:
-                self.last_g_time = now
-            return
+        handler = self._key_handlers.get(event.key)
+        if handler is not None:
+            handler(event)
 
-        # If 'd' pressed, navigate to drafts.
-        if event.key == "d":
+    def _handle_g(self, event) -> None:
+        now = time.monotonic()
+        if now - self._last_g_time < 0.5:
+            self.cursor_position = 0
+            event.prevent_default()
+            event.stop()
+            self._last_g_time = 0.0
+        else:
+            self._last_g_time = now
+
+    def _handle_d(self, event) -> None:
+        """'d' navigates to drafts."""
+        try:
+            event.prevent_default()
+            event.stop()
+            # If this is inside a panel, ask app to close it first
             try:
-                event.prevent_default()
-                event.stop()
-                # If this is inside a panel, ask app to close it first
-                try:
-                    self.app.action_close_comment_panel()
-                except Exception:
-                    pass
-                self.app.action_show_drafts()
+                self.app.action_close_comment_panel()
             except Exception:
                 pass
-            return
+            self.app.action_show_drafts()
+        except Exception:
+            pass
 
 class CommentPanel(Container):
     """Embed-friendly comment panel that can be mounted inside the main screen container."""
@@ -1355,6 +1596,8 @@ class NavigationItem(Static):
         self.app.switch_screen(self.screen_name)
 
     def set_active(self, is_active: bool) -> None:
+        if self.active == is_active:
+            return
         self.active = is_active
         (self.add_class if is_active else self.remove_class)("active")
         self.refresh()
@@ -1365,9 +1608,10 @@ class CommandItem(Static):
         super().__init__(**kwargs)
         self.shortcut = shortcut
         self.description = description
+        self._rendered = f"{shortcut} - {description}"
 
     def render(self) -> str:
-        return f"{self.shortcut} - {self.description}"
+        return self._rendered
 
 
 class DraftItem(Static):
@@ -1375,23 +1619,36 @@ class DraftItem(Static):
 
     def __init__(self, draft: Dict, index: int, **kwargs):
         super().__init__(**kwargs)
+        self.border = "round"
+        self._body = ""
+        self._rendered = ""
+        self._set_draft(draft, index)
+
+    def _set_draft(self, draft: Dict, index: int) -> None:
         self.draft = draft
         self.draft_index = index
-        self.border = "round"
         self.border_title = f"Draft {index + 1}"
+        # Drafts don't change once loaded; only the relative time goes stale
+        content = draft["content"]
+        if len(content) > 40:
+            content = content[:40] + "..."
+        attachments_count = len(draft.get("attachments", []))
+        attach_text = f" [{attachments_count} attachments]" if attachments_count > 0 else ""
+        self._body = f"{content}{attach_text}"
+        self.bump_time()
+
+    def update_draft(self, draft: Dict, index: int) -> None:
+        """Point this item at a different draft and repaint it in place."""
+        self._set_draft(draft, index)
+        self.refresh()
+
+    def bump_time(self) -> None:
+        """Recompute the "N ago" prefix; call this if the item lives a long time."""
+        self._rendered = f"{format_time_ago(self.draft['timestamp'])}\n{self._body}"
 
     def render(self) -> str:
         """Render the draft item as text."""
-        content = (
-            self.draft["content"][:40] + "..."
-            if len(self.draft["content"]) > 40
-            else self.draft["content"]
-        )
-        time_ago = format_time_ago(self.draft["timestamp"])
-        attachments_count = len(self.draft.get("attachments", []))
-        attach_text = f" [{attachments_count} attachments]" if attachments_count > 0 else ""
-
-        return f"{time_ago}\n{content}{attach_text}"
+        return self._rendered
 
     def on_click(self) -> None:
         """Handle click on draft item - for now just open it."""
@@ -1410,57 +1667,73 @@ class ProfileDisplay(Static):
 
 
 class ConversationItem(Static):
-    def __init__(self, conversation, **kwargs):
+    def __init__(self, conversation, list_ref=None, index: int = -1, **kwargs):
         # Enable markup for the 'unread' label styling
         super().__init__(markup=True, **kwargs)
         self.conversation = conversation
-
-    def render(self) -> str:
-        time_ago = format_time_ago(self.conversation.last_message_at)
-        # Use Dracula Orange (#FFB86C) for the unread label
-        unread_text = "[#FFB86C]unread[/]" if self.conversation.unread else ""
+        # Owning ConversationsList and our row in it, so clicks don't rescan
+        self._list_ref = list_ref
+        self._index = index
+        self._messages_screen = None
+        self._other_handle = ""
+        self._rendered_base = ""
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Recompute the cached peer handle and text after the conversation changes."""
+        conversation = self.conversation
         # Get the other participant's username (first one that's not the current user)
         current_user = get_username() or "yourname"
         other_participants = [
-            h for h in self.conversation.participant_handles if h != current_user
+            h for h in conversation.participant_handles if h != current_user
         ]
-        username = (
+        self._other_handle = (
             other_participants[0]
             if other_participants
-            else self.conversation.participant_handles[0]
-            if self.conversation.participant_handles
+            else conversation.participant_handles[0]
+            if conversation.participant_handles
             else "unknown"
         )
-        return (
-            f"@{username}\n  {self.conversation.last_message_preview}\n  {unread_text}"
-        )
+        self._rendered_base = f"@{self._other_handle}\n  {conversation.last_message_preview}\n  "
+
+    def render(self) -> str:
+        # Use Dracula Orange (#FFB86C) for the unread label; unread is the only
+        # part that changes while the item is on screen.
+        if self.conversation.unread:
+            return self._rendered_base + "[#FFB86C]unread[/]"
+        return self._rendered_base
 
     def on_click(self) -> None:
         """Handle click to open the conversation"""
         try:
-            # Get the other participant's username
-            current_user = get_username() or "yourname"
-            other_participants = [h for h in self.conversation.participant_handles if h != current_user]
-            username = other_participants[0] if other_participants else self.conversation.participant_handles[0] if self.conversation.participant_handles else "unknown"
-
-            # Find the ConversationsList parent
-            conv_list = self.parent
-            if isinstance(conv_list, ConversationsList):
-                # Find which index this conversation is
-                items = list(conv_list.query(".conversation-item"))
-                try:
-                    index = items.index(self)
-                    conv_list.selected_position = index
-                    conv_list.cursor_position = index
-                except ValueError:
-                    pass
+            username = self._other_handle
 
-            # Get MessagesScreen parent container
-            messages_screen = self.parent
-            while messages_screen is not None:
-                if isinstance(messages_screen, MessagesScreen):
-                    break
-                messages_screen = messages_screen.parent
+            conv_list = self._list_ref
+            if conv_list is not None and self._index >= 0:
+                conv_list.selected_position = self._index
+                conv_list.cursor_position = self._index
+            else:
+                # Find the ConversationsList parent
+                conv_list = self.parent
+                if isinstance(conv_list, ConversationsList):
+                    # Find which index this conversation is
+                    items = list(conv_list.query(".conversation-item"))
+                    try:
+                        index = items.index(self)
+                        conv_list.selected_position = index
+                        conv_list.cursor_position = index
+                    except ValueError:
+                        pass
+
+            # Get MessagesScreen parent container (resolved once per item)
+            messages_screen = self._messages_screen
+            if messages_screen is None:
+                messages_screen = self.parent
+                while messages_screen is not None:
+                    if isinstance(messages_screen, MessagesScreen):
+                        break
+                    messages_screen = messages_screen.parent
+                self._messages_screen = messages_screen
 
             if isinstance(messages_screen, MessagesScreen):
                 messages_screen._open_chat_view(self.conversation.id, username)
@@ -1494,6 +1767,15 @@ class ChatMessage(Static):
         return f"{self.message.content}\n{format_time_ago(self.message.created_at)}"
 
 
+@functools.lru_cache(maxsize=64)
+def _video_dir_exists(path: str) -> bool:
+    """Whether a video frames directory exists; cached since frame dirs are static."""
+    try:
+        return Path(path).exists()
+    except OSError:
+        return False
+
+
 class PostItem(Static):
     """Simple non-interactive post display."""
 
@@ -1508,6 +1790,15 @@ class PostItem(Static):
         self.post = post
         self.reposted_by_you = reposted_by_you
         self.has_video = hasattr(post, "video_path") and post.video_path
+        # Resolve the frames dir once (cached per path) rather than stat'ing in compose
+        self._video_ok = bool(self.has_video) and _video_dir_exists(str(post.video_path))
+        # Stats repaint is coalesced: watchers mark dirty, one flush per refresh
+        self._stats_dirty = False
+        self._stats_widget_cache: Optional[Static] = None
+        # Last state the like/repost watchers acted on; a write that repeats
+        # it (e.g. a server sync re-applying current state) is ignored.
+        self._last_like_state = bool(getattr(post, "liked_by_user", False))
+        self._last_repost_state = False
 
         # Initialize reactive counters from the post model
         try:
@@ -1522,14 +1813,28 @@ class PostItem(Static):
             self.repost_count = 0
             self.comment_count = 0
 
-        # Check for ASCII art attachments in both the post.attachments property and dict
+        # Check for ASCII art attachments in both the post.attachments property and dict.
+        # One pass collects what compose/_fill_image_placeholders need:
+        # ("ascii_photo", content) / ("image_url", url) pairs with a non-empty value.
+        self.has_ascii_art = False
+        self._art_items: List[tuple] = []
+        self._image_urls: List[str] = []
         attachments = getattr(post, "attachments", None)
         if isinstance(attachments, list):
-            self.has_ascii_art = any(
-                att.get("type") in ("ascii_photo", "image_url") for att in attachments
-            )
-        else:
-            self.has_ascii_art = False
+            for att in attachments:
+                att_type = att.get("type")
+                if att_type == "ascii_photo":
+                    self.has_ascii_art = True
+                    value = att.get("content")
+                elif att_type == "image_url":
+                    self.has_ascii_art = True
+                    value = att.get("url")
+                    if value:
+                        self._image_urls.append(value)
+                else:
+                    continue
+                if value:
+                    self._art_items.append((att_type, value))
 
     def compose(self) -> ComposeResult:
         """Compose compact post."""
@@ -1552,24 +1857,20 @@ class PostItem(Static):
 
         # Display ASCII art attachments
         if self.has_ascii_art:
-            attachments = getattr(self.post, "attachments", [])
-            for i, attachment in enumerate(attachments):
-                att_type = attachment.get("type", "")
+            for att_type, value in self._art_items:
                 if att_type == "ascii_photo":
-                    art_content = attachment.get("content", "")
-                    if art_content:
-                        yield Static("\n", markup=False)
-                        yield Static(art_content, classes="ascii-art", markup=False)
-                        yield Static("\n", markup=False)
-                elif att_type == "image_url":
-                    url = attachment.get("url", "")
-                    if url:
-                        # Empty placeholder; filled after layout in on_mount
-                        yield Static("⠀", classes="ascii-art art-placeholder", markup=False)
+                    yield Static("\n", markup=False)
+                    yield Static(value, classes="ascii-art", markup=False)
+                    yield Static("\n", markup=False)
+                else:
+                    # Empty placeholder; filled after layout in on_mount
+                    yield Static("⠀", classes="ascii-art art-placeholder", markup=False)
             yield Static("[o] open", classes="image-open-hint", markup=False)
 
         # Video player if post has video
-        if self.has_video and Path(self.post.video_path).exists():
+        if self._video_ok:
+            from .ascii_video_widget import ASCIIVideoPlayer
+
             yield ASCIIVideoPlayer(
                 frames_dir=self.post.video_path,
                 fps=getattr(self.post, "video_fps", 2),
@@ -1587,12 +1888,12 @@ class PostItem(Static):
 
     def on_mount(self) -> None:
         """After mount, render images at actual widget width."""
-        if self.has_ascii_art:
+        if self._image_urls:
             self.call_after_refresh(self._fill_image_placeholders)
 
     def on_resize(self) -> None:
         """Re-render images when the widget is resized (terminal zoom change)."""
-        if self.has_ascii_art:
+        if self._image_urls:
             self.call_after_refresh(self._fill_image_placeholders)
 
     def on_mouse_enter(self) -> None:
@@ -1621,18 +1922,10 @@ class PostItem(Static):
         # self.size.width is the PostItem's own laid-out column count
         w = self.size.width
         cols = max(20, w - 4) if w > 10 else 50
-        attachments = getattr(self.post, "attachments", [])
         placeholders = list(self.query(".art-placeholder"))
-        idx = 0
-        for attachment in attachments:
-            if attachment.get("type") != "image_url":
-                continue
-            url = attachment.get("url", "")
-            if not url or idx >= len(placeholders):
-                continue
+        for placeholder, url in zip(placeholders, self._image_urls):
             art = _render_image_url(url, self.app, cols=cols)
-            placeholders[idx].update(Text(art))
-            idx += 1
+            placeholder.update(Text(art))
 
     def watch_has_class(self, has_class: bool) -> None:
         """Watch for class changes to handle cursor"""
@@ -1648,7 +1941,9 @@ class PostItem(Static):
     def _update_stats_widget(self) -> None:
         """Update the post-stats Static text if mounted."""
         try:
-            stats_widget = self.query_one(".post-stats", Static)
+            stats_widget = self._stats_widget_cache
+            if stats_widget is None:
+                stats_widget = self._stats_widget_cache = self.query_one(".post-stats", Static)
             like_symbol = "❤️" if self.liked_by_user else "🤍"
             # repost_symbol = "Reposts"  # HIDDEN: reposts feature
             
@@ -1656,6 +1951,7 @@ class PostItem(Static):
                 
             stats_widget.update(stats_text)
         except Exception:
+            self._stats_widget_cache = None
             # If not found, force a refresh as fallback
             self.refresh()
             try:
@@ -1663,8 +1959,27 @@ class PostItem(Static):
             except Exception:
                 pass
 
+    def _schedule_stats_flush(self) -> None:
+        """Repaint stats once after this refresh, however many reactives fired."""
+        if self._stats_dirty:
+            return
+        self._stats_dirty = True
+        try:
+            self.call_after_refresh(self._flush_stats)
+        except Exception:
+            self._flush_stats()
+
+    def _flush_stats(self) -> None:
+        if not self._stats_dirty:
+            return
+        self._stats_dirty = False
+        self._update_stats_widget()
+
     def watch_liked_by_user(self, liked: bool) -> None:
         """Update like count when liked_by_user changes"""
+        if liked == self._last_like_state:
+            return
+        self._last_like_state = liked
         if liked:
             self.like_count += 1
         else:
@@ -1675,10 +1990,13 @@ class PostItem(Static):
             self.post.likes = self.like_count
         except Exception:
             pass
-        self._update_stats_widget()
+        self._schedule_stats_flush()
 
     def watch_reposted_by_user(self, reposted: bool) -> None:
         """Update repost count when reposted_by_user changes"""
+        if reposted == self._last_repost_state:
+            return
+        self._last_repost_state = reposted
         if reposted:
             self.repost_count += 1
         else:
@@ -1688,7 +2006,7 @@ class PostItem(Static):
             self.post.reposts = self.repost_count
         except Exception:
             pass
-        self._update_stats_widget()
+        self._schedule_stats_flush()
 
     def watch_comment_count(self, new: int) -> None:
         """Update UI when the comment_count reactive value changes."""
@@ -1698,7 +2016,7 @@ class PostItem(Static):
         except Exception:
             pass
         # Refresh the visible stats
-        self._update_stats_widget()
+        self._schedule_stats_flush()
 
     def on_click(self) -> None:
         """Handle click to open comment screen"""
@@ -1758,29 +2076,34 @@ class PostItem(Static):
         except Exception:
             pass
 
+# Notification type -> headline template (filled with the actor handle)
+_NOTIFICATION_HEADLINES = {
+    "mention": "📢 @{} mentioned you",
+    "like": "❤️  @{} liked your post",
+    "comment_like": "❤️  @{} liked your comment",
+    "repost": "🔁 @{} reposted your post",
+    "follow": "@{} started following you",
+    "comment": "💬 @{} commented on your post",
+}
+
+
 class NotificationItem(Static):
     def __init__(self, notification, **kwargs):
         super().__init__(**kwargs)
         self.notification = notification
+        # Everything except the relative time is fixed for a notification
+        n = notification
+        self._headline = _NOTIFICATION_HEADLINES.get(n.type, "🔵 @{}").format(n.actor)
+        if n.type == "follow":
+            self._detail = ""
+        else:
+            # Truncate content preview to keep items compact
+            preview = (n.content[:80] + "…") if n.content and len(n.content) > 80 else (n.content or "")
+            self._detail = f"\n   ↳ \"{preview}\""
 
     def render(self) -> str:
         t = format_time_ago(self.notification.timestamp)
-        n = self.notification
-        # Truncate content preview to keep items compact
-        preview = (n.content[:80] + "…") if n.content and len(n.content) > 80 else (n.content or "")
-        if n.type == "mention":
-            return f"📢 @{n.actor} mentioned you  •  {t}\n   ↳ \"{preview}\""
-        if n.type == "like":
-            return f"❤️  @{n.actor} liked your post  •  {t}\n   ↳ \"{preview}\""
-        if n.type == "comment_like":
-            return f"❤️  @{n.actor} liked your comment  •  {t}\n   ↳ \"{preview}\""
-        if n.type == "repost":
-            return f"🔁 @{n.actor} reposted your post  •  {t}\n   ↳ \"{preview}\""
-        if n.type == "follow":
-            return f"@{n.actor} started following you  •  {t}"
-        if n.type == "comment":
-            return f"💬 @{n.actor} commented on your post  •  {t}\n   ↳ \"{preview}\""
-        return f"🔵 @{n.actor}  •  {t}\n   ↳ \"{preview}\""
+        return f"{self._headline}  •  {t}{self._detail}"
 
 # ───────── Top Navbar ─────────
 
@@ -1819,24 +2142,30 @@ class TopNav(Horizontal):
         self.current = current
         # Compatibility shim: external code calls self.tabs.focus()
         self.tabs = self
+        # screen_name -> NavTab, filled on mount; the tab set never changes
+        self._tabs_by_screen: Dict[str, "NavTab"] = {}
+        self._active_tab: Optional["NavTab"] = None
 
     def compose(self) -> ComposeResult:
         for label, screen_name in self._TABS:
             yield NavTab(label, screen_name, id=f"tab-{screen_name}", classes="nav-tab")
 
     def on_mount(self) -> None:
+        self._tabs_by_screen = {tab.screen_name: tab for tab in self.query(NavTab)}
         self.update_active(self.current)
 
     def update_active(self, screen_name: str) -> None:
-        """Highlight the tab matching screen_name; clear all others."""
+        """Highlight the tab matching screen_name; clear the previous one."""
         self.current = screen_name
-        for tab in self.query(".nav-tab"):
-            tab.remove_class("nav-tab-active")
-        if screen_name not in ("drafts", "profile", "user_profile"):
-            try:
-                self.query_one(f"#tab-{screen_name}", NavTab).add_class("nav-tab-active")
-            except Exception:
-                pass
+        # Screens without a tab (drafts, profile, user_profile) clear the highlight
+        tab = self._tabs_by_screen.get(screen_name)
+        if tab is self._active_tab:
+            return
+        if self._active_tab is not None:
+            self._active_tab.remove_class("nav-tab-active")
+        if tab is not None:
+            tab.add_class("nav-tab-active")
+        self._active_tab = tab
 
     def focus(self, scroll_visible: bool = True):
         """Focus the active tab (or first tab) for keyboard navigation."""
@@ -1852,6 +2181,36 @@ class TopNav(Horizontal):
 # ───────── Sidebar ─────────
 
 
+_POST_FEED_COMMANDS = (
+    (":n", "new post"),
+    (":l", "like"),
+    (":del", "delete post/comment"),
+    ("\\[Enter]", "comments"),
+)
+
+# Screen-specific sidebar commands (shown above the global ones)
+_SCREEN_COMMANDS = {
+    "messages": ((":m", "dm user"),),
+    "timeline": _POST_FEED_COMMANDS,
+    "discover": _POST_FEED_COMMANDS,
+    "following": _POST_FEED_COMMANDS,
+    "profile": (
+        (":f", "follow"),
+        (":uf", "unfollow"),
+        # Allow liking/deleting directly from profile posts
+        (":l", "like"),
+        (":del", "delete post/comment"),
+        ("\\[Enter]", "comments"),
+    ),
+}
+
+# Global profile commands (always visible)
+_COMMON_COMMANDS = (
+    (":@user", "profile"),
+    (":@", "profile (under cursor)"),
+)
+
+
 class Sidebar(VerticalScroll):
     current_screen = reactive("timeline")
 
@@ -1859,6 +2218,8 @@ class Sidebar(VerticalScroll):
         super().__init__(**kwargs)
         self.current_screen = current
         self.show_nav = show_nav
+        # Navigation items never change after compose; queried once on first use
+        self._nav_items: Optional[list] = None
 
     def compose(self) -> ComposeResult:
         profile_container = Container(classes="profile-box")
@@ -1889,42 +2250,25 @@ class Sidebar(VerticalScroll):
         commands_container.border_title = "Commands"
         with commands_container:
             # Show only screen-specific commands to save space
-            if self.current_screen == "messages":
-                yield CommandItem(":m", "dm user", classes="command-item")
-            elif self.current_screen in ("timeline", "discover"):
-                yield CommandItem(":n", "new post", classes="command-item")
-                yield CommandItem(":l", "like", classes="command-item")
-                yield CommandItem(":del", "delete post/comment", classes="command-item")
-                yield CommandItem("\\[Enter]", "comments", classes="command-item")
-            elif self.current_screen == "notifications":
-                pass
-            elif self.current_screen == "profile":
-                yield CommandItem(":f", "follow", classes="command-item")
-                yield CommandItem(":uf", "unfollow", classes="command-item")
-                # Allow liking/deleting directly from profile posts
-                yield CommandItem(":l", "like", classes="command-item")
-                yield CommandItem(":del", "delete post/comment", classes="command-item")
-                yield CommandItem("\\[Enter]", "comments", classes="command-item")
-            elif self.current_screen == "following":
-                yield CommandItem(":n", "new post", classes="command-item")
-                yield CommandItem(":l", "like", classes="command-item")
-                yield CommandItem(":del", "delete post/comment", classes="command-item")
-                yield CommandItem("\\[Enter]", "comments", classes="command-item")
-                
+            for shortcut, description in _SCREEN_COMMANDS.get(self.current_screen, ()):
+                yield CommandItem(shortcut, description, classes="command-item")
+
             # Spacing (only when screen-specific commands were shown above)
             if self.current_screen not in ("settings", "drafts", "notifications"):
                 yield Static("", classes="command-item")
-                
-            # Global profile commands (always visible)
-            yield CommandItem(":@user", "profile", classes="command-item")
-            yield CommandItem(":@", "profile (under cursor)", classes="command-item")
+
+            for shortcut, description in _COMMON_COMMANDS:
+                yield CommandItem(shortcut, description, classes="command-item")
 
         yield commands_container
 
     def update_active(self, screen_name: str):
         self.current_screen = screen_name
-        for nav_item in self.query(".nav-item"):
+        if self._nav_items is None:
+            self._nav_items = list(self.query(".nav-item"))
+        for nav_item in self._nav_items:
             try:
+                # set_active is a no-op for items whose state doesn't change
                 nav_item.set_active(nav_item.screen_name == screen_name)
             except Exception:
                 pass
@@ -1934,24 +2278,34 @@ class Sidebar(VerticalScroll):
         try:
             # Find drafts container by class
             drafts_container = self.query_one(".drafts-box", Container)
-            # Remove all draft items
-            for item in drafts_container.query(".draft-item, .no-drafts-text"):
-                item.remove()
+            mounted = list(drafts_container.query(DraftItem))
+            placeholders = list(drafts_container.query(".no-drafts-text"))
 
-            # Add updated drafts
             drafts = getattr(self.app, "drafts_store", None)
             if drafts is None:
                 drafts = load_drafts()
-            if drafts:
-                # Show most recent first
-                for i, draft in enumerate(reversed(drafts)):
+            if not drafts:
+                for item in mounted:
+                    item.remove()
+                if not placeholders:
                     drafts_container.mount(
-                        DraftItem(draft, len(drafts) - 1 - i, classes="draft-item")
+                        Static("No drafts\n\nSave a post to see it here.", classes="no-drafts-text")
                     )
-            else:
-                drafts_container.mount(
-                    Static("No drafts\n\nSave a post to see it here.", classes="no-drafts-text")
-                )
+                return
+
+            for item in placeholders:
+                item.remove()
+            # Show most recent first; reuse mounted items and only repaint the
+            # ones whose draft or slot changed
+            n = len(drafts)
+            wanted = [(drafts[n - 1 - i], n - 1 - i) for i in range(n)]
+            for item, (draft, index) in zip(mounted, wanted):
+                if item.draft_index != index or item.draft != draft:
+                    item.update_draft(draft, index)
+            for item in mounted[n:]:
+                item.remove()
+            for draft, index in wanted[len(mounted):]:
+                drafts_container.mount(DraftItem(draft, index, classes="draft-item"))
         except Exception as e:
             print(f"Error refreshing drafts: {e}")
 
@@ -1989,7 +2343,7 @@ def image_to_braille_art(file_path: str, cols: int = 80, max_rows: int = None) -
         term_h = shutil.get_terminal_size((80, 30)).lines
         max_rows = max(10, int((term_h - 15) * 0.6))
 
-    img = _Image.open(file_path).convert("L")  # grayscale
+    img = _Image.open(file_path)
     aspect = img.height / img.width if img.width else 1
     rows = max(1, int(cols * aspect * 0.5))
 
@@ -1998,36 +2352,87 @@ def image_to_braille_art(file_path: str, cols: int = 80, max_rows: int = None) -
         cols = max(2, int(rows / (aspect * 0.5)))
 
     px_w, px_h = cols * 2, rows * 4
-    img = img.resize((px_w, px_h), _Image.LANCZOS)
-    pixels = img.load()
+    # Let the JPEG decoder downscale while decoding (no-op for other
+    # formats); the target is tiny compared to camera-sized photos
+    try:
+        img.draft("L", (px_w, px_h))
+    except Exception:
+        pass
+    img = img.convert("L")  # grayscale
+    # reducing_gap box-reduces first so LANCZOS only runs on a small image
+    img = img.resize((px_w, px_h), _Image.LANCZOS, reducing_gap=2.0)
 
-    # Adaptive threshold: mean brightness of the resized image
-    total = sum(pixels[x, y] for y in range(px_h) for x in range(px_w))
+    try:
+        import numpy as np
+    except ImportError:  # numpy ships with the optional 'video' extra
+        np = None
+    if np is not None:
+        return _braille_from_gray_numpy(np, img, rows, cols)
+
+    # Adaptive threshold: mean brightness of the resized image, taken from
+    # the histogram so no pixel is read from Python
+    total = sum(v * n for v, n in enumerate(img.histogram()))
     threshold = total / (px_w * px_h)
 
-    # Braille Unicode dot-to-bit layout for a 2×4 block:
-    #   col=0 rows 0-2 → bits 0-2; row 3 → bit 6
-    #   col=1 rows 0-2 → bits 3-5; row 3 → bit 7
-    BIT = [[0, 1, 2, 6], [3, 4, 5, 7]]
+    # Threshold inside Pillow's C core, then read the whole 0/1 buffer once
+    raw = img.point([1 if v >= threshold else 0 for v in range(256)]).tobytes()
 
     lines = []
     for row in range(rows):
-        line = ""
-        for col in range(cols):
-            code = 0
-            for dc in range(2):
-                for dr in range(4):
-                    px = col * 2 + dc
-                    py = row * 4 + dr
-                    if px < px_w and py < px_h and pixels[px, py] >= threshold:
-                        code |= (1 << BIT[dc][dr])
-            line += chr(0x2800 + code)
+        base = row * 4 * px_w
+        # Each dot position of a cell row is a strided slice of one scanline
+        # (one byte per cell). translate() turns its 0/1 bytes into 0/mask,
+        # and since the masks are disjoint bits, OR-ing the slices as big
+        # integers packs every cell's code at once, all in C.
+        packed = 0
+        for dc, dr, mask in _BRAILLE_DOTS:
+            start = base + dr * px_w + dc
+            dots = raw[start:start + px_w:2].translate(_BRAILLE_DOT_TABLES[mask])
+            packed |= int.from_bytes(dots, "big")
+        codes = packed.to_bytes(cols, "big")
+        # latin-1 maps bytes 1:1 to code points 0-255 for the glyph table
+        line = codes.decode("latin-1").translate(_BRAILLE_CHARS)
         # Strip trailing empty braille cells (U+2800 == \u2800)
         # Rich treats them as whitespace and wraps lines at them
         lines.append(line.rstrip('\u2800') or '\u2800')
     return "\n".join(lines)
 
 
+# Braille Unicode dot-to-bit layout for a 2×4 block:
+#   col=0 rows 0-2 → bits 0-2; row 3 → bit 6
+#   col=1 rows 0-2 → bits 3-5; row 3 → bit 7
+# Stored as (dx, dy, mask) so the per-cell loop does no shifting or indexing.
+_BRAILLE_DOTS = tuple(
+    (dc, dr, 1 << bit)
+    for dc, bits in enumerate(((0, 1, 2, 6), (3, 4, 5, 7)))
+    for dr, bit in enumerate(bits)
+)
+# All 256 braille glyphs, indexed by dot mask
+_BRAILLE_CHARS = tuple(chr(0x2800 + code) for code in range(256))
+# bytes.translate tables mapping a thresholded 0/1 pixel to its dot mask
+_BRAILLE_DOT_TABLES = {
+    mask: bytes((0, mask)) + bytes(254) for _, _, mask in _BRAILLE_DOTS
+}
+# Braille dot weights indexed [row-in-cell][col-in-cell]
+_BRAILLE_WEIGHTS = ((1, 8), (2, 16), (4, 32), (64, 128))
+
+
+def _braille_from_gray_numpy(np, img, rows: int, cols: int) -> str:
+    """Vectorized body of image_to_braille_art for an already-resized "L" image."""
+    arr = np.asarray(img, dtype=np.uint8)
+    # Adaptive threshold: mean brightness of the resized image
+    on = arr >= arr.mean()
+    # (rows*4, cols*2) -> (rows, 4, cols, 2): one 2x4 braille cell per (row, col)
+    cells = on.reshape(rows, 4, cols, 2)
+    weights = np.array(_BRAILLE_WEIGHTS, dtype=np.uint16).reshape(1, 4, 1, 2)
+    codes = (cells * weights).sum(axis=(1, 3))
+    lut = np.array(_BRAILLE_CHARS)
+    # Strip trailing empty braille cells (U+2800); Rich wraps lines at them
+    return "\n".join(
+        "".join(row).rstrip("\u2800") or "\u2800" for row in lut[codes].tolist()
+    )
+
+
 def _render_image_url(url: str, app=None, cols: int = None, max_rows: int = None) -> str:
     """Download an image from a URL and render it as braille art at the viewer's terminal width.
 
@@ -2084,6 +2489,9 @@ class NewPostDialog(ModalScreen):
         self.draft_attachments = draft_attachments or []
         self.draft_index = draft_index
         self.in_insert_mode = True  # Start in insert mode (textarea focused)
+        self._nav_buttons = None  # resolved once by _get_navigable_buttons
+        self._submitting = False  # a publish/save worker is in flight
+        self._cursor_was_in_nav = False  # last _update_cursor ran in navigation mode
 
     def compose(self) -> ComposeResult:
         with Container(id="new-post-wrapper"):
@@ -2113,7 +2521,10 @@ class NewPostDialog(ModalScreen):
 
     def on_mount(self) -> None:
         """Focus the textarea when dialog opens."""
-        textarea = self.query_one("#post-textarea", TextArea)
+        # Widgets touched on every status update/keystroke, resolved once
+        self._textarea = textarea = self.query_one("#post-textarea", TextArea)
+        self._attachments_widget = self.query_one("#attachments-list", Static)
+        self._status_widget = self.query_one("#status-message", Static)
 
         # Load draft content if provided
         if self.draft_content:
@@ -2150,12 +2561,7 @@ class NewPostDialog(ModalScreen):
             return
 
         try:
-            try:
-                _cols = self.query_one("#post-textarea").size.width
-                if not _cols or _cols < 20:
-                    raise ValueError
-            except Exception:
-                _cols = max(40, (self.size.width or 80) - 12)
+            _cols = self._preview_cols()
 
             local_path = getattr(self, "_local_image_path", None)
 
@@ -2179,43 +2585,58 @@ class NewPostDialog(ModalScreen):
         except Exception:
             pass
 
+    def _preview_cols(self) -> int:
+        """Width available for braille previews inside the dialog."""
+        try:
+            _cols = self._textarea.size.width
+            if not _cols or _cols < 20:
+                raise ValueError
+        except Exception:
+            _cols = max(40, (self.size.width or 80) - 12)
+        return _cols
+
     def _restore_preview_art(self, url: str) -> None:
         """Fetch and render the draft image preview after the layout passes."""
         try:
-            try:
-                _cols = self.query_one("#post-textarea").size.width
-                if not _cols or _cols < 20:
-                    raise ValueError
-            except Exception:
-                _cols = max(40, (self.size.width or 80) - 12)
+            _cols = self._preview_cols()
             self._preview_art = _render_image_url(url, app=self.app, cols=_cols)
             self._update_attachments_display()
         except Exception:
             pass
 
     def _get_navigable_buttons(self) -> list:
-        """Get list of all navigable buttons in order."""
-        buttons = []
-        try:
-            # Media button
-            buttons.append(self.query_one("#attach-photo", Button))
-            # Action buttons
-            buttons.append(self.query_one("#post-button", Button))
-            buttons.append(self.query_one("#draft-button", Button))
-            buttons.append(self.query_one("#cancel-button", Button))
-        except:
-            pass
-        return buttons
+        """Get list of all navigable buttons in order.
+
+        The buttons are static for the dialog's lifetime, so they are queried
+        once and reused on every cursor move.
+        """
+        if self._nav_buttons is None:
+            try:
+                # Media button, then action buttons
+                self._nav_buttons = [
+                    self.query_one(f"#{btn_id}", Button)
+                    for btn_id in ("attach-photo", "post-button", "draft-button", "cancel-button")
+                ]
+            except Exception:
+                return []
+        return self._nav_buttons
 
     def _update_cursor(self) -> None:
         """Update visual cursor position."""
+        # Insert mode only needs work on the way in from navigation mode:
+        # buttons are already clear and the textarea already has focus
+        # (refocusing it again can reset IME state)
+        if self.in_insert_mode and not self._cursor_was_in_nav:
+            return
+        self._cursor_was_in_nav = not self.in_insert_mode
+
         buttons = self._get_navigable_buttons()
 
         # Remove vim-cursor from all buttons
         for btn in buttons:
             btn.remove_class("vim-cursor")
 
-        textarea = self.query_one("#post-textarea", TextArea)
+        textarea = self._textarea
 
         if self.in_insert_mode:
             # In insert mode, textarea has focus
@@ -2370,57 +2791,26 @@ class NewPostDialog(ModalScreen):
                     self._show_status("Native file picker is unavailable on this system.")
                     return
 
-                root = _tk.Tk()
-                root.withdraw()
+                root = _get_tk_root(_tk)
                 file_path = _filedialog.askopenfilename(
+                    parent=root,
                     title="Select an image",
                     filetypes=[("Image files", "*.png *.jpg *.jpeg *.gif *.bmp")],
                 )
-                root.destroy()
+                root.update()  # let Tk tear down the dialog window
                 if not file_path:
                     return
 
                 self._local_image_path = file_path
 
+                # Remove any existing photo attachment so we only keep one image
                 try:
-                    # Remove any existing photo attachment so we only keep one image
-                    try:
-                        self._attachments = [a for a in getattr(self, "_attachments", []) if not (a and a[0] in ("photo", "ascii_photo", "image_url"))]
-                    except Exception:
-                        self._attachments = []
-
-                    # Try to upload to R2 first for viewer-side adaptive rendering
-                    _uploaded = False
-                    try:
-                        self._show_status("Uploading image...")
-                        _url = api.upload_image(file_path)
-                        self._attachments.append(("image_url", _url))
-                        # Generate local braille preview for the compose dialog
-                        try:
-                            try:
-                                _cols = self.query_one("#post-textarea").size.width
-                                if not _cols or _cols < 20:
-                                    raise ValueError
-                            except Exception:
-                                _cols = max(40, (self.size.width or 80) - 12)
-                            self._preview_art = image_to_braille_art(file_path, cols=_cols)
-                        except Exception:
-                            self._preview_art = None
-                        self._update_attachments_display()
-                        self._show_status("✓ Photo uploaded!")
-                        _uploaded = True
-                    except Exception as _upload_err:
-                        pass
-
-                    if not _uploaded:
-                        # Fall back to local braille conversion at fixed width
-                        ascii_art = image_to_braille_art(file_path, cols=80)
-                        self._attachments.append(("ascii_photo", ascii_art))
-                        self._update_attachments_display()
-                        self._show_status("✓ Photo converted to ASCII!")
+                    self._attachments = [a for a in getattr(self, "_attachments", []) if not (a and a[0] in ("photo", "ascii_photo", "image_url"))]
+                except Exception:
+                    self._attachments = []
 
-                except Exception as e:
-                    self._show_status(f"Warning: Error converting image: {str(e)}", error=True)
+                # Size the compose preview now; widgets can't be queried off-thread
+                self._attach_photo(file_path, self._preview_cols())
             except Exception as e:
                 self._show_status(f"Warning: Error: {str(e)}", error=True)
 
@@ -2435,7 +2825,9 @@ class NewPostDialog(ModalScreen):
 
     def _handle_post(self) -> None:
         """Handle posting the content."""
-        textarea = self.query_one("#post-textarea", TextArea)
+        if self._submitting:
+            return
+        textarea = self._textarea
         content = textarea.text.strip()
 
         if not content and not self._attachments:
@@ -2454,47 +2846,38 @@ class NewPostDialog(ModalScreen):
             else:
                 attachments.append({"type": t, "path": p})
 
-        # Call API to create post with attachments properly set
+        # Call API to create post with attachments properly set; the payload
+        # goes over as-is, no intermediate JSON string
+        self._submitting = True
+        self._publish_post({"content": content, "attachments": attachments})
+
+    @work(thread=True, exclusive=True, group="compose-submit")
+    def _publish_post(self, payload: dict) -> None:
+        """Create the post off the UI thread so the dialog stays responsive."""
         try:
-            # Create post with attachment data included in content
-            post_data = {"content": content, "attachments": attachments}
-            new_post = api.create_post(json.dumps(post_data, ensure_ascii=False))
+            api.create_post(payload)
+        except Exception as e:
+            self.app.call_from_thread(self._on_submit_failed, e)
+            return
+        self.app.call_from_thread(self._on_post_published)
 
-            self._show_status("✓ Post published successfully!")
-            try:
-                self.app.notify("Post published!", severity="success")
-            except:
-                pass
-            self.dismiss(True)
-        except TypeError:
-            # If first attempt fails, try direct API call with attachments
-            try:
-                new_post = api.create_post(content)  # Simple post without attachments
-                setattr(
-                    new_post, "attachments", attachments
-                )  # Add attachments after creation
-                self._show_status("✓ Post published successfully!")
-                try:
-                    self.app.notify("Post published!", severity="success")
-                except:
-                    pass
-                self.dismiss(True)
-            except Exception as e:
-                # Fallback without attachments
-                try:
-                    new_post = api.create_post(content)
-                    self._show_status("✓ Post published (without attachments)")
-                    try:
-                        self.app.notify("Post published!", severity="warning")
-                    except:
-                        pass
-                    self.dismiss(True)
-                except Exception as e:
-                    self._show_status(f"Warning: Error: {str(e)}", error=True)
+    def _on_post_published(self) -> None:
+        self._show_status("✓ Post published successfully!")
+        try:
+            self.app.notify("Post published!", severity="success")
+        except:
+            pass
+        self.dismiss(True)
+
+    def _on_submit_failed(self, e: Exception) -> None:
+        self._submitting = False
+        self._show_status(f"Warning: Error: {str(e)}", error=True)
 
     def _handle_save_draft(self) -> None:
         """Handle saving the post as a draft."""
-        textarea = self.query_one("#post-textarea", TextArea)
+        if self._submitting:
+            return
+        textarea = self._textarea
         content = textarea.text.strip()
 
         if not content and not self._attachments:
@@ -2504,35 +2887,85 @@ class NewPostDialog(ModalScreen):
         self._show_status("Saving draft...")
 
         # Save draft using the add_draft function
+        self._submitting = True
+        self._save_draft(content, list(self._attachments), getattr(self, "draft_index", None))
+
+    @work(thread=True, exclusive=True, group="compose-submit")
+    def _save_draft(self, content: str, attachments: list, draft_index) -> None:
+        """Write the draft file off the UI thread."""
         try:
             # If editing an existing draft, overwrite it; otherwise add a new draft
-            if getattr(self, "draft_index", None) is not None:
-                update_draft(self.draft_index, content, self._attachments)
+            if draft_index is not None:
+                update_draft(draft_index, content, attachments)
             else:
-                add_draft(content, self._attachments)
-            self._show_status("✓ Draft saved!")
-            try:
-                self.app.notify("Draft saved successfully!", severity="success")
-            except:
-                # Ignore notification errors but continue to update drafts
-                pass
-            # Refresh the App-level drafts store so UI updates instantly
+                add_draft(content, attachments)
+        except Exception as e:
+            self.app.call_from_thread(self._on_submit_failed, e)
+            return
+        self.app.call_from_thread(self._on_draft_saved)
+
+    def _on_draft_saved(self) -> None:
+        self._show_status("✓ Draft saved!")
+        try:
+            self.app.notify("Draft saved successfully!", severity="success")
+        except:
+            # Ignore notification errors but continue to update drafts
+            pass
+        # Refresh the App-level drafts store so UI updates instantly
+        try:
+            if hasattr(self.app, "refresh_drafts_store"):
+                self.app.refresh_drafts_store()
+            else:
+                self.app.post_message(DraftsUpdated())
+        except Exception:
+            pass
+        self.dismiss(False)
+
+    @work(thread=True, exclusive=True, group="attach-photo")
+    def _attach_photo(self, file_path: str, cols: int) -> None:
+        """Upload and decode a picked image off the UI thread."""
+        call = self.app.call_from_thread
+        # Try to upload to R2 first for viewer-side adaptive rendering
+        try:
+            call(self._show_status, "Uploading image...")
+            _url = api.upload_image(file_path)
+            # Generate local braille preview for the compose dialog
             try:
-                if hasattr(self.app, "refresh_drafts_store"):
-                    self.app.refresh_drafts_store()
-                else:
-                    self.app.post_message(DraftsUpdated())
+                preview = image_to_braille_art(file_path, cols=cols)
             except Exception:
-                pass
-            self.dismiss(False)
+                preview = None
+            call(self._apply_photo, ("image_url", _url), "✓ Photo uploaded!", preview)
+            return
+        except Exception:
+            pass
+
+        # Fall back to local braille conversion at fixed width
+        try:
+            ascii_art = image_to_braille_art(file_path, cols=80)
+            call(self._apply_photo, ("ascii_photo", ascii_art), "✓ Photo converted to ASCII!")
         except Exception as e:
-            self._show_status(f"Warning: Error: {str(e)}", error=True)
+            call(self._show_status, f"Warning: Error converting image: {str(e)}", True)
+
+    def _apply_photo(self, attachment: tuple, status: str, preview: str = None) -> None:
+        """Attach a processed photo (runs on the UI thread)."""
+        if attachment[0] == "image_url":
+            self._preview_art = preview
+        self._attachments.append(attachment)
+        self._update_attachments_display()
+        self._show_status(status)
 
     def _update_attachments_display(self) -> None:
         """Update the attachments display area."""
         from rich.text import Text
         try:
-            widget = self.query_one("#attachments-list", Static)
+            widget = self._attachments_widget
+            preview = getattr(self, "_preview_art", None)
+            # Braille previews run to thousands of characters; skip the
+            # re-render when nothing visible changed since the last update
+            snapshot = (tuple(self._attachments), preview)
+            if snapshot == getattr(self, "_last_attachments_snapshot", None):
+                return
+            self._last_attachments_snapshot = snapshot
             if not self._attachments:
                 widget.update(Text(""))
                 return
@@ -2541,7 +2974,6 @@ class NewPostDialog(ModalScreen):
                 if t == "ascii_photo":
                     lines.append(p)
                 elif t == "image_url":
-                    preview = getattr(self, "_preview_art", None)
                     if preview:
                         lines.append(preview)
                     else:
@@ -2557,14 +2989,18 @@ class NewPostDialog(ModalScreen):
     def _show_status(self, message: str, error: bool = False) -> None:
         """Show a status message."""
         try:
-            widget = self.query_one("#status-message", Static)
+            widget = self._status_widget
             if error:
                 widget.styles.color = "#ff4444"
             else:
                 widget.styles.color = "#4a9eff"
             widget.update(message)
-            # Clear status after 3 seconds
-            self.set_timer(3, lambda: widget.update(""))
+            # Clear status after 3 seconds; a newer message restarts the
+            # countdown instead of being blanked by an older timer
+            timer = getattr(self, "_status_timer", None)
+            if timer is not None:
+                timer.stop()
+            self._status_timer = self.set_timer(3, lambda: widget.update(""))
         except Exception:
             pass
 
@@ -2603,6 +3039,13 @@ class NewMessageDialog(ModalScreen):
                 yield open_btn
                 yield cancel_btn
 
+    def _get_action_buttons(self) -> list:
+        """Open/Cancel buttons, queried once and cached."""
+        btns = getattr(self, "_action_buttons", None)
+        if not btns:
+            btns = self._action_buttons = list(self.query("#action-buttons Button"))
+        return btns
+
     def on_mount(self) -> None:
         try:
             inp = self.query_one("#dm-username-input", Input)
@@ -2630,7 +3073,7 @@ class NewMessageDialog(ModalScreen):
             if getattr(self, "in_input", False):
                 self.in_input = False
                 # Focus the currently-selected button
-                btns = list(self.query("#action-buttons Button"))
+                btns = self._get_action_buttons()
                 if not btns:
                     return
                 sel = max(0, min(self.cursor_position, len(btns) - 1))
@@ -2667,20 +3110,15 @@ class NewMessageDialog(ModalScreen):
     def watch_cursor_position(self, old_position: int, new_position: int) -> None:
         """Update button selection visuals when cursor changes."""
         try:
-            btns = list(self.query("#action-buttons Button"))
-            for i, b in enumerate(btns):
-                if i == new_position:
-                    if "selected" not in b.classes:
-                        b.add_class("selected")
-                    if "vim-cursor" not in b.classes:
-                        b.add_class("vim-cursor")
-                else:
-                    if "selected" in b.classes:
-                        b.remove_class("selected")
-                    if "vim-cursor" in b.classes:
-                        b.remove_class("vim-cursor")
+            # Only the previously selected button can carry the classes
+            btns = self._get_action_buttons()
+            if 0 <= old_position < len(btns):
+                btns[old_position].remove_class("selected", "vim-cursor")
+            if 0 <= new_position < len(btns):
+                b = btns[new_position]
+                b.add_class("selected", "vim-cursor")
                 # ensure focus follows the selected button when not in input
-                if not getattr(self, "in_input", True) and i == new_position:
+                if not getattr(self, "in_input", True):
                     try:
                         b.focus()
                     except Exception:
@@ -2691,7 +3129,7 @@ class NewMessageDialog(ModalScreen):
     def watch_in_input(self, old: bool, new: bool) -> None:
         """When entering/exiting input mode, update button visuals accordingly."""
         try:
-            btns = list(self.query("#action-buttons Button"))
+            btns = self._get_action_buttons()
             if new:
                 # Entering input: remove selection visuals
                 for b in btns:
@@ -2784,6 +3222,8 @@ class DeleteDraftDialog(ModalScreen):
     def __init__(self, draft_index: int):
         super().__init__()
         self.draft_index = draft_index
+        self._confirm_btn = None
+        self._cancel_btn = None
 
     def on_mount(self) -> None:
         """Initialize selection"""
@@ -2817,7 +3257,12 @@ class DeleteDraftDialog(ModalScreen):
     def key_enter(self) -> None:
         """Execute the selected action"""
         if self.cursor_position == 0:
-            delete_draft(self.draft_index)
+            try:
+                delete_draft(self.draft_index)
+            except Exception as e:
+                self.app.notify(f"Failed to delete draft: {e}", severity="error")
+                self.dismiss(False)
+                return
             try:
                 self.app.notify("Draft deleted!", severity="success")
                 # Refresh in-memory store + broadcast so UI updates immediately
@@ -2852,15 +3297,14 @@ class DeleteDraftDialog(ModalScreen):
     def watch_cursor_position(self, old_position: int, new_position: int) -> None:
         """Update button styles based on cursor position"""
         try:
-            confirm_btn = self.query_one("#confirm-delete", Button)
-            cancel_btn = self.query_one("#cancel-delete", Button)
+            if self._confirm_btn is None:
+                self._confirm_btn = self.query_one("#confirm-delete", Button)
+                self._cancel_btn = self.query_one("#cancel-delete", Button)
+            btns = (self._confirm_btn, self._cancel_btn)
 
-            if new_position == 0:
-                confirm_btn.add_class("selected")
-                cancel_btn.remove_class("selected")
-            else:
-                cancel_btn.add_class("selected")
-                confirm_btn.remove_class("selected")
+            # 0 = Yes, anything else = Cancel; move the class old -> new only
+            btns[min(old_position, 1)].remove_class("selected")
+            btns[min(new_position, 1)].add_class("selected")
         except:
             pass
 
@@ -2870,7 +3314,12 @@ class DeleteDraftDialog(ModalScreen):
         btn_id = getattr(event.button, "id", None)
 
         if btn_id == "confirm-delete":
-            delete_draft(self.draft_index)
+            try:
+                delete_draft(self.draft_index)
+            except Exception as e:
+                self.app.notify(f"Failed to delete draft: {e}", severity="error")
+                self.dismiss(False)
+                return
             try:
                 self.app.notify("Draft deleted!", severity="success")
                 try:
@@ -2983,6 +3432,9 @@ class DeletePostDialog(ModalScreen):
             # Remove the post widget from the DOM
             if self.post_item is not None:
                 try:
+                    forget = getattr(self.post_item.parent, "_forget_post_item", None)
+                    if forget is not None:
+                        forget(self.post_item)
                     self.post_item.remove()
                 except Exception:
                     pass
@@ -3075,7 +3527,10 @@ class DeleteCommentDialog(ModalScreen):
             # Remove the comment widget from the DOM
             if self.comment_item is not None:
                 try:
+                    feed = self.comment_item.parent
                     self.comment_item.remove()
+                    if isinstance(feed, CommentFeed):
+                        feed._invalidate_nav()
                 except Exception:
                     pass
             self.dismiss(True)
@@ -3094,10 +3549,27 @@ class TimelineFeed(VerticalScroll):
     cursor_position = reactive(0)
     reposted_posts = reactive([])  # List of (post, timestamp) tuples
     scroll_y = reactive(0)  # Track scroll position
+    _scroll_timer = None  # Pending _commit_scroll, if any
     _all_posts = []  # Cache all posts locally
     _displayed_count = 20  # Number of posts currently displayed
     _batch_size = 20  # Number of posts to load at a time
     _loading_more = False  # Flag to prevent multiple simultaneous loads
+    _repost_count = 0  # Leading entries of _all_posts that are our reposts
+    _post_items = ()  # Mounted PostItems in display order (list once composed)
+    _last_cursor_widget = None  # PostItem currently carrying .vim-cursor
+    _virtual_h = 0  # Content height as of the last layout after a mount
+    _last_scroll_check = -1000  # scroll_y at the last load-more check
+    _page_size = 50  # Posts requested from the API per page
+    _api_count = 0  # Timeline posts fetched so far (offset of the next page)
+    _eof = True  # Set once the API returns a short page
+    _fetching_page = False  # A background page fetch is in flight
+    _page_wanted = False  # The user ran out of cached posts while a page was in flight
+    _header = None  # The "timeline.home | ..." Static
+    _unread_count = 0  # Posts from the last hour, for the header
+    _pending_cursor = None  # Cursor target not yet written to cursor_position
+    _cursor_commit_timer = None  # Pending _commit_cursor, if any
+    _load_more_queued = False  # A deferred _load_more_posts is scheduled
+    last_g_time = 0.0  # time.monotonic() of a pending first "g" of "gg"
 
     def on_mouse_move(self) -> None:
         """Mouse is in the feed but not over a post — clear all hover highlights."""
@@ -3113,7 +3585,8 @@ class TimelineFeed(VerticalScroll):
     def open_comment_screen(self):
         """Open the comment screen for the currently focused post"""
         logging.debug("open_comment_screen called in TimelineFeed")
-        items = list(self.query(".post-item"))
+        self._commit_cursor()
+        items = self._post_items
         logging.debug(
             f"cursor_position={self.cursor_position}, total_items={len(items)}"
         )
@@ -3132,27 +3605,27 @@ class TimelineFeed(VerticalScroll):
             logging.debug("Invalid cursor position in open_comment_screen")
 
     def compose(self) -> ComposeResult:
-        # Fetch all posts once and cache them
-        posts = api.get_timeline()
+        # Block first paint on one display batch only; on_mount prefetches
+        # the next page and later pages are fetched as the user scrolls
+        posts = api.get_timeline(limit=self._batch_size)
+        self._api_count = len(posts)
+        self._eof = len(posts) < self._batch_size
         reposted_sorted = sorted(self.reposted_posts, key=lambda x: x[1], reverse=True)
         self._all_posts = [p for p, _ in reposted_sorted] + posts
 
-        unread_count = len(
-            [
-                p
-                for p in self._all_posts
-                if (datetime.now() - p.timestamp).seconds < 3600
-            ]
-        )
+        # Posts from the last hour; timedelta.seconds wraps every day, so
+        # compare against a single cutoff instead
+        cutoff = datetime.now() - timedelta(hours=1)
+        self._unread_count = sum(1 for p in self._all_posts if p.timestamp > cutoff)
         self.border_title = "Main Timeline"
-        yield Static(
-            f"timeline.home | {len(self._all_posts)} posts | {unread_count} new",
-            classes="panel-header",
-            markup=False,
-        )
+        self._header = Static(self._header_text(), classes="panel-header", markup=False)
+        yield self._header
 
         # Initially display only the first batch
-        repost_count = len(reposted_sorted)
+        self._repost_count = repost_count = len(reposted_sorted)
+        # Mounted PostItems in display order; kept in sync by _load_more_posts
+        # and _forget_post_item so cursor moves never re-query the DOM
+        self._post_items = []
         for i, post in enumerate(self._all_posts[: self._displayed_count]):
             is_repost = i < repost_count
             post_item = PostItem(
@@ -3160,24 +3633,62 @@ class TimelineFeed(VerticalScroll):
             )
             if i == 0:
                 post_item.add_class("vim-cursor")
+                self._last_cursor_widget = post_item
+            self._post_items.append(post_item)
             yield post_item
 
+    def _header_text(self) -> str:
+        # "N+" until the last page is in, since more posts may follow
+        more = "" if self._eof else "+"
+        return f"timeline.home | {len(self._all_posts)}{more} posts | {self._unread_count} new"
+
+    def _forget_post_item(self, post_item) -> None:
+        """Drop a PostItem that is about to be removed from the feed."""
+        try:
+            self._post_items.remove(post_item)
+        except ValueError:
+            pass
+        if self._last_cursor_widget is post_item:
+            self._last_cursor_widget = None
+
     def on_mount(self) -> None:
         self.focus()
         self.watch(self, "cursor_position", self._update_cursor)
         self.watch(self, "scroll_y", self._check_scroll_load)
+        self.call_after_refresh(self._cache_virtual_height)
+        # Fetch the rest of the first screenful's worth in the background
+        if not self._eof and not self._fetching_page:
+            self._fetching_page = True
+            self._fetch_next_page(self._api_count)
+
+    def _cache_virtual_height(self) -> None:
+        """Snapshot the content height; it only changes when posts are mounted."""
+        try:
+            self._virtual_h = self.virtual_size.height
+        except Exception:
+            pass
 
     def _check_scroll_load(self) -> None:
         """Check if we need to load more posts based on scroll position"""
+        # Nothing left to page in: skip the size math on every scroll tick
+        if self._loading_more or (
+            self._displayed_count >= len(self._all_posts) and self._eof
+        ):
+            return
+        # Wheel ticks move a line or two; re-check only every few lines.
+        # The 100-line margin below leaves plenty of slack for this.
+        scroll_y = self.scroll_y
+        if abs(scroll_y - self._last_scroll_check) < 10:
+            return
+        self._last_scroll_check = scroll_y
         try:
-            # Get the virtual size (total content height) and viewport size
-            virtual_size = self.virtual_size.height
+            virtual_size = self._virtual_h
             container_size = self.container_size.height
 
             # If we're within 100 pixels of the bottom, load more
             if (
                 virtual_size > 0
-                and self.scroll_y + container_size >= virtual_size - 100
+                and scroll_y + container_size >= virtual_size - 100
             ):
                 self._load_more_posts()
         except Exception:
@@ -3185,7 +3696,16 @@ class TimelineFeed(VerticalScroll):
 
     def _load_more_posts(self) -> None:
         """Load the next batch of posts from cache"""
-        if self._loading_more or self._displayed_count >= len(self._all_posts):
+        if self._loading_more:
+            return
+        if self._displayed_count >= len(self._all_posts):
+            # Cache exhausted: pull the next page from the API in the background
+            # (or wait for the one in flight) and show it when it lands
+            if not self._eof:
+                self._page_wanted = True
+                if not self._fetching_page:
+                    self._fetching_page = True
+                    self._fetch_next_page(self._api_count)
             return
 
         self._loading_more = True
@@ -3196,48 +3716,110 @@ class TimelineFeed(VerticalScroll):
                 self._displayed_count + self._batch_size, len(self._all_posts)
             )
 
-            # Mount the new posts
-            repost_count = len(
-                [
-                    p
-                    for p, _ in sorted(
-                        self.reposted_posts, key=lambda x: x[1], reverse=True
-                    )
-                ]
-            )
-            for i in range(old_count, self._displayed_count):
-                post = self._all_posts[i]
-                is_repost = i < repost_count
-                post_item = PostItem(
-                    post, reposted_by_you=is_repost, classes="post-item", id=f"post-{i}"
+            # Mount the new posts; reposts lead _all_posts as of compose()
+            repost_count = self._repost_count
+            # One batched mount (single layout pass) instead of one per post
+            new_items = [
+                PostItem(
+                    self._all_posts[i], reposted_by_you=i < repost_count,
+                    classes="post-item", id=f"post-{i}",
                 )
-                self.mount(post_item)
+                for i in range(old_count, self._displayed_count)
+            ]
+            self._post_items.extend(new_items)
+            self.mount(*new_items)
+            # Re-read the content height once the new batch is laid out
+            self.call_after_refresh(self._cache_virtual_height)
         finally:
             self._loading_more = False
 
+    @work(thread=True, exclusive=True, group="timeline-page")
+    def _fetch_next_page(self, offset: int) -> None:
+        """Fetch the timeline page starting at offset off the UI thread."""
+        try:
+            posts = api.get_timeline(limit=self._page_size, offset=offset)
+        except Exception:
+            posts = None
+        self.app.call_from_thread(self._on_page_fetched, posts)
+
+    def _on_page_fetched(self, posts) -> None:
+        """Append a fetched page to the cache; mount a batch if one was asked for."""
+        self._fetching_page = False
+        wanted, self._page_wanted = self._page_wanted, False
+        if posts is None:
+            return  # network error; retry on the next scroll
+        self._api_count += len(posts)
+        # Servers without offset support resend the first page; only keep
+        # posts we don't already have and stop paging when none are new
+        seen = {p.id for p in self._all_posts}
+        fresh = [p for p in posts if p.id not in seen]
+        if len(posts) < self._page_size or not fresh:
+            self._eof = True
+        if fresh:
+            self._all_posts.extend(fresh)
+            cutoff = datetime.now() - timedelta(hours=1)
+            self._unread_count += sum(1 for p in fresh if p.timestamp > cutoff)
+        try:
+            self._header.update(self._header_text())
+        except Exception:
+            pass
+        if fresh and wanted:
+            self._load_more_posts()
+
     def _update_cursor(self) -> None:
         """Update the cursor position and check if we need to load more"""
         try:
-            # Find all post items
-            items = list(self.query(".post-item"))
+            items = self._post_items
 
-            # Remove cursor from all items
-            for i, item in enumerate(items):
-                item.remove_class("vim-cursor")
+            # Only the previously highlighted item can carry the class
+            last = self._last_cursor_widget
+            if last is not None:
+                last.remove_class("vim-cursor")
+                self._last_cursor_widget = None
 
             # Add cursor to focused item
             if 0 <= self.cursor_position < len(items):
                 item = items[self.cursor_position]
                 item.add_class("vim-cursor")
+                self._last_cursor_widget = item
                 # Ensure the cursor is visible
                 self.scroll_to_widget(item, top=True)
 
-                # Load more posts if we're near the end (within 5 posts)
-                if self.cursor_position >= len(items) - 5:
-                    self._load_more_posts()
+                # Load more posts if we're near the end (within 5 posts);
+                # mount after this frame so the cursor moves first
+                if self.cursor_position >= len(items) - 5 and not self._load_more_queued:
+                    self._load_more_queued = True
+                    self.call_after_refresh(self._deferred_load_more)
         except Exception:
             pass
 
+    def _deferred_load_more(self) -> None:
+        self._load_more_queued = False
+        self._load_more_posts()
+
+    def _cursor_target(self) -> int:
+        """Where the cursor is headed, counting a move not yet committed."""
+        pos = self._pending_cursor
+        return self.cursor_position if pos is None else pos
+
+    def _move_cursor(self, position: int) -> None:
+        """Queue a cursor move; a burst of key repeats writes the reactive once.
+
+        Each cursor_position write runs _update_cursor (class swap plus
+        scroll_to_widget), so only the last target of a tick is committed.
+        """
+        self._pending_cursor = position
+        if self._cursor_commit_timer is None:
+            self._cursor_commit_timer = self.set_timer(0, self._commit_cursor)
+
+    def _commit_cursor(self) -> None:
+        timer, self._cursor_commit_timer = self._cursor_commit_timer, None
+        if timer is not None:
+            timer.stop()
+        pos, self._pending_cursor = self._pending_cursor, None
+        if pos is not None:
+            self.cursor_position = pos
+
     def on_focus(self) -> None:
         """When the feed gets focus"""
         try:
@@ -3252,6 +3834,7 @@ class TimelineFeed(VerticalScroll):
         except Exception:
             pass
 
+        self._pending_cursor = None
         self.cursor_position = 0
         self._update_cursor()
 
@@ -3260,23 +3843,37 @@ class TimelineFeed(VerticalScroll):
         pass
 
     def on_scroll(self, event) -> None:
-        """Update scroll position reactive when scrolling"""
-        self.scroll_y = self.scroll_offset.y
+        """Update scroll position reactive when scrolling.
+
+        Scroll events arrive per wheel/trackpad tick; commit the position at
+        most every _SCROLL_COMMIT_DELAY so the load-more watcher runs a few
+        times per second instead of on every tick.
+        """
+        if self._scroll_timer is None:
+            self._scroll_timer = self.set_timer(_SCROLL_COMMIT_DELAY, self._commit_scroll)
+
+    def _commit_scroll(self) -> None:
+        self._scroll_timer = None
+        try:
+            self.scroll_y = self.scroll_offset.y
+        except Exception:
+            pass
 
     def key_j(self) -> None:
         """Move down with j key"""
         if self.app.command_mode:
             return
-        items = list(self.query(".post-item"))
-        if self.cursor_position < len(items) - 1:
-            self.cursor_position += 1
+        pos = self._cursor_target()
+        if pos < len(self._post_items) - 1:
+            self._move_cursor(pos + 1)
 
     def key_k(self) -> None:
         """Move up with k key"""
         if self.app.command_mode:
             return
-        if self.cursor_position > 0:
-            self.cursor_position -= 1
+        pos = self._cursor_target()
+        if pos > 0:
+            self._move_cursor(pos - 1)
 
     def key_g(self) -> None:
         """Go to top with gg"""
@@ -3286,40 +3883,38 @@ class TimelineFeed(VerticalScroll):
         """Go to bottom with G"""
         if self.app.command_mode:
             return
-        items = list(self.query(".post-item"))
-        self.cursor_position = len(items) - 1
+        self._move_cursor(len(self._post_items) - 1)
 
     def key_ctrl_d(self) -> None:
         """Half page down"""
         if self.app.command_mode:
             return
-        items = list(self.query(".post-item"))
-        self.cursor_position = min(self.cursor_position + 5, len(items) - 1)
+        self._move_cursor(min(self._cursor_target() + 5, len(self._post_items) - 1))
 
     def key_ctrl_u(self) -> None:
         """Half page up"""
         if self.app.command_mode:
             return
-        self.cursor_position = max(self.cursor_position - 5, 0)
+        self._move_cursor(max(self._cursor_target() - 5, 0))
 
     def key_w(self) -> None:
         """Word forward - move down by 3"""
         if self.app.command_mode:
             return
-        items = list(self.query(".post-item"))
-        self.cursor_position = min(self.cursor_position + 3, len(items) - 1)
+        self._move_cursor(min(self._cursor_target() + 3, len(self._post_items) - 1))
 
     def key_b(self) -> None:
         """Word backward - move up by 3"""
         if self.app.command_mode:
             return
-        self.cursor_position = max(self.cursor_position - 3, 0)
+        self._move_cursor(max(self._cursor_target() - 3, 0))
 
     def key_o(self) -> None:
         """Open image viewer for focused post"""
         if self.app.command_mode:
             return
-        items = list(self.query(".post-item"))
+        self._commit_cursor()
+        items = self._post_items
         if 0 <= self.cursor_position < len(items):
             post_item = items[self.cursor_position]
             if getattr(post_item, "has_ascii_art", False):
@@ -3352,12 +3947,12 @@ class TimelineFeed(VerticalScroll):
             event.stop()
             return
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
-                self.cursor_position = 0
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
+                self._move_cursor(0)
                 event.prevent_default()
                 event.stop()
-                delattr(self, "last_g_time")
+                self.last_g_time = 0.0
             else:
                 self.last_g_time = now
                 # We don't stop 'g' here because it might be the start of a command
@@ -3374,10 +3969,12 @@ class TimelineScreen(Container):
 class FollowingFeed(VerticalScroll):
     cursor_position = reactive(0)
     scroll_y = reactive(0)
+    _scroll_timer = None  # Pending _commit_scroll, if any
     _all_posts = []
     _displayed_count = 20
     _batch_size = 20
     _loading_more = False
+    last_g_time = 0.0
 
     def on_mouse_move(self) -> None:
         """Mouse is in the feed but not over a post — clear all hover highlights."""
@@ -3448,12 +4045,21 @@ class FollowingFeed(VerticalScroll):
         pass
 
     def on_scroll(self, event) -> None:
+        """Update scroll position reactive when scrolling (throttled)"""
+        if self._scroll_timer is None:
+            self._scroll_timer = self.set_timer(_SCROLL_COMMIT_DELAY, self._commit_scroll)
+
+    def _commit_scroll(self) -> None:
+        self._scroll_timer = None
         try:
             self.scroll_y = self.scroll_offset.y
         except Exception:
             pass
 
     def _check_scroll_load(self) -> None:
+        # Nothing left to page in: skip the size math on every scroll tick
+        if self._loading_more or self._displayed_count >= len(self._all_posts):
+            return
         try:
             virtual_size = self.virtual_size.height
             container_size = self.container_size.height
@@ -3469,10 +4075,10 @@ class FollowingFeed(VerticalScroll):
         try:
             old_count = self._displayed_count
             self._displayed_count = min(self._displayed_count + self._batch_size, len(self._all_posts))
-            for i in range(old_count, self._displayed_count):
-                post = self._all_posts[i]
-                post_item = PostItem(post, classes="post-item", id=f"post-fol-{i}")
-                self.mount(post_item)
+            self.mount(*[
+                PostItem(self._all_posts[i], classes="post-item", id=f"post-fol-{i}")
+                for i in range(old_count, self._displayed_count)
+            ])
         except Exception:
             pass
         finally:
@@ -3570,12 +4176,12 @@ class FollowingFeed(VerticalScroll):
             return
 
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
                 self.cursor_position = 0
                 event.prevent_default()
                 event.stop()
-                delattr(self, "last_g_time")
+                self.last_g_time = 0.0
             else:
                 self.last_g_time = now
 
@@ -3587,16 +4193,48 @@ class FollowingScreen(Container):
             yield FollowingFeed(id="following-feed")
 
 
+# Minimum interval between scroll_y commits in the paged feeds (seconds)
+_SCROLL_COMMIT_DELAY = 0.05
+
+# Navigation keys DiscoverFeed handles via key_* methods; on_key only stops them bubbling
+_DISCOVER_NAV_KEYS = frozenset(
+    ("j", "k", "h", "l", "w", "b", "G", "ctrl+d", "ctrl+u", "o")
+)
+
+
+def _char_mask(text: str) -> int:
+    """64-bit character-presence signature used to prefilter text searches.
+
+    If a needle's mask has a bit its haystack's mask lacks, the needle
+    cannot be a substring of the haystack.
+    """
+    mask = 0
+    for ch in set(text):
+        mask |= 1 << (ord(ch) & 63)
+    return mask
+
+
 class DiscoverFeed(VerticalScroll):
     cursor_position = reactive(0)
     query_text = reactive("")
     scroll_y = reactive(0)  # Track scroll position
+    _scroll_timer = None  # Pending _commit_scroll, if any
     _search_timer = None  # Timer for debouncing search
     _all_posts = []  # Cache all posts locally
     _filtered_posts = []  # Currently filtered posts
     _displayed_count = 20  # Number of posts currently displayed
     _batch_size = 20  # Number of posts to load at a time
     _loading_more = False  # Flag to prevent multiple simultaneous loads
+    _filtered_idx = []  # Indices into _all_posts of _filtered_posts
+    _pool = {}  # _all_posts index -> mounted PostItem (shown or filtered out)
+    _post_items = ()  # Shown PostItems in display order (list once composed)
+    _search_input = None  # The #discover-search Input, kept from compose
+    _last_cursor_widget = None  # Widget currently carrying .vim-cursor
+    _search_index = []  # "author\ncontent" lowercased once per post
+    _filter_query = ""  # Lowercased query that produced _filtered_idx
+    _post_masks = []  # _char_mask() of each _search_index entry
+    _removed = frozenset()  # _all_posts indices of posts deleted from the feed
+    last_g_time = 0.0
 
     def on_mouse_move(self) -> None:
         """Mouse is in the feed but not over a post — clear all hover highlights."""
@@ -3610,7 +4248,7 @@ class DiscoverFeed(VerticalScroll):
         # If cursor is on the search bar (position 0), focus the search input
         if self.cursor_position == 0:
             try:
-                search_input = self.query_one("#discover-search", Input)
+                search_input = self._search_input
                 search_input.focus()
             except Exception:
                 pass
@@ -3620,7 +4258,7 @@ class DiscoverFeed(VerticalScroll):
     def open_comment_screen(self) -> None:
         """Open the comment screen for the currently focused post"""
         try:
-            items = list(self.query(".post-item"))
+            items = self._post_items
             # Adjust cursor position to account for search input at position 0
             post_idx = self.cursor_position - 1
             if 0 <= post_idx < len(items):
@@ -3637,37 +4275,109 @@ class DiscoverFeed(VerticalScroll):
     def compose(self) -> ComposeResult:
         self.border_title = "Discover"
 
-        # Fetch all posts once and cache them
-        self._all_posts = api.get_discover_posts()
-        self._filtered_posts = self._all_posts.copy()
-        self._displayed_count = min(self._batch_size, len(self._filtered_posts))
-
-        yield Static(
-            f"discover.trending | {len(self._all_posts)} posts",
+        # Posts are fetched in a worker after mount so the first frame
+        # doesn't wait on the backend
+        self._set_posts([])
+        self._header = Static(
+            "discover.trending | loading...",
             classes="panel-header",
             markup=False,
         )
+        yield self._header
 
         # Search input below the header
-        yield Input(
+        self._search_input = Input(
             placeholder="[/] Search posts, people, tags...",
             classes="discover-search-input",
             id="discover-search",
         )
-
-        # Initially display only the first batch
-        for i, post in enumerate(self._filtered_posts[: self._displayed_count]):
-            post_item = PostItem(post, classes="post-item", id=f"discover-post-{i}")
-            # Don't add cursor here, will be handled by _update_cursor
-            yield post_item
+        yield self._search_input
+
+        self._loading_placeholder = Static("Loading posts...", classes="muted")
+        yield self._loading_placeholder
+
+    def _set_posts(self, posts: list) -> None:
+        """Reset the post cache and the search index built from it."""
+        self._all_posts = posts
+        self._filtered_posts = posts.copy()
+        self._filtered_idx = list(range(len(posts)))
+        self._displayed_count = min(self._batch_size, len(posts))
+        self._pool = {}
+        self._post_items = []
+        # Lowercase the searchable text once, not per post per keystroke.
+        # The newline separator can't occur in a (whitespace-split) search
+        # token, so a match never spans author and content.
+        self._search_index = [f"{p.author}\n{p.content}".lower() for p in posts]
+        self._post_masks = [_char_mask(text) for text in self._search_index]
+        self._filter_query = ""
+        self._removed = set()
+
+    def _forget_post_item(self, post_item) -> None:
+        """Drop a PostItem that is about to be removed from the feed."""
+        try:
+            self._post_items.remove(post_item)
+        except ValueError:
+            pass
+        if self._last_cursor_widget is post_item:
+            self._last_cursor_widget = None
+        # Retire its pool slot so no later filter shows the dead widget or
+        # mounts before it. _all_posts indices key the pool and the widget
+        # ids, so the slot is tombstoned in _removed rather than deleted.
+        for i, item in self._pool.items():
+            if item is post_item:
+                del self._pool[i]
+                self._removed.add(i)
+                try:
+                    pos = self._filtered_idx.index(i)
+                except ValueError:
+                    break
+                del self._filtered_idx[pos]
+                del self._filtered_posts[pos]
+                if pos < self._displayed_count:
+                    self._displayed_count -= 1
+                break
 
     def on_mount(self) -> None:
         self.focus()
         self.watch(self, "cursor_position", self._update_cursor)
         self.watch(self, "scroll_y", self._check_scroll_load)
+        self._fetch_posts()
+
+    @work(thread=True, exclusive=True, group="discover-fetch")
+    def _fetch_posts(self) -> None:
+        """Fetch discover posts off the UI thread."""
+        try:
+            posts = api.get_discover_posts()
+        except Exception:
+            posts = []
+        self.app.call_from_thread(self._on_posts_fetched, posts)
+
+    def _on_posts_fetched(self, posts: list) -> None:
+        """Cache fetched posts and show the first batch (or the active filter)."""
+        try:
+            self._loading_placeholder.remove()
+        except Exception:
+            pass
+        self._set_posts(posts)
+        try:
+            self._header.update(f"discover.trending | {len(posts)} posts")
+        except Exception:
+            pass
+        if self.query_text:
+            # The user typed while we were loading: apply their filter
+            self._search_timer = self.set_timer(0, self._filter_posts)
+            return
+        batch = self._filtered_idx[: self._displayed_count]
+        self._show_posts(batch)
+        self._post_items = [self._pool[i] for i in batch]
+        if self.cursor_position > 0:
+            self._update_cursor()
 
     def _check_scroll_load(self) -> None:
         """Check if we need to load more posts based on scroll position"""
+        # Nothing left to page in: skip the size math on every scroll tick
+        if self._loading_more or self._displayed_count >= len(self._filtered_posts):
+            return
         try:
             # Get the virtual size (total content height) and viewport size
             virtual_size = self.virtual_size.height
@@ -3698,34 +4408,93 @@ class DiscoverFeed(VerticalScroll):
         """Filter posts based on search query from local cache"""
         try:
             # Filter from cached posts
-            if self.query_text:
-                q = self.query_text.lower()
-                self._filtered_posts = [
-                    p
-                    for p in self._all_posts
-                    if q in p.author.lower() or q in p.content.lower()
+            q = self.query_text.lower()
+            if q:
+                # Typing more of the same query can only narrow the matches,
+                # so rescan just the previous results
+                if self._filter_query and q.startswith(self._filter_query):
+                    candidates = self._filtered_idx
+                else:
+                    candidates = range(len(self._all_posts))
+                index = self._search_index
+                tokens = q.split()
+                # Cheap prefilter: a post lacking any of the query's
+                # characters can't match, so skip the substring tests
+                qmask = _char_mask("".join(tokens) or q)
+                masks = self._post_masks
+                removed = self._removed
+                candidates = [
+                    i for i in candidates
+                    if not qmask & ~masks[i] and i not in removed
                 ]
+                if len(tokens) > 1:
+                    # Multi-word query: every word must appear somewhere in
+                    # the post (in any order), checked in one pass per post
+                    self._filtered_idx = [
+                        i for i in candidates
+                        if all(t in index[i] for t in tokens)
+                    ]
+                else:
+                    needle = tokens[0] if tokens else q
+                    self._filtered_idx = [i for i in candidates if needle in index[i]]
             else:
-                self._filtered_posts = self._all_posts.copy()
+                removed = self._removed
+                self._filtered_idx = [
+                    i for i in range(len(self._all_posts)) if i not in removed
+                ]
+            self._filter_query = q
+            all_posts = self._all_posts
+            self._filtered_posts = [all_posts[i] for i in self._filtered_idx]
 
             # Reset displayed count
             self._displayed_count = min(self._batch_size, len(self._filtered_posts))
 
-            # Remove existing post items
-            # CRITICAL: Await the removal to ensure the DOM is cleared 
-            # before we mount new items, preventing "ghost" cursor positions.
-            await self.query(".post-item").remove()
-
-            # Add filtered posts (only first batch)
-            for i, post in enumerate(self._filtered_posts[: self._displayed_count]):
-                post_item = PostItem(post, classes="post-item", id=f"discover-post-{i}")
-                self.mount(post_item)
+            # Recycle mounted PostItems instead of removing and re-mounting
+            # them on every keystroke: items outside the first batch are
+            # hidden (and drop .post-item so cursor queries skip them),
+            # and only posts never shown before get new widgets.
+            shown = set(self._filtered_idx[: self._displayed_count])
+            for i, item in self._pool.items():
+                if i not in shown and item.has_class("post-item"):
+                    item.remove_class("post-item", "vim-cursor", "hovered")
+                    item.add_class("post-item-filtered")
+            self._show_posts(self._filtered_idx[: self._displayed_count])
+            pool = self._pool
+            self._post_items = [pool[i] for i in self._filtered_idx[: self._displayed_count]]
 
             # Reset cursor to search input (position 0)
             self.cursor_position = 0
         except Exception:
             pass
 
+    def _show_posts(self, indices: list) -> None:
+        """Show the posts at these _all_posts indices, mounting any not yet pooled.
+
+        Mounted items stay in _all_posts order, so a new item is inserted
+        before the next pooled item after it (or appended at the end).
+        """
+        pool = self._pool
+        pooled = sorted(pool)
+        pending = {}  # anchor index (or None for the end) -> new PostItems
+        for i in indices:
+            item = pool.get(i)
+            if item is not None:
+                if not item.has_class("post-item"):
+                    item.remove_class("post-item-filtered")
+                    item.add_class("post-item")
+                continue
+            item = pool[i] = PostItem(
+                self._all_posts[i], classes="post-item", id=f"discover-post-{i}"
+            )
+            pos = bisect.bisect_right(pooled, i)
+            anchor = pooled[pos] if pos < len(pooled) else None
+            pending.setdefault(anchor, []).append(item)
+        for anchor, items in pending.items():
+            if anchor is None:
+                self.mount(*items)
+            else:
+                self.mount(*items, before=pool[anchor])
+
     def _load_more_posts(self) -> None:
         """Load the next batch of posts from filtered cache"""
         if self._loading_more or self._displayed_count >= len(self._filtered_posts):
@@ -3739,11 +4508,10 @@ class DiscoverFeed(VerticalScroll):
                 self._displayed_count + self._batch_size, len(self._filtered_posts)
             )
 
-            # Mount the new posts
-            for i in range(old_count, self._displayed_count):
-                post = self._filtered_posts[i]
-                post_item = PostItem(post, classes="post-item", id=f"discover-post-{i}")
-                self.mount(post_item)
+            # Show the next batch, reusing pooled items
+            batch = self._filtered_idx[old_count : self._displayed_count]
+            self._show_posts(batch)
+            self._post_items.extend(self._pool[i] for i in batch)
         finally:
             self._loading_more = False
 
@@ -3754,7 +4522,7 @@ class DiscoverFeed(VerticalScroll):
         # Set cursor to position 0 and focus the input
         self.cursor_position = 0
         try:
-            search_input = self.query_one("#discover-search", Input)
+            search_input = self._search_input
             search_input.focus()
         except Exception:
             pass
@@ -3762,26 +4530,33 @@ class DiscoverFeed(VerticalScroll):
     def _get_navigable_items(self) -> list:
         """Get all navigable items (search input + posts)"""
         try:
-            search_input = self.query_one("#discover-search", Input)
-            post_items = list(self.query(".post-item"))
-            return [search_input] + post_items
+            search_input = self._search_input
+            return [search_input] + list(self._post_items)
         except Exception:
             return []
 
+    def _navigable_count(self) -> int:
+        """Search input plus shown posts, without touching the DOM."""
+        return len(self._post_items) + 1
+
     def _update_cursor(self) -> None:
         """Update the cursor position - includes search input + posts"""
         try:
-            items = self._get_navigable_items()
-            post_items = list(self.query(".post-item"))
-            search_input = self.query_one("#discover-search", Input)
-
-            # Remove cursor from all post items and search input
-            for item in post_items:
-                item.remove_class("vim-cursor")
-            search_input.remove_class("vim-cursor")
-
-            if 0 <= self.cursor_position < len(items):
-                item = items[self.cursor_position]
+            # Only the previously highlighted widget can carry the class
+            last = self._last_cursor_widget
+            if last is not None:
+                last.remove_class("vim-cursor")
+                self._last_cursor_widget = None
+
+            count = self._navigable_count()
+            if 0 <= self.cursor_position < count:
+                # Position 0 is the search input, posts follow
+                item = (
+                    self._search_input
+                    if self.cursor_position == 0
+                    else self._post_items[self.cursor_position - 1]
+                )
+                self._last_cursor_widget = item
                 if isinstance(item, Input):
                     # Don't focus the input, just add visual indicator
                     item.add_class("vim-cursor")
@@ -3794,7 +4569,7 @@ class DiscoverFeed(VerticalScroll):
 
                 # Load more posts if we're near the end (within 5 posts)
                 # Subtract 1 because position 0 is the search input
-                if self.cursor_position > 0 and self.cursor_position >= len(items) - 5:
+                if self.cursor_position > 0 and self.cursor_position >= count - 5:
                     self._load_more_posts()
         except Exception:
             pass
@@ -3819,15 +4594,22 @@ class DiscoverFeed(VerticalScroll):
         pass
 
     def on_scroll(self, event) -> None:
-        """Update scroll position reactive when scrolling"""
-        self.scroll_y = self.scroll_offset.y
+        """Update scroll position reactive when scrolling (throttled)"""
+        if self._scroll_timer is None:
+            self._scroll_timer = self.set_timer(_SCROLL_COMMIT_DELAY, self._commit_scroll)
+
+    def _commit_scroll(self) -> None:
+        self._scroll_timer = None
+        try:
+            self.scroll_y = self.scroll_offset.y
+        except Exception:
+            pass
 
     def key_j(self) -> None:
         """Move down with j key"""
         if self.app.command_mode:
             return
-        items = self._get_navigable_items()
-        if self.cursor_position < len(items) - 1:
+        if self.cursor_position < self._navigable_count() - 1:
             self.cursor_position += 1
 
     def key_k(self) -> None:
@@ -3847,15 +4629,13 @@ class DiscoverFeed(VerticalScroll):
         """Go to bottom with G"""
         if self.app.command_mode:
             return
-        items = self._get_navigable_items()
-        self.cursor_position = len(items) - 1
+        self.cursor_position = self._navigable_count() - 1
 
     def key_ctrl_d(self) -> None:
         """Half page down"""
         if self.app.command_mode:
             return
-        items = self._get_navigable_items()
-        self.cursor_position = min(self.cursor_position + 5, len(items) - 1)
+        self.cursor_position = min(self.cursor_position + 5, self._navigable_count() - 1)
 
     def key_ctrl_u(self) -> None:
         """Half page up"""
@@ -3867,8 +4647,7 @@ class DiscoverFeed(VerticalScroll):
         """Word forward - move down by 3"""
         if self.app.command_mode:
             return
-        items = self._get_navigable_items()
-        self.cursor_position = min(self.cursor_position + 3, len(items) - 1)
+        self.cursor_position = min(self.cursor_position + 3, self._navigable_count() - 1)
 
     def key_b(self) -> None:
         """Word backward - move up by 3"""
@@ -3880,7 +4659,7 @@ class DiscoverFeed(VerticalScroll):
         """Open image viewer for focused post"""
         if self.app.command_mode:
             return
-        items = list(self.query(".post-item"))
+        items = self._post_items
         if 0 <= self.cursor_position < len(items):
             post_item = items[self.cursor_position]
             if getattr(post_item, "has_ascii_art", False):
@@ -3899,7 +4678,7 @@ class DiscoverFeed(VerticalScroll):
             return
         if self.cursor_position == 0:
             try:
-                search_input = self.query_one("#discover-search", Input)
+                search_input = self._search_input
                 search_input.focus()
             except Exception:
                 pass
@@ -3911,14 +4690,14 @@ class DiscoverFeed(VerticalScroll):
             return
 
         # Navigation shortcuts
-        if event.key in ("j", "k", "h", "l", "w", "b", "G", "ctrl+d", "ctrl+u", "o"):
+        if event.key in _DISCOVER_NAV_KEYS:
             event.stop()
             return
 
         if event.key == "enter":
             # If search input has focus, let it handle the submission
             try:
-                search_input = self.query_one("#discover-search")
+                search_input = self._search_input
                 if getattr(search_input, "has_focus", False):
                     return
             except Exception:
@@ -3929,7 +4708,7 @@ class DiscoverFeed(VerticalScroll):
 
         if event.key == "escape":
             try:
-                search_input = self.query_one("#discover-search")
+                search_input = self._search_input
                 if getattr(search_input, "has_focus", False):
                     self.cursor_position = 1
                     self.focus()
@@ -3947,12 +4726,12 @@ class DiscoverFeed(VerticalScroll):
         # and key_enter respectively. Do NOT auto-focus on arbitrary typing.
 
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
                 self.cursor_position = 0
                 event.prevent_default()
                 event.stop()
-                delattr(self, "last_g_time")
+                self.last_g_time = 0.0
             else:
                 self.last_g_time = now
             return
@@ -3967,6 +4746,9 @@ class DiscoverScreen(Container):
 
 class NotificationsFeed(VerticalScroll):
     cursor_position = reactive(0)
+    _items = ()  # NotificationItems in display order (list once composed)
+    _last_cursor_widget = None  # Item currently carrying .vim-cursor
+    last_g_time = 0.0
 
     def compose(self) -> ComposeResult:
         notifications = api.get_notifications()
@@ -4007,10 +4789,14 @@ class NotificationsFeed(VerticalScroll):
             f"notifications.inbox | {len(notifications)} total",
             classes="panel-header",
         )
+        # Items are fixed once composed; keep them so cursor keys never query
+        self._items = []
         for i, notif in enumerate(notifications):
             item = NotificationItem(notif, classes="notification-item", id=f"notif-{i}")
             if i == 0:
                 item.add_class("vim-cursor")
+                self._last_cursor_widget = item
+            self._items.append(item)
             yield item
         yield Static(
             "\n[j/k] Navigate [Enter] Open [:q] Quit",
@@ -4026,13 +4812,17 @@ class NotificationsFeed(VerticalScroll):
     def _update_cursor(self) -> None:
         """Update the cursor position"""
         try:
-            items = list(self.query(".notification-item"))
-            for item in items:
-                item.remove_class("vim-cursor")
+            items = self._items
+            # Only the previously highlighted item can carry the class
+            last = self._last_cursor_widget
+            if last is not None:
+                last.remove_class("vim-cursor")
+                self._last_cursor_widget = None
 
             if 0 <= self.cursor_position < len(items):
                 item = items[self.cursor_position]
                 item.add_class("vim-cursor")
+                self._last_cursor_widget = item
                 self.scroll_to_widget(item)
         except Exception:
             pass
@@ -4041,7 +4831,7 @@ class NotificationsFeed(VerticalScroll):
         """Move down with j key"""
         if self.app.command_mode:
             return
-        items = list(self.query(".notification-item"))
+        items = self._items
         if self.cursor_position < len(items) - 1:
             self.cursor_position += 1
 
@@ -4062,14 +4852,14 @@ class NotificationsFeed(VerticalScroll):
         """Go to bottom with G"""
         if self.app.command_mode:
             return
-        items = list(self.query(".notification-item"))
+        items = self._items
         self.cursor_position = len(items) - 1
 
     def key_ctrl_d(self) -> None:
         """Half page down"""
         if self.app.command_mode:
             return
-        items = list(self.query(".notification-item"))
+        items = self._items
         self.cursor_position = min(self.cursor_position + 5, len(items) - 1)
 
     def key_ctrl_u(self) -> None:
@@ -4082,7 +4872,7 @@ class NotificationsFeed(VerticalScroll):
         """Word forward - move down by 3"""
         if self.app.command_mode:
             return
-        items = list(self.query(".notification-item"))
+        items = self._items
         self.cursor_position = min(self.cursor_position + 3, len(items) - 1)
 
     def key_b(self) -> None:
@@ -4129,12 +4919,12 @@ class NotificationsFeed(VerticalScroll):
             return
 
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
                 self.cursor_position = 0
                 event.prevent_default()
                 event.stop()
-                delattr(self, "last_g_time")
+                self.last_g_time = 0.0
             else:
                 self.last_g_time = now
 
@@ -4152,6 +4942,13 @@ class ConversationsList(VerticalScroll):
     can_focus = True
     # Track whether the list has performed its initial mount setup
     has_initialized = False
+    _items = ()  # ConversationItems in display order (list once composed)
+    _last_cursor_widget = None  # Item currently carrying .vim-cursor
+    _selected_widget = None  # Item currently carrying .selected
+    _conversations = None  # Conversations in display order, set by compose
+    _unread_count = 0  # Conversations in _conversations still flagged unread
+    _header = None  # The "conversations | N unread" Static
+    last_g_time = 0.0
 
     def compose(self) -> ComposeResult:
         # Fetch conversations and sort most-recent-first by last_message_at
@@ -4167,12 +4964,33 @@ class ConversationsList(VerticalScroll):
         # Store the ordered list so keyboard actions refer to the same ordering
         self._conversations = conversations
 
-        unread_count = len([c for c in conversations if c.unread])
-        yield Static(f"conversations | {unread_count} unread", classes="panel-header")
+        self._unread_count = sum(1 for c in conversations if c.unread)
+        self._header = Static(
+            f"conversations | {self._unread_count} unread", classes="panel-header"
+        )
+        yield self._header
+        # Items are fixed once composed; keep them so cursor keys never query
+        self._items = []
         for i, conv in enumerate(conversations):
-            item = ConversationItem(conv, classes="conversation-item", id=f"conv-{i}")
+            item = ConversationItem(
+                conv, list_ref=self, index=i, classes="conversation-item", id=f"conv-{i}"
+            )
+            self._items.append(item)
             yield item
 
+    def mark_read(self, conversation_id: int) -> None:
+        """Clear a conversation's unread flag and keep the header count in step."""
+        for c in self._conversations or ():
+            if int(c.id) == int(conversation_id):
+                if getattr(c, "unread", False):
+                    c.unread = False
+                    self._unread_count = max(0, self._unread_count - 1)
+                    if self._header is not None:
+                        self._header.update(
+                            f"conversations | {self._unread_count} unread"
+                        )
+                break
+
     def on_mount(self) -> None:
         """Watch for cursor position changes"""
         self.watch(self, "cursor_position", self._update_cursor)
@@ -4197,16 +5015,19 @@ class ConversationsList(VerticalScroll):
         """Update the cursor position"""
         try:
             # Find all conversation items
-            items = list(self.query(".conversation-item"))
+            items = self._items
 
-            # Remove cursor from all items
-            for item in items:
-                item.remove_class("vim-cursor")
+            # Only the previously highlighted item can carry the class
+            last = self._last_cursor_widget
+            if last is not None:
+                last.remove_class("vim-cursor")
+                self._last_cursor_widget = None
 
             # Add cursor to focused item
             if 0 <= self.cursor_position < len(items):
                 item = items[self.cursor_position]
                 item.add_class("vim-cursor")
+                self._last_cursor_widget = item
                 # Ensure the cursor is visible
                 self.scroll_to_widget(item, top=True)
         except Exception:
@@ -4216,16 +5037,19 @@ class ConversationsList(VerticalScroll):
         """Update the selected position (blue background for open conversation)"""
         try:
             # Find all conversation items
-            items = list(self.query(".conversation-item"))
+            items = self._items
 
-            # Remove selected from all items
-            for item in items:
-                item.remove_class("selected")
+            # Only the previously open conversation can carry the class
+            last = self._selected_widget
+            if last is not None:
+                last.remove_class("selected")
+                self._selected_widget = None
 
             # Add selected to the open conversation
             if 0 <= self.selected_position < len(items):
                 item = items[self.selected_position]
                 item.add_class("selected")
+                self._selected_widget = item
         except Exception:
             pass
 
@@ -4245,7 +5069,7 @@ class ConversationsList(VerticalScroll):
         """Move down with j key"""
         if self.app.command_mode:
             return
-        items = list(self.query(".conversation-item"))
+        items = self._items
         if self.cursor_position < len(items) - 1:
             self.cursor_position += 1
 
@@ -4267,14 +5091,14 @@ class ConversationsList(VerticalScroll):
         """Go to bottom with G"""
         if self.app.command_mode:
             return
-        items = list(self.query(".conversation-item"))
+        items = self._items
         self.cursor_position = len(items) - 1
 
     def key_ctrl_d(self) -> None:
         """Half page down"""
         if self.app.command_mode:
             return
-        items = list(self.query(".conversation-item"))
+        items = self._items
         self.cursor_position = min(self.cursor_position + 5, len(items) - 1)
 
     def key_ctrl_u(self) -> None:
@@ -4287,7 +5111,7 @@ class ConversationsList(VerticalScroll):
         """Word forward - move down by 3"""
         if self.app.command_mode:
             return
-        items = list(self.query(".conversation-item"))
+        items = self._items
         self.cursor_position = min(self.cursor_position + 3, len(items) - 1)
 
     def key_b(self) -> None:
@@ -4313,37 +5137,6 @@ class ConversationsList(VerticalScroll):
                             pass
                         break
 
-    def key_enter(self) -> None:
-        """Open the selected conversation when Enter is pressed"""
-        if self.app.command_mode:
-            return
-        try:
-            conversations = api.get_conversations()
-            if 0 <= self.cursor_position < len(conversations):
-                conv = conversations[self.cursor_position]
-                # Mark this conversation as selected (blue background)
-                self.selected_position = self.cursor_position
-
-                # Get the other participant's username
-                current_user = get_username() or "yourname"
-                other_participants = [h for h in conv.participant_handles if h != current_user]
-                username = other_participants[0] if other_participants else conv.participant_handles[0] if conv.participant_handles else "unknown"
-
-                # Get MessagesScreen parent container
-                messages_screen = self.parent
-                if isinstance(messages_screen, MessagesScreen):
-                    messages_screen._open_chat_view(conv.id, username)
-
-                    # Focus the chat view
-                    try:
-                        chat_views = list(messages_screen.query("ChatView"))
-                        if chat_views:
-                            chat_views[0].focus()
-                    except:
-                        pass
-        except Exception:
-            pass
-
     def on_key(self, event) -> None:
         """Handle g+g key combination for top and prevent escape from unfocusing"""
         if self.app.command_mode:
@@ -4363,12 +5156,12 @@ class ConversationsList(VerticalScroll):
             return
 
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
                 self.cursor_position = 0
                 event.prevent_default()
                 event.stop()
-                delattr(self, "last_g_time")
+                self.last_g_time = 0.0
             else:
                 self.last_g_time = now
 
@@ -4378,7 +5171,7 @@ class ConversationsList(VerticalScroll):
         if self.app.command_mode:
             return
         try:
-            items = list(self.query(".conversation-item"))
+            items = self._items
             if 0 <= self.cursor_position < len(items):
                 item = items[self.cursor_position]
                 # Prefer calling the item's on_click handler so behavior is identical
@@ -4396,6 +5189,7 @@ class ChatView(VerticalScroll):
     conversation_username = reactive("")
     cursor_position = reactive(-1)  # -1 = no selection until explicitly focused
     input_active = reactive(False)
+    last_g_time = 0.0
 
     def __init__(self, conversation_id: int = 0, username: str = "", **kwargs):
         super().__init__(**kwargs)
@@ -4404,8 +5198,16 @@ class ChatView(VerticalScroll):
         # Use an app-level sender map so colors remain stable across views
         if not hasattr(self.app, "_sender_map_global"):
             # store as {lower_handle: index}
-            setattr(self.app, "_sender_map_global", {})
-            setattr(self.app, "_sender_map_next_idx", 0)
+            self.app._sender_map_global = {}
+
+    def _sender_index(self, sender: str) -> int:
+        """Color slot (0-4) for a sender, assigned in first-seen order app-wide."""
+        m = self.app._sender_map_global
+        s = (sender or "").lower()
+        idx = m.get(s)
+        if idx is None:
+            idx = m[s] = len(m) % 5
+        return idx
 
     def compose(self) -> ComposeResult:
         self.border_title = "[0] Chat"
@@ -4430,18 +5232,8 @@ class ChatView(VerticalScroll):
         # Resolve current user once for use in message rendering
         current_user = get_username() or api.handle or "yourname"
 
-        # Build a sender->index resolver using a global map on the app so colors persist
-        def _sender_idx(sender: str) -> int:
-            s = (sender or "").lower()
-            global_map = getattr(self.app, "_sender_map_global", {})
-            if s in global_map:
-                return global_map[s]
-            next_idx = getattr(self.app, "_sender_map_next_idx", 0)
-            idx = next_idx % 5
-            global_map[s] = idx
-            setattr(self.app, "_sender_map_global", global_map)
-            setattr(self.app, "_sender_map_next_idx", next_idx + 1)
-            return idx
+        # Sender colors come from the app-global map so they persist
+        _sender_idx = self._sender_index
 
         # Persist read-state for this conversation (centralized so all open flows mark read)
         if getattr(self, "conversation_id", 0):
@@ -4456,26 +5248,7 @@ class ChatView(VerticalScroll):
                 # Also update the locally-stored conversations list so the header/unread dot refreshes
                 try:
                     convs_list = self.app.screen.query_one("#conversations", ConversationsList)
-                    if (
-                        hasattr(convs_list, "_conversations")
-                        and convs_list._conversations is not None
-                    ):
-                        for c in convs_list._conversations:
-                            if int(c.id) == int(self.conversation_id):
-                                c.unread = False
-                                break
-                        unread_count = len(
-                            [
-                                c
-                                for c in convs_list._conversations
-                                if getattr(c, "unread", False)
-                            ]
-                        )
-                        try:
-                            header = convs_list.query_one(".panel-header", Static)
-                            header.update(f"conversations | {unread_count} unread")
-                        except Exception:
-                            pass
+                    convs_list.mark_read(self.conversation_id)
                 except Exception:
                     pass
             except Exception:
@@ -4520,17 +5293,7 @@ class ChatView(VerticalScroll):
             # Determine sender class for the new message (use app-global map)
             current_user = get_username() or api.handle or ""
             sender = new_msg.sender or new_msg.sender_handle or current_user
-            # Ensure global map exists
-            if not hasattr(self.app, "_sender_map_global"):
-                setattr(self.app, "_sender_map_global", {})
-                setattr(self.app, "_sender_map_next_idx", 0)
-            global_map = getattr(self.app, "_sender_map_global")
-            if sender.lower() not in global_map:
-                next_idx = getattr(self.app, "_sender_map_next_idx", 0)
-                global_map[sender.lower()] = next_idx % 5
-                setattr(self.app, "_sender_map_next_idx", next_idx + 1)
-                setattr(self.app, "_sender_map_global", global_map)
-            idx = global_map[sender.lower()]
+            idx = self._sender_index(sender)
             sender_class = f"sender-{idx}"
             classes = f"chat-message sent {sender_class}"
             # Insert the new message before the insert indicator so
@@ -4569,16 +5332,7 @@ class ChatView(VerticalScroll):
             self._rendered_msg_ids.add(msg_id)
         current_user = get_username() or api.handle or "yourname"
         sender = getattr(msg, "sender", None) or getattr(msg, "sender_handle", None) or current_user
-        if not hasattr(self.app, "_sender_map_global"):
-            setattr(self.app, "_sender_map_global", {})
-            setattr(self.app, "_sender_map_next_idx", 0)
-        global_map = getattr(self.app, "_sender_map_global")
-        if sender.lower() not in global_map:
-            next_idx = getattr(self.app, "_sender_map_next_idx", 0)
-            global_map[sender.lower()] = next_idx % 5
-            setattr(self.app, "_sender_map_next_idx", next_idx + 1)
-            setattr(self.app, "_sender_map_global", global_map)
-        idx = global_map[sender.lower()]
+        idx = self._sender_index(sender)
         sender_class = f"sender-{idx}"
         classes = f"chat-message received {sender_class}"
         try:
@@ -4795,12 +5549,12 @@ class ChatView(VerticalScroll):
             return
 
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
                 self.cursor_position = 0
                 event.prevent_default()
                 event.stop()
-                delattr(self, "last_g_time")
+                self.last_g_time = 0.0
             else:
                 self.last_g_time = now
             return
@@ -4847,7 +5601,7 @@ class MessagesScreen(Container):
 
         async def on_message(conv_id: int, payload: dict) -> None:
             try:
-                msg = api._convert_message(payload)
+                msg = api._make_message(payload)
                 event = NewMessageReceived(conv_id, msg)
                 try:
                     chat_view = self.query_one("#chat", ChatView)
@@ -5027,6 +5781,8 @@ class AvatarWidget(Static):
     Because this is a leaf (no nested children), self.size.width is always the
     real constrained value — exactly like PostItem.  on_mount and on_resize use
     call_after_refresh so the first render fires after Textual's layout pass.
+    Remote pictures are downloaded and converted in a worker; the braille
+    placeholder stays up until the art is ready.
     """
 
     DEFAULT_CSS = "AvatarWidget { width: 100%; }"
@@ -5035,6 +5791,10 @@ class AvatarWidget(Static):
         super().__init__("\u2800", markup=False, **kwargs)  # blank braille placeholder
         self._pic_url = pic_url
         self._ascii_fallback = ascii_fallback
+        self._local_path = ""
+        # (source..., cols) of the last render, so resizes that keep the same
+        # column count don't redo any work
+        self._rendered_key: Optional[tuple] = None
 
     def on_mount(self) -> None:
         self.call_after_refresh(self._do_render)
@@ -5048,12 +5808,15 @@ class AvatarWidget(Static):
             return
 
         cols = max(20, w - 4) if w > 10 else 50
+        key = (self._pic_url, self._local_path, self._ascii_fallback, cols)
+        if key == self._rendered_key:
+            return
+        self._rendered_key = key
 
         from rich.text import Text
         if self._pic_url:
-            art = _render_image_url(self._pic_url, self.app, cols=cols)
-            self.update(Text(art))
-        elif getattr(self, "_local_path", ""):
+            self._render_url(key, self._pic_url, cols)
+        elif self._local_path:
             art = image_to_braille_art(self._local_path, cols=cols)
             self.update(Text(art))
         elif self._ascii_fallback and self._ascii_fallback.strip():
@@ -5061,12 +5824,28 @@ class AvatarWidget(Static):
         else:
             self.update("No profile picture available")
 
+    @work(thread=True, exclusive=True, group="avatar-render")
+    def _render_url(self, key: tuple, pic_url: str, cols: int) -> None:
+        art = _render_image_url(pic_url, self.app, cols=cols)
+        try:
+            self.app.call_from_thread(self._apply_art, key, art)
+        except Exception:
+            pass
+
+    def _apply_art(self, key: tuple, art: str) -> None:
+        # Drop results for a picture/width that has since been replaced
+        if key != self._rendered_key:
+            return
+        from rich.text import Text
+        self.update(Text(art))
+
     def set_url(self, pic_url: str, ascii_fallback: str = "", local_path: str = "") -> None:
         """Update the picture URL or local file path then re-render."""
         self._pic_url = pic_url
         if ascii_fallback:
             self._ascii_fallback = ascii_fallback
         self._local_path = local_path
+        self._rendered_key = None
         self.call_after_refresh(self._do_render)
 
     def clear(self) -> None:
@@ -5074,6 +5853,7 @@ class AvatarWidget(Static):
         self._pic_url = ""
         self._ascii_fallback = ""
         self._local_path = ""
+        self._rendered_key = None
         self.update("No profile picture available")
 
 
@@ -5092,8 +5872,12 @@ class SettingsPanel(VerticalScroll):
         self.border_title = "Settings"
 
         try:
-            settings = api.get_user_settings()
-            user = api.get_current_user()
+            fetched = api.fetch_many({
+                "settings": api.get_user_settings,
+                "user": api.get_current_user,
+            })
+            settings = fetched["settings"]
+            user = fetched["user"]
         except Exception:
             # If the API call fails, provide a lightweight fallback so the
             # screen still composes and shows an error message that can be
@@ -5641,13 +6425,13 @@ class SettingsPanel(VerticalScroll):
                         pass
                     return
 
-                root = _tk.Tk()
-                root.withdraw()
+                root = _get_tk_root(_tk)
                 file_path = _filedialog.askopenfilename(
+                    parent=root,
                     title="Select an Image",
                     filetypes=[("Image files", "*.png *.jpg *.jpeg *.gif *.bmp")],
                 )
-                root.destroy()
+                root.update()  # let Tk tear down the dialog window
 
                 if not file_path:
                     return
@@ -5702,6 +6486,8 @@ class SettingsPanel(VerticalScroll):
 
                         clear_tokens()
                     except Exception:
+                        import keyring
+
                         try:
                             keyring.delete_password(serviceKeyring, "refresh_token")
                         except Exception:
@@ -5851,6 +6637,8 @@ class SettingsPanel(VerticalScroll):
             # Persist via API
             try:
                 api.update_user_settings(settings)
+                # Profile edits may change what the stored identity reports
+                get_username.cache_clear()
                 try:
                     # Update avatar display to reflect saved url / ascii
                     saved_url = getattr(settings, "pic_url", "") or ""
@@ -5926,6 +6714,7 @@ class ProfileView(VerticalScroll):
     """
     reposted_posts = reactive([])
     scroll_y = reactive(0)
+    _scroll_timer = None  # Pending _commit_scroll, if any
     # Row/column cursor for vim-like navigation
     cursor_row = reactive(0)
     cursor_col = reactive(-1)  # -1 = row-focused, >=0 = child column focused
@@ -5933,6 +6722,7 @@ class ProfileView(VerticalScroll):
     _displayed_count = 20
     _batch_size = 20
     _loading_more = False
+    last_g_time = 0.0
 
     def __init__(self, profile: dict, posts: list | None = None, actions: bool = False, **kwargs):
         super().__init__(**kwargs)
@@ -5976,7 +6766,11 @@ class ProfileView(VerticalScroll):
             stats_row = Container(classes="profile-stats-row")
             with stats_row:
                 yield Static(f"{self.profile.get('following', 0)}\nFollowing", classes="profile-stat-item")
-                yield Static(f"{self.profile.get('followers', 0)}\nFollowers", classes="profile-stat-item")
+                yield Static(
+                    f"{self.profile.get('followers', 0)}\nFollowers",
+                    id="profile-followers-stat",
+                    classes="profile-stat-item",
+                )
             yield stats_row
 
             bio_container = Container(classes="profile-bio-container")
@@ -6059,70 +6853,86 @@ class ProfileView(VerticalScroll):
         
         btn_id = event.button.id
         target = self.profile.get("username") or self.profile.get("handle", "")
-        if btn_id == "follow-user-btn":
-            currently_following = "Unfollow" in str(event.button.label)
-            try:
-                if currently_following:
-                    ok = api.unfollow_user(target)
-                    if ok:
-                        # Capture previous state to decide message intent
-                        previously_following = self.profile.get("is_following", True)
-                        event.button.label = "Follow"
-                        self.profile["is_following"] = False
-                        try:
-                            old = int(self.profile.get("followers", 0))
-                            self.profile["followers"] = max(0, old - 1)
-                            for stat in self.query(".profile-stat-item"):
-                                if "Follower" in str(stat.renderable):
-                                    stat.update(f"{self.profile['followers']}\nFollowers")
-                        except Exception:
-                            pass
-                        try:
-                            msg = f"Unfollowed @{target}." if previously_following else f"You are not following @{target}."
-                            self.app.notify(msg, severity="success")
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            self.app.notify(f"Failed to unfollow @{target}.", severity="error")
-                        except Exception:
-                            pass
+        handler = self._button_handlers.get(btn_id)
+        if handler is not None:
+            handler(self, event.button, target)
+
+    def _toggle_follow(self, button: Button, target: str) -> None:
+        currently_following = "Unfollow" in str(button.label)
+        try:
+            if currently_following:
+                ok = api.unfollow_user(target)
+                if ok:
+                    # Capture previous state to decide message intent
+                    previously_following = self.profile.get("is_following", True)
+                    button.label = "Follow"
+                    self.profile["is_following"] = False
+                    try:
+                        old = int(self.profile.get("followers", 0))
+                        self.profile["followers"] = max(0, old - 1)
+                        self._update_followers_stat()
+                    except Exception:
+                        pass
+                    try:
+                        msg = f"Unfollowed @{target}." if previously_following else f"You are not following @{target}."
+                        self.app.notify(msg, severity="success")
+                    except Exception:
+                        pass
                 else:
-                    ok = api.follow_user(target)
-                    if ok:
-                        # Capture previous state to decide message intent
-                        previously_following = self.profile.get("is_following", False)
-                        event.button.label = "Unfollow"
-                        self.profile["is_following"] = True
-                        try:
-                            old = int(self.profile.get("followers", 0))
-                            self.profile["followers"] = old + 1
-                            for stat in self.query(".profile-stat-item"):
-                                if "Follower" in str(stat.renderable):
-                                    stat.update(f"{self.profile['followers']}\nFollowers")
-                        except Exception:
-                            pass
-                        try:
-                            msg = f"Now following @{target}!" if not previously_following else f"You are already following @{target}."
-                            self.app.notify(msg, severity="success")
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            self.app.notify(f"Failed to follow @{target}.", severity="error")
-                        except Exception:
-                            pass
-            except Exception as e:
-                try:
-                    self.app.notify(f"Error: {e}", severity="error")
-                except Exception:
-                    pass
-        elif btn_id == "message-user-btn":
+                    try:
+                        self.app.notify(f"Failed to unfollow @{target}.", severity="error")
+                    except Exception:
+                        pass
+            else:
+                ok = api.follow_user(target)
+                if ok:
+                    # Capture previous state to decide message intent
+                    previously_following = self.profile.get("is_following", False)
+                    button.label = "Unfollow"
+                    self.profile["is_following"] = True
+                    try:
+                        old = int(self.profile.get("followers", 0))
+                        self.profile["followers"] = old + 1
+                        self._update_followers_stat()
+                    except Exception:
+                        pass
+                    try:
+                        msg = f"Now following @{target}!" if not previously_following else f"You are already following @{target}."
+                        self.app.notify(msg, severity="success")
+                    except Exception:
+                        pass
+                else:
+                    try:
+                        self.app.notify(f"Failed to follow @{target}.", severity="error")
+                    except Exception:
+                        pass
+        except Exception as e:
             try:
-                self.app.action_open_dm(target)
+                self.app.notify(f"Error: {e}", severity="error")
             except Exception:
                 pass
 
+    def _message_user(self, button: Button, target: str) -> None:
+        try:
+            self.app.action_open_dm(target)
+        except Exception:
+            pass
+
+    # Button id -> handler, looked up once per press instead of an if/elif ladder
+    _button_handlers = {
+        "follow-user-btn": _toggle_follow,
+        "message-user-btn": _message_user,
+    }
+
+    def _update_followers_stat(self) -> None:
+        """Refresh the Followers stat from self.profile."""
+        try:
+            self.query_one("#profile-followers-stat", Static).update(
+                f"{self.profile['followers']}\nFollowers"
+            )
+        except Exception:
+            pass
+
     def _clear_tab_content(self):
         # Remove previously-mounted PostItem widgets from this ProfileView
         try:
@@ -6137,7 +6947,12 @@ class ProfileView(VerticalScroll):
             return None
 
     def on_scroll(self, event) -> None:
-        """Update scroll position reactive when scrolling"""
+        """Update scroll position reactive when scrolling (throttled)"""
+        if self._scroll_timer is None:
+            self._scroll_timer = self.set_timer(_SCROLL_COMMIT_DELAY, self._commit_scroll)
+
+    def _commit_scroll(self) -> None:
+        self._scroll_timer = None
         try:
             self.scroll_y = self.scroll_offset.y
         except Exception:
@@ -6145,6 +6960,9 @@ class ProfileView(VerticalScroll):
 
     def _check_scroll_load(self) -> None:
         """Check if we need to load more posts based on scroll position"""
+        # Nothing left to page in: skip the size math on every scroll tick
+        if self._loading_more or self._displayed_count >= len(self._all_posts):
+            return
         try:
             virtual_size = self.virtual_size.height
             container_size = self.container_size.height
@@ -6479,16 +7297,13 @@ class ProfileView(VerticalScroll):
     def key_g(self) -> None:
         if self.app.command_mode:
             return
-        now = time.time()
-        if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+        now = time.monotonic()
+        if now - self.last_g_time < 0.5:
             # go to top
             self.cursor_row = 0
             self.cursor_col = -1
             self._update_cursor()
-            try:
-                delattr(self, "last_g_time")
-            except Exception:
-                pass
+            self.last_g_time = 0.0
         else:
             self.last_g_time = now
 
@@ -6569,10 +7384,10 @@ class ProfileView(VerticalScroll):
                 self._displayed_count + self._batch_size, len(self._all_posts)
             )
 
-            for i in range(old_count, self._displayed_count):
-                post = self._all_posts[i]
-                post_item = PostItem(post, classes="post-item", id=f"post-{i}")
-                self.mount(post_item)
+            self.mount(*[
+                PostItem(self._all_posts[i], classes="post-item", id=f"post-{i}")
+                for i in range(old_count, self._displayed_count)
+            ])
         finally:
             self._loading_more = False
 
@@ -6581,14 +7396,12 @@ class ProfileView(VerticalScroll):
         if content is None:
             return
         if self.posts:
-            for post in self.posts:
-                content.mount(PostItem(post, classes="post-item"))
+            content.mount(*[PostItem(post, classes="post-item") for post in self.posts])
             return
         # Use explicit API method to fetch user posts
         try:
             posts = api.get_user_posts(self.profile.get("username"), limit=200)
-            for p in posts:
-                content.mount(PostItem(p, classes="post-item"))
+            content.mount(*[PostItem(p, classes="post-item") for p in posts])
             return
         except Exception:
             pass
@@ -6608,8 +7421,9 @@ class ProfileView(VerticalScroll):
     def _normalize_post_dict(self, p: dict) -> dict:
         # convert API dict to constructor kwargs expected by Post dataclass
         try:
-            converted = api._convert_post(p)
-            return converted
+            from dataclasses import asdict
+
+            return asdict(api._make_post(p))
         except Exception:
             # best-effort mapping
             return {
@@ -6625,6 +7439,7 @@ class ProfileView(VerticalScroll):
 
 class ProfilePanel(VerticalScroll):
     cursor_position = reactive(0)
+    last_g_time = 0.0
 
     def __init__(self, *children, username: str = "", **kwargs):
         super().__init__(*children, **kwargs)
@@ -6688,8 +7503,12 @@ class ProfilePanel(VerticalScroll):
                 return
 
         # Default: show the current user's profile
-        user = api.get_current_user()
-        settings = api.get_user_settings()
+        fetched = api.fetch_many({
+            "user": api.get_current_user,
+            "settings": api.get_user_settings,
+        })
+        user = fetched["user"]
+        settings = fetched["settings"]
 
         profile = {
             "username": getattr(user, "username", getattr(user, "handle", "")),
@@ -6842,8 +7661,8 @@ class ProfilePanel(VerticalScroll):
         """Handle gg at panel level by deferring to inner view's key_g."""
         if self.app.command_mode:
             return
-        now = time.time()
-        if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+        now = time.monotonic()
+        if now - self.last_g_time < 0.5:
             v = self._inner_view()
             if v and hasattr(v, "key_g"):
                 try:
@@ -6856,10 +7675,7 @@ class ProfilePanel(VerticalScroll):
                 self.scroll_home(animate=False)
             except Exception:
                 pass
-            try:
-                delattr(self, "last_g_time")
-            except Exception:
-                pass
+            self.last_g_time = 0.0
         else:
             self.last_g_time = now
 
@@ -6946,21 +7762,21 @@ class ProfilePanel(VerticalScroll):
             return
 
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
                 v = self._inner_view()
                 if v and hasattr(v, "key_g"):
                     try:
                         v.key_g()
                         event.prevent_default()
-                        delattr(self, "last_g_time")
+                        self.last_g_time = 0.0
                         return
                     except Exception:
                         pass
                 try:
                     self.scroll_home(animate=False)
                     event.prevent_default()
-                    delattr(self, "last_g_time")
+                    self.last_g_time = 0.0
                 except Exception:
                     pass
             else:
@@ -6981,6 +7797,7 @@ class DraftsPanel(VerticalScroll):
 
     cursor_position = reactive(0)
     selected_action = reactive("open")  # "open" or "delete"
+    last_g_time = 0.0
 
     def compose(self) -> ComposeResult:
         self.border_title = "Drafts"
@@ -7179,11 +7996,11 @@ class DraftsPanel(VerticalScroll):
                 pass
             return
         if event.key == "g":
-            now = time.time()
-            if hasattr(self, "last_g_time") and now - self.last_g_time < 0.5:
+            now = time.monotonic()
+            if now - self.last_g_time < 0.5:
                 self.cursor_position = 0
                 event.prevent_default()
-                delattr(self, "last_g_time")
+                self.last_g_time = 0.0
             else:
                 self.last_g_time = now
 
@@ -7407,6 +8224,8 @@ class TuitterApp(App):
             credentials: Optional dict with 'username' and 'tokens' from authenticate().
                         If not provided, will read from disk (slower, may have timing issues).
         """
+        # A fresh sign-in may have stored a different username
+        get_username.cache_clear()
         try:
             # Use provided credentials or load from disk
             username = "yourname"
@@ -7489,6 +8308,7 @@ class TuitterApp(App):
             # Clear API state
             api.session.headers.pop("Authorization", None)
             api.handle = "yourname"
+            get_username.cache_clear()
 
             # Switch to the auth mode
             self.switch_mode("auth")
@@ -7529,6 +8349,7 @@ class TuitterApp(App):
         NOTE: We don't call show_main_app() here anymore because the worker thread
         handles it directly with the correct credentials to avoid race conditions.
         """
+        get_username.cache_clear()
         try:
             # Resolve username once (prefer the message payload, then keyring, then a default)
             username = (
@@ -7539,7 +8360,7 @@ class TuitterApp(App):
             # If header exists, update it
             try:
                 hdr = self.screen.query_one("#app-header", Static)
-                hdr.update(f"tuitter [timeline] @{username}")
+                hdr.update(_header_text("timeline", username))
             except Exception:
                 pass
             # NOTE: Don't call show_main_app() here - the worker thread already did it with credentials
@@ -7832,7 +8653,7 @@ class TuitterApp(App):
                     elif screen_name == "messages" and "username" in kwargs:
                         header.update(f"tuitter [dm:@{kwargs['username']}] @{username}")
                     else:
-                        header.update(f"tuitter [{screen_name}] @{username}")
+                        header.update(_header_text(screen_name, username))
                 except Exception:
                     pass
 
@@ -8233,7 +9054,10 @@ class TuitterApp(App):
                 def check_refresh(result):
                     if result:
                         # Post was published, delete the draft
-                        delete_draft(draft_index)
+                        try:
+                            delete_draft(draft_index)
+                        except Exception as e:
+                            self.notify(f"Failed to delete draft: {e}", severity="error")
                         try:
                             if hasattr(self, "refresh_drafts_store"):
                                 self.refresh_drafts_store()